@@ -1,5 +1,7 @@
 from .common import Common
 from .composite import MultiBlock
+from .filter_cache import FilterCache, get_filter_cache, set_filter_cache
 from .filters import CompositeFilters, DataSetFilters
 from .grid import Grid, RectilinearGrid, UniformGrid
+from .pipeline import Pipeline, PipelineStage
 from .pointset import PointGrid, PolyData, StructuredGrid, UnstructuredGrid
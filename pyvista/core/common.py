@@ -2,8 +2,10 @@
 Attributes common to PolyData and Grid Objects
 """
 import collections
+import contextlib
 import logging
 import warnings
+import weakref
 from weakref import proxy
 
 import numpy as np
@@ -16,6 +18,8 @@ from pyvista.utilities import (CELL_DATA_FIELD, FIELD_DATA_FIELD,
                                is_pyvista_obj, parse_field_choice,
                                raise_not_matching, vtk_bit_array_to_char)
 
+from .copy_on_write import detach_shared, is_shared, share_arrays
+from .derived_cache import get_derived_cache
 from .filters import DataSetFilters
 
 log = logging.getLogger(__name__)
@@ -24,6 +28,27 @@ log.setLevel('CRITICAL')
 # vector array names
 DEFAULT_VECTOR_KEY = '_vectors'
 
+# batches of notifications of individual arrays keyed by their address
+_ARRAY_BATCHES = {}
+
+
+class _ModifiedBatch(object):
+    """Defers the ``Modified()`` calls on VTK objects to the end of a batch,
+    calling it once per object.
+    """
+
+    def __init__(self):
+        self.depth = 0
+        self.pending = collections.OrderedDict()
+
+    def add(self, vtkobj):
+        self.pending[vtkobj.GetAddressAsString('vtkObject')] = vtkobj
+
+    def flush(self):
+        pending, self.pending = self.pending, collections.OrderedDict()
+        for vtkobj in pending.values():
+            vtkobj.Modified()
+
 
 class Common(DataSetFilters, object):
     """ Methods in common to grid and surface objects"""
@@ -127,19 +152,22 @@ class Common(DataSetFilters, object):
     @property
     def points(self):
         """ returns a pointer to the points as a numpy object """
+        self.apply_pending_transform()
         vtk_data = self.GetPoints().GetData()
         arr = vtk_to_numpy(vtk_data)
-        return pyvista_ndarray(arr, vtk_data)
+        return pyvista_ndarray(arr, vtk_data, self)
 
     @points.setter
     def points(self, points):
         """ set points without copying """
         if not isinstance(points, np.ndarray):
             raise TypeError('Points must be a numpy array')
+        # the new points replace any lazy transformation of the old ones
+        self._pending_transform = None
         vtk_points = pyvista.vtk_points(points, False)
         self.SetPoints(vtk_points)
-        self.GetPoints().Modified()
-        self.Modified()
+        self._notify_modified(self.GetPoints())
+        self._notify_modified(self)
 
     @property
     def arrows(self):
@@ -339,7 +367,7 @@ class Common(DataSetFilters, object):
         array = convert_array(vtkarr)
         if array.dtype == np.uint8 and name in self._point_bool_array_names:
             array = array.view(np.bool)
-        return array
+        return pyvista_ndarray(array, vtkarr, self)
 
     def _add_point_scalar(self, scalars, name, set_active=False, deep=True):
         """
@@ -423,7 +451,7 @@ class Common(DataSetFilters, object):
         array = convert_array(vtkarr)
         if array.dtype == np.uint8 and name in self._field_bool_array_names:
             array = array.view(np.bool)
-        return array
+        return pyvista_ndarray(array, vtkarr, self)
 
     def _add_field_scalar(self, scalars, name, deep=True):
         """
@@ -476,7 +504,7 @@ class Common(DataSetFilters, object):
             Angle in degrees to rotate about the x-axis.
 
         """
-        axis_rotation(self.points, angle, inplace=True, axis='x')
+        self.transform(pyvista.axis_rotation_matrix(angle, axis='x'))
 
     def rotate_y(self, angle):
         """
@@ -488,7 +516,7 @@ class Common(DataSetFilters, object):
             Angle in degrees to rotate about the y-axis.
 
         """
-        axis_rotation(self.points, angle, inplace=True, axis='y')
+        self.transform(pyvista.axis_rotation_matrix(angle, axis='y'))
 
     def rotate_z(self, angle):
         """
@@ -500,7 +528,7 @@ class Common(DataSetFilters, object):
             Angle in degrees to rotate about the z-axis.
 
         """
-        axis_rotation(self.points, angle, inplace=True, axis='z')
+        self.transform(pyvista.axis_rotation_matrix(angle, axis='z'))
 
     def translate(self, xyz):
         """
@@ -512,40 +540,105 @@ class Common(DataSetFilters, object):
             Length 3 list or array.
 
         """
-        self.points += np.asarray(xyz)
+        t = np.eye(4)
+        t[:3, 3] = xyz
+        self.transform(t)
 
-    def transform(self, trans):
+    def transform(self, trans, transform_vectors=False, lazy=False):
         """
         Compute a transformation in place using a 4x4 transform.
 
+        The points are transformed with a single matrix product per chunk
+        of points in their own precision.
+
         Parameters
         ----------
         trans : vtk.vtkMatrix4x4, vtk.vtkTransform, or np.ndarray
             Accepts a vtk transformation object or a 4x4 transformation matrix.
 
-        """
-        if isinstance(trans, vtk.vtkMatrix4x4):
-            t = pyvista.trans_from_matrix(trans)
-        elif isinstance(trans, vtk.vtkTransform):
-            t = pyvista.trans_from_matrix(trans.GetMatrix())
-        elif isinstance(trans, np.ndarray):
-            if trans.shape[0] != 4 or trans.shape[1] != 4:
-                raise Exception('Transformation array must be 4x4')
-            t = trans
-        else:
-            raise TypeError('Input transform must be either:\n'
-                            + '\tvtk.vtkMatrix4x4\n'
-                            + '\tvtk.vtkTransform\n'
-                            + '\t4x4 np.ndarray\n')
-
-        x = (self.points*t[0, :3]).sum(1) + t[0, -1]
-        y = (self.points*t[1, :3]).sum(1) + t[1, -1]
-        z = (self.points*t[2, :3]).sum(1) + t[2, -1]
+        transform_vectors : bool, optional
+            Also transform the active point and cell vectors and normals,
+            as done by ``vtkTransformFilter``.  Default False.
+
+        lazy : bool, optional
+            Store the transformation and only apply it when the points,
+            bounds, a derived quantity or a copy of the mesh are accessed,
+            when a filter of the mesh is run, when it is saved or added to
+            a plotter.  Consecutive lazy transformations are composed and
+            applied at once.  The transformation is discarded when the
+            geometry of the mesh is replaced, e.g. by setting its points
+            or by ``ShallowCopy`` and ``DeepCopy``.  VTK algorithms given
+            the mesh directly see the untransformed points until
+            :func:`apply_pending_transform` is called.
 
-        # overwrite points
-        self.points[:, 0] = x
-        self.points[:, 1] = y
-        self.points[:, 2] = z
+        """
+        t = pyvista.transformation_matrix(trans)
+        pending = self._get_pending_transform()
+        if pending is not None and pending[1] != transform_vectors:
+            self.apply_pending_transform()
+            pending = None
+        if lazy:
+            if pending is not None:
+                t = np.dot(t, pending[0])
+            self._pending_transform = (t, transform_vectors, self._geometry_key())
+            return
+        self.apply_pending_transform()
+        self._apply_transform(t, transform_vectors)
+
+    def apply_pending_transform(self):
+        """Apply the transformations stored with ``transform(..., lazy=True)``"""
+        pending = self._get_pending_transform()
+        self._pending_transform = None
+        if pending is not None:
+            self._apply_transform(*pending[:2])
+
+    def _get_pending_transform(self):
+        """Return the lazy transformation of this mesh, or None when there
+        is none or the geometry it was stored for has been replaced.
+        """
+        pending = getattr(self, '_pending_transform', None)
+        if pending is not None and pending[2] != self._geometry_key():
+            self._pending_transform = pending = None
+        return pending
+
+    def _geometry_key(self):
+        """Identify the geometry of this mesh, which changes when it is
+        replaced rather than modified in place.
+        """
+        vtk_points = self.GetPoints()
+        if vtk_points is None:
+            return None
+        return vtk_points.GetAddressAsString('vtkPoints')
+
+    def _apply_transform(self, t, transform_vectors):
+        """Transform the points and optionally the vectors in place"""
+        vtk_points = self.GetPoints()
+        if vtk_points is not None:
+            points = vtk_to_numpy(vtk_points.GetData())
+            if points.dtype not in (np.float32, np.float64):
+                self.points = points.astype(np.float64)
+                vtk_points = self.GetPoints()
+                points = vtk_to_numpy(vtk_points.GetData())
+            detach_shared(self, vtk_points.GetData())
+            pyvista.apply_transformation_to_points(t, points, inplace=True)
+            vtk_points.Modified()
+            self.Modified()
+        if transform_vectors:
+            self._transform_vectors(t)
+
+    def _transform_vectors(self, t):
+        """Transform the active vectors and normals in place"""
+        for data in (self.GetPointData(), self.GetCellData()):
+            for vtkarr, normals in ((data.GetVectors(), False),
+                                    (data.GetNormals(), True)):
+                if vtkarr is None or vtkarr.GetNumberOfComponents() != 3:
+                    continue
+                arr = vtk_to_numpy(vtkarr)
+                if arr.dtype not in (np.float32, np.float64):
+                    continue
+                detach_shared(self, vtkarr)
+                pyvista.apply_transformation_to_vectors(t, arr, normals=normals)
+                vtkarr.Modified()
 
     def _cell_scalar(self, name=None):
         """
@@ -581,7 +674,7 @@ class Common(DataSetFilters, object):
         array = convert_array(vtkarr)
         if array.dtype == np.uint8 and name in self._cell_bool_array_names:
             array = array.view(np.bool)
-        return array
+        return pyvista_ndarray(array, vtkarr, self)
 
     def _add_cell_scalar(self, scalars, name, set_active=False, deep=True):
         """
@@ -633,7 +726,7 @@ class Common(DataSetFilters, object):
         if hasattr(ido, '_textures'):
             self._textures = ido._textures
 
-    def copy(self, deep=True):
+    def copy(self, deep=True, copy_on_write=False):
         """
         Returns a copy of the object
 
@@ -642,17 +735,33 @@ class Common(DataSetFilters, object):
         deep : bool, optional
             When True makes a full copy of the object.
 
+        copy_on_write : bool, optional
+            Share the arrays with the copy and only copy an array when
+            either mesh writes to it through PyVista: item assignment or
+            in-place operators on its arrays, or an in-place
+            transformation.  Overrides ``deep``.
+
         Returns
         -------
         newobject : same as input
            Deep or shallow copy of the input.
+
+        Notes
+        -----
+        Arrays fetched from either mesh before a copy-on-write copy still
+        share their memory with the other mesh once one mesh wrote to
+        them.
+
         """
+        self.apply_pending_transform()
         thistype = type(self)
         newobject = thistype()
-        if deep:
+        if deep and not copy_on_write:
             newobject.DeepCopy(self)
         else:
             newobject.ShallowCopy(self)
+        if copy_on_write:
+            share_arrays(self, newobject)
         newobject.copy_meta_from(self)
         return newobject
 
@@ -798,16 +907,19 @@ class Common(DataSetFilters, object):
         bounding box of this dataset in the form
         (xmin,xmax, ymin,ymax, zmin,zmax)
         """
+        self.apply_pending_transform()
         return list(self.GetBounds())
 
     @property
     def length(self):
         """the length of the diagonal of the bounding box"""
+        self.apply_pending_transform()
         return self.GetLength()
 
     @property
     def center(self):
         """ Center of the bounding box """
+        self.apply_pending_transform()
         return list(self.GetCenter())
 
     @property
@@ -827,8 +939,27 @@ class Common(DataSetFilters, object):
             Total volume of the mesh.
 
         """
-        sizes = self.compute_cell_sizes(length=False, area=False, volume=True)
-        return np.sum(sizes.cell_arrays['Volume'])
+        def compute():
+            sizes = self.compute_cell_sizes(length=False, area=False, volume=True)
+            return np.sum(sizes.cell_arrays['Volume'])
+        return self._get_derived('volume', compute)
+
+    @property
+    def derived_cache(self):
+        """Cache of the quantities derived from the geometry of this
+        dataset, like its volume or normals.
+
+        The cache is emptied when the points or cells are modified and
+        can be cleared explicitly with ``derived_cache.clear()``.
+        """
+        return get_derived_cache(self)
+
+    def _get_derived(self, key, compute):
+        """Return the quantity ``key`` from the derived cache, calling
+        ``compute`` when it is missing or stale.
+        """
+        self.apply_pending_transform()
+        return get_derived_cache(self).get(self, key, compute)
 
     def get_data_range(self, arr=None, preference='cell'):
         """Get the non-NaN min and max of a named scalar array
@@ -1037,17 +1168,72 @@ class Common(DataSetFilters, object):
         """Object string representation"""
         return self.head(display=False, html=False)
 
+    @contextlib.contextmanager
+    def batch_modify(self):
+        """Context manager deferring the modification notifications of
+        this mesh to its exit.
+
+        Writes to the arrays of the mesh and to its array dictionaries
+        normally call ``Modified()`` each time, which makes pipelines and
+        plotters update after every write.  Within this context, each
+        modified VTK object is only notified once, at exit.  Batches can
+        be nested.
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> mesh = pyvista.Sphere()
+        >>> points = mesh.points
+        >>> with mesh.batch_modify():
+        ...     for i in range(3):
+        ...         points[:, i] *= 2
+
+        """
+        batch = getattr(self, '_modified_batch', None)
+        if batch is None:
+            batch = self._modified_batch = _ModifiedBatch()
+        batch.depth += 1
+        try:
+            yield self
+        finally:
+            batch.depth -= 1
+            if not batch.depth:
+                self._modified_batch = None
+                batch.flush()
+
+    def _notify_modified(self, vtkobj):
+        """Call ``vtkobj.Modified()`` unless a batch defers it"""
+        batch = getattr(self, '_modified_batch', None)
+        if batch is not None:
+            batch.add(vtkobj)
+        else:
+            vtkobj.Modified()
+
     def overwrite(self, mesh):
         """
         Overwrites this mesh inplace with the new mesh's geometries and data
 
+        The arrays of ``mesh`` are adopted rather than copied.  They are
+        copied on write while ``mesh`` is still referenced elsewhere, but
+        only for writes made through the arrays of a pyvista mesh.  Writes
+        made directly through VTK to a ``mesh`` that is not wrapped, such
+        as ``mesh.GetPoints().SetPoint(0, ...)``, also change this mesh.
+        Inplace filters overwrite the dataset with their output this way.
+
         Parameters
         ----------
         mesh : vtk.vtkDataSet
             The overwriting mesh.
 
         """
-        self.DeepCopy(mesh)
+        if hasattr(mesh, 'apply_pending_transform'):
+            mesh.apply_pending_transform()
+        # the geometry replaces any lazy transformation of this mesh
+        self._pending_transform = None
+        self.ShallowCopy(mesh)
+        for cached in ('_point_arrays', '_cell_arrays', '_field_arrays'):
+            self.__dict__.pop(cached, None)
+        share_arrays(self, mesh)
         if is_pyvista_obj(mesh):
             self.copy_meta_from(mesh)
 
@@ -1055,6 +1241,7 @@ class Common(DataSetFilters, object):
         """Get a new representation of this object as an
         :class:`pyvista.UnstructuredGrid`
         """
+        self.apply_pending_transform()
         alg = vtk.vtkAppendFilter()
         alg.AddInputData(self)
         alg.Update()
@@ -1120,6 +1307,9 @@ class _ScalarsDict(dict):
     def __setitem__(self, key, val):
         """ overridden to assure data is contigious """
         if self.callback_enabled:
+            if isinstance(val, pyvista_ndarray) and val.is_shared:
+                # the array would alias the copy-on-write arrays
+                val = np.array(val)
             self.adder(val, key, deep=False)
         dict.__setitem__(self, key, val)
         self.modifier()
@@ -1139,7 +1329,7 @@ class CellScalarsDict(_ScalarsDict):
     def __init__(self, data):
         _ScalarsDict.__init__(self, data)
         self.remover = lambda key: self.data._remove_array(CELL_DATA_FIELD, key)
-        self.modifier = lambda *args: self.data.GetCellData().Modified()
+        self.modifier = lambda *args: self.data._notify_modified(self.data.GetCellData())
 
     def adder(self, scalars, name, set_active=False, deep=True):
         self.data._add_cell_scalar(scalars, name, set_active=False, deep=deep)
@@ -1154,7 +1344,7 @@ class PointScalarsDict(_ScalarsDict):
     def __init__(self, data):
         _ScalarsDict.__init__(self, data)
         self.remover = lambda key: self.data._remove_array(POINT_DATA_FIELD, key)
-        self.modifier = lambda *args: self.data.GetPointData().Modified()
+        self.modifier = lambda *args: self.data._notify_modified(self.data.GetPointData())
 
     def adder(self, scalars, name, set_active=False, deep=True):
         self.data._add_point_scalar(scalars, name, set_active=False, deep=deep)
@@ -1168,7 +1358,7 @@ class FieldScalarsDict(_ScalarsDict):
     def __init__(self, data):
         _ScalarsDict.__init__(self, data)
         self.remover = lambda key: self.data._remove_array(FIELD_DATA_FIELD, key)
-        self.modifier = lambda *args: self.data.GetFieldData().Modified()
+        self.modifier = lambda *args: self.data._notify_modified(self.data.GetFieldData())
 
     def adder(self, scalars, name, set_active=False, deep=True):
         self.data._add_field_scalar(scalars, name, deep=deep)
@@ -1176,36 +1366,8 @@ class FieldScalarsDict(_ScalarsDict):
 
 def axis_rotation(points, angle, inplace=False, deg=True, axis='z'):
     """ Rotates points angle ang (in deg) about an axis """
-    axis = axis.lower()
-
-    # Copy original array to if not inplace
-    if not inplace:
-        points = points.copy()
-
-    # Convert angle to radians
-    if deg:
-        angle *= np.pi / 180
-
-    if axis == 'x':
-        y = points[:, 1] * np.cos(angle) - points[:, 2] * np.sin(angle)
-        z = points[:, 1] * np.sin(angle) + points[:, 2] * np.cos(angle)
-        points[:, 1] = y
-        points[:, 2] = z
-    elif axis == 'y':
-        x = points[:, 0] * np.cos(angle) + points[:, 2] * np.sin(angle)
-        z = - points[:, 0] * np.sin(angle) + points[:, 2] * np.cos(angle)
-        points[:, 0] = x
-        points[:, 2] = z
-    elif axis == 'z':
-        x = points[:, 0] * np.cos(angle) - points[:, 1] * np.sin(angle)
-        y = points[:, 0] * np.sin(angle) + points[:, 1] * np.cos(angle)
-        points[:, 0] = x
-        points[:, 1] = y
-    else:
-        raise Exception('invalid axis.  Must be either "x", "y", or "z"')
-
-    if not inplace:
-        return points
+    t = pyvista.axis_rotation_matrix(angle, axis=axis, deg=deg)
+    return pyvista.apply_transformation_to_points(t, points, inplace=inplace)
 
 
 class pyvista_ndarray(np.ndarray):
@@ -1218,15 +1380,91 @@ class pyvista_ndarray(np.ndarray):
 
     """
 
-    def __new__(cls, input_array, proxy):
+    def __new__(cls, input_array, proxy=None, dataset=None):
         obj = np.asarray(input_array).view(cls)
-        cls.proxy = proxy
+        obj.proxy = proxy
+        obj._dataset = weakref.ref(dataset) if dataset is not None else None
         return obj
 
     def __array_finalize__(self, obj):
         if obj is None: return
+        # only views of the vtk array are linked to it
+        if isinstance(obj, pyvista_ndarray) and np.may_share_memory(self, obj):
+            self.proxy = obj.proxy
+            self._dataset = obj._dataset
+        else:
+            self.proxy = None
+            self._dataset = None
+
+    @property
+    def is_shared(self):
+        """True when the array belongs to a mesh sharing its arrays with
+        copy-on-write copies"""
+        dataset = self._dataset() if self._dataset is not None else None
+        return dataset is not None and is_shared(dataset)
+
+    def _prepare_write(self):
+        """Copy the vtk array to the other meshes sharing it"""
+        if self._dataset is not None:
+            dataset = self._dataset()
+            if dataset is not None:
+                detach_shared(dataset, self.proxy)
+
+    def _modified(self):
+        if self.proxy is None:
+            return
+        dataset = self._dataset() if self._dataset is not None else None
+        batch = getattr(dataset, '_modified_batch', None)
+        if batch is None and _ARRAY_BATCHES:
+            batch = _ARRAY_BATCHES.get(self.proxy.GetAddressAsString('vtkObject'))
+        if batch is not None:
+            batch.add(self.proxy)
+        else:
+            self.proxy.Modified()
+
+    @contextlib.contextmanager
+    def batch_modify(self):
+        """Context manager deferring the ``Modified()`` calls of writes to
+        this array, and to any view of it, to a single call at exit.
+        """
+        if self.proxy is None:
+            yield self
+            return
+        address = self.proxy.GetAddressAsString('vtkObject')
+        batch = _ARRAY_BATCHES.get(address)
+        if batch is None:
+            batch = _ARRAY_BATCHES[address] = _ModifiedBatch()
+        batch.depth += 1
+        try:
+            yield self
+        finally:
+            batch.depth -= 1
+            if not batch.depth:
+                del _ARRAY_BATCHES[address]
+                batch.flush()
 
     def __setitem__(self, coords, value):
         """ Update the array and update the vtk object """
+        self._prepare_write()
         super(pyvista_ndarray, self).__setitem__(coords, value)
-        self.proxy.Modified()
+        self._modified()
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        """Handle in-place operations like item assignment"""
+        outputs = kwargs.get('out', ())
+        written = [out for out in outputs if isinstance(out, pyvista_ndarray)]
+        if method == 'at' and isinstance(inputs[0], pyvista_ndarray):
+            written.append(inputs[0])
+        for out in written:
+            out._prepare_write()
+        inputs = tuple(x.view(np.ndarray) if isinstance(x, pyvista_ndarray) else x
+                       for x in inputs)
+        if outputs:
+            kwargs['out'] = tuple(x.view(np.ndarray) if isinstance(x, pyvista_ndarray)
+                                  else x for x in outputs)
+        result = getattr(ufunc, method)(*inputs, **kwargs)
+        for out in written:
+            out._modified()
+        if outputs:
+            return outputs[0] if len(outputs) == 1 else outputs
+        return result
@@ -15,12 +15,36 @@ import pyvista
 from pyvista import plot
 from pyvista.utilities import get_scalar, is_pyvista_obj, wrap
 
-from .filters import CompositeFilters
+from .filters import CompositeFilters, _apply_pending
 
 log = logging.getLogger(__name__)
 log.setLevel('CRITICAL')
 
 
+def _array_range(dataset, name):
+    """Return the range of an array of a dataset, searching the cell,
+    point and field data in the order of ``get_scalar``.
+    """
+    for data in (dataset.GetCellData(), dataset.GetPointData(),
+                 dataset.GetFieldData()):
+        vtkarr = data.GetArray(name)
+        if vtkarr is not None:
+            return _vtk_array_range(vtkarr)
+    return np.inf, -np.inf
+
+
+def _vtk_array_range(vtkarr):
+    """Return the range of all the components of a ``vtkDataArray``, which
+    VTK caches until the array is modified.
+    """
+    ranges = np.array([vtkarr.GetRange(i) for i in
+                       range(vtkarr.GetNumberOfComponents())])
+    if vtkarr.GetNumberOfTuples() < 1 or ranges[:, 0].min() > ranges[:, 1].max():
+        # empty or only NaN
+        return np.inf, -np.inf
+    return ranges[:, 0].min(), ranges[:, 1].max()
+
+
 class MultiBlock(vtkMultiBlockDataSet, CompositeFilters):
     """
     A composite class to hold many data sets which can be iterated over.
@@ -34,7 +58,17 @@ class MultiBlock(vtkMultiBlockDataSet, CompositeFilters):
     def __init__(self, *args, **kwargs):
         super(MultiBlock, self).__init__()
         deep = kwargs.pop('deep', False)
+        # references to the wrapped blocks and the ids of these blocks
         self.refs = []
+        self._ref_ids = set()
+        # block names and the index of the first block of each name, in
+        # sync with the dataset as of ``_names_mtime``
+        self._names = []
+        self._name_index = {}
+        self._names_mtime = None
+        # ``(loader, summary)`` of the blocks that are only created upon
+        # access, the summary holding their type, bounds and sizes
+        self._lazy_blocks = {}
 
         if len(args) == 1:
             if isinstance(args[0], vtk.vtkMultiBlockDataSet):
@@ -54,7 +88,7 @@ class MultiBlock(vtkMultiBlockDataSet, CompositeFilters):
                     idx += 1
 
             # keep a reference of the args
-            self.refs.append(args)
+            self._add_ref(args)
 
         # Upon creation make sure all nested structures are wrapped
         self.wrap_nested()
@@ -116,6 +150,8 @@ class MultiBlock(vtkMultiBlockDataSet, CompositeFilters):
         Binary files write much faster than ASCII and have a smaller
         file size.
         """
+        self._load_lazy_blocks()
+        _apply_pending(self)
         filename = os.path.abspath(os.path.expanduser(filename))
         ext = pyvista.get_ext(filename)
         if ext in ['.vtm', '.vtmb']:
@@ -136,28 +172,20 @@ class MultiBlock(vtkMultiBlockDataSet, CompositeFilters):
     def bounds(self):
         """Finds min/max for bounds across blocks
 
+        The bounds of all the nested blocks are combined by VTK, which
+        reuses the bounds each dataset caches until it is modified.
+        Blocks that have not been built yet contribute their known bounds.
+
         Returns:
             tuple(float):
                 length 6 tuple of floats containing min/max along each axis
         """
         bounds = [np.inf,-np.inf, np.inf,-np.inf, np.inf,-np.inf]
-
-        def update_bounds(ax, nb, bounds):
-            """internal helper to update bounds while keeping track"""
-            if nb[2*ax] < bounds[2*ax]:
-                bounds[2*ax] = nb[2*ax]
-            if nb[2*ax+1] > bounds[2*ax+1]:
-                bounds[2*ax+1] = nb[2*ax+1]
-            return bounds
-
-        # get bounds for each block and update
-        for i in range(self.n_blocks):
-            if self[i] is None:
-                continue
-            bnds = self[i].bounds
-            for a in range(3):
-                bounds = update_bounds(a, bnds, bounds)
-
+        if self.GetNumberOfPoints() > 0:
+            self.GetBounds(bounds)
+        for _, summary in self._lazy_blocks.values():
+            bounds[::2] = np.minimum(bounds[::2], summary['bounds'][::2]).tolist()
+            bounds[1::2] = np.maximum(bounds[1::2], summary['bounds'][1::2]).tolist()
         return bounds
 
 
@@ -186,6 +214,20 @@ class MultiBlock(vtkMultiBlockDataSet, CompositeFilters):
         self.Modified()
 
 
+    @property
+    def n_points(self):
+        """The total number of points of all the nested blocks"""
+        return self.GetNumberOfPoints() + sum(summary['n_points'] for _, summary
+                                              in self._lazy_blocks.values())
+
+
+    @property
+    def n_cells(self):
+        """The total number of cells of all the nested blocks"""
+        return self.GetNumberOfCells() + sum(summary['n_cells'] for _, summary
+                                             in self._lazy_blocks.values())
+
+
     @property
     def volume(self):
         """
@@ -198,25 +240,132 @@ class MultiBlock(vtkMultiBlockDataSet, CompositeFilters):
 
         """
         volume = 0.0
-        for block in self:
-            if block is None:
-                continue
+        for _, _, _, block in self.leaves(wrap_blocks=True):
             volume += block.volume
         return volume
 
 
+    def leaves(self, wrap_blocks=False, skip_empty=True):
+        """Iterate over the datasets of all the nested blocks.
+
+        The tree is traversed depth first by a ``vtkDataObjectTreeIterator``
+        and no state is stored on the ``MultiBlock``, so traversals can
+        be nested.
+
+        Parameters
+        ----------
+        wrap_blocks : bool, optional
+            Yield the leaves wrapped as PyVista datasets.  By default the
+            VTK objects are yielded as they are stored.
+
+        skip_empty : bool, optional
+            Skip the blocks that are ``None``.
+
+        Yields
+        ------
+        flat_index : int
+            Index of the leaf in the depth first order used by VTK, which
+            counts the nested ``MultiBlock`` datasets.
+
+        path : tuple(int)
+            Block index of the leaf in each nested level.
+
+        name : str
+            Name of the leaf given by its parent, or ``None``.
+
+        dataset : vtk.vtkDataObject
+            The leaf.
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> multi = pyvista.MultiBlock([pyvista.Sphere(),
+        ...                             pyvista.MultiBlock([pyvista.Cube()])])
+        >>> [path for _, path, _, _ in multi.leaves()]
+        [(0,), (1, 0)]
+
+        """
+        self._load_lazy_blocks()
+        name_key = vtk.vtkCompositeDataSet.NAME()
+        iterator = self.NewTreeIterator()
+        iterator.VisitOnlyLeavesOff()
+        iterator.SkipEmptyNodesOff()
+        iterator.TraverseSubTreeOn()
+        iterator.InitTraversal()
+        # the path of each nested level, its number of children and the
+        # index of the next child to be visited
+        stack = [((), self.GetNumberOfBlocks(), 0)]
+        while not iterator.IsDoneWithTraversal():
+            while stack[-1][2] >= stack[-1][1]:
+                stack.pop()
+            parent, n_children, child = stack.pop()
+            stack.append((parent, n_children, child + 1))
+            path = parent + (child, )
+            data = iterator.GetCurrentDataObject()
+            if isinstance(data, vtk.vtkMultiBlockDataSet):
+                stack.append((path, data.GetNumberOfBlocks(), 0))
+            elif isinstance(data, vtk.vtkMultiPieceDataSet):
+                stack.append((path, data.GetNumberOfPieces(), 0))
+            elif data is not None or not skip_empty:
+                name = None
+                if iterator.HasCurrentMetaData():
+                    name = iterator.GetCurrentMetaData().Get(name_key)
+                if wrap_blocks and data is not None and not is_pyvista_obj(data):
+                    data = wrap(data)
+                yield iterator.GetCurrentFlatIndex(), path, name, data
+            iterator.GoToNextItem()
+
+
+    def get_data_ranges(self, names=None):
+        """Gets the min/max of the arrays across all blocks.
+
+        Parameters
+        ----------
+        names : list(str), optional
+            Names of the arrays.  Defaults to every numeric point, cell
+            and field array of the leaves.
+
+        Returns
+        -------
+        ranges : dict
+            ``(min, max)`` of each array over all its components.  Arrays
+            that are empty or only hold NaN have a range of
+            ``(inf, -inf)``.
+
+        """
+        ranges = {}
+        if names is not None:
+            ranges = {name: (np.inf, -np.inf) for name in names}
+        for _, _, _, block in self.leaves():
+            if not isinstance(block, vtk.vtkDataSet):
+                continue
+            for data in (block.GetCellData(), block.GetPointData(),
+                         block.GetFieldData()):
+                for i in range(data.GetNumberOfArrays()):
+                    vtkarr = data.GetArray(i)
+                    if vtkarr is None:
+                        # not a numeric array
+                        continue
+                    name = vtkarr.GetName()
+                    if names is not None and name not in ranges:
+                        continue
+                    tmi, tma = _vtk_array_range(vtkarr)
+                    mini, maxi = ranges.get(name, (np.inf, -np.inf))
+                    ranges[name] = (min(mini, tmi), max(maxi, tma))
+        return ranges
+
+
     def get_data_range(self, name):
-        """Gets the min/max of a scalar given its name across all blocks"""
+        """Gets the min/max of a scalar given its name across all blocks.
+
+        The range of each array is cached by VTK until the array is
+        modified, so repeated calls only visit the blocks.
+        """
         mini, maxi = np.inf, -np.inf
-        for i in range(self.n_blocks):
-            data = self[i]
-            if data is None:
-                continue
-            # get the scalar if availble
-            arr = get_scalar(data, name)
-            if arr is None:
+        for _, _, _, data in self.leaves():
+            if not isinstance(data, vtk.vtkDataSet):
                 continue
-            tmi, tma = np.nanmin(arr), np.nanmax(arr)
+            tmi, tma = _array_range(data, name)
             if tmi < mini:
                 mini = tmi
             if tma > maxi:
@@ -224,12 +373,25 @@ class MultiBlock(vtkMultiBlockDataSet, CompositeFilters):
         return mini, maxi
 
 
+    def _update_names(self):
+        """Rebuild the block names and the name index if the dataset was
+        modified other than through this class.
+        """
+        if self._names_mtime != self.GetMTime():
+            self._names = [self.get_block_name(i) for i in range(self.n_blocks)]
+            self._name_index = {}
+            for i, name in enumerate(self._names):
+                self._name_index.setdefault(name, i)
+            self._names_mtime = self.GetMTime()
+
+
     def get_index_by_name(self, name):
         """Find the index number by block name"""
-        for i in range(self.n_blocks):
-            if self.get_block_name(i) == name:
-                return i
-        raise KeyError('Block name ({}) not found'.format(name))
+        self._update_names()
+        try:
+            return self._name_index[name]
+        except KeyError:
+            raise KeyError('Block name ({}) not found'.format(name))
 
 
     def __getitem__(self, index):
@@ -242,12 +404,15 @@ class MultiBlock(vtkMultiBlockDataSet, CompositeFilters):
         if index < 0 or index >= self.n_blocks:
             raise IndexError('index ({}) out of range for this dataset.'.format(index))
         data = self.GetBlock(index)
+        if data is None and index in self._lazy_blocks:
+            loader, _ = self._lazy_blocks.pop(index)
+            data = loader()
+            self.SetBlock(index, data)
         if data is None:
             return data
         if data is not None and not is_pyvista_obj(data):
             data = wrap(data)
-        if data not in self.refs:
-            self.refs.append(data)
+        self._add_ref(data)
         return data
 
 
@@ -255,7 +420,12 @@ class MultiBlock(vtkMultiBlockDataSet, CompositeFilters):
         """Add a data set to the next block index"""
         index = self.n_blocks # note off by one so use as index
         self[index] = data
-        self.refs.append(data)
+
+
+    def _load_lazy_blocks(self):
+        """Build all blocks that have not been accessed yet"""
+        for index in list(self._lazy_blocks.keys()):
+            self[index]
 
 
     def get(self, index):
@@ -268,8 +438,28 @@ class MultiBlock(vtkMultiBlockDataSet, CompositeFilters):
         """Set a block's string name at the specified index"""
         if name is None:
             return
+        synced = self._names_mtime == self.GetMTime()
         self.GetMetaData(index).Set(vtk.vtkCompositeDataSet.NAME(), name)
         self.Modified()
+        if synced:
+            self._set_cached_name(index, name)
+
+
+    def _set_cached_name(self, index, name):
+        """Update the cached names after naming a block"""
+        names = self._names
+        if index >= len(names):
+            names.extend([None]*(index + 1 - len(names)))
+        old = names[index]
+        names[index] = name
+        if old != name and self._name_index.get(old) == index:
+            # the next block of the old name is now the first one
+            self._name_index.pop(old)
+            if old in names:
+                self._name_index[old] = names.index(old)
+        if self._name_index.get(name, index + 1) > index:
+            self._name_index[name] = index
+        self._names_mtime = self.GetMTime()
 
 
     def get_block_name(self, index):
@@ -282,10 +472,8 @@ class MultiBlock(vtkMultiBlockDataSet, CompositeFilters):
 
     def keys(self):
         """Get all the block names in the dataset"""
-        names = []
-        for i in range(self.n_blocks):
-            names.append(self.get_block_name(i))
-        return names
+        self._update_names()
+        return list(self._names)
 
 
     def __setitem__(self, index, data):
@@ -318,36 +506,49 @@ class MultiBlock(vtkMultiBlockDataSet, CompositeFilters):
             self.append(data)
             i = self.n_blocks - 1
         else:
+            synced = self._names_mtime == self.GetMTime()
+            n_blocks = self.n_blocks
             self.SetBlock(i, data)
+            self._lazy_blocks.pop(i, None)
+            if synced:
+                # new blocks are unnamed until named below
+                self._names.extend([None]*(self.n_blocks - n_blocks))
+                self._names_mtime = self.GetMTime()
         if name is None:
             name = 'Block-{0:02}'.format(i)
         self.set_block_name(i, name) # Note that this calls self.Modified()
-        if data not in self.refs:
+        self._add_ref(data)
+
+
+    def _add_ref(self, data):
+        """Keep a reference to ``data`` unless one is already kept"""
+        if id(data) not in self._ref_ids:
+            self._ref_ids.add(id(data))
             self.refs.append(data)
 
+    def _remove_ref(self, data):
+        """Drop the reference to ``data``"""
+        if id(data) in self._ref_ids:
+            self._ref_ids.discard(id(data))
+            self.refs[:] = [ref for ref in self.refs if ref is not data]
 
     def __delitem__(self, index):
         """Removes a block at the specified index"""
         if isinstance(index, str):
             index = self.get_index_by_name(index)
+        self._remove_ref(self.GetBlock(index))
         self.RemoveBlock(index)
+        if self._lazy_blocks:
+            # following blocks move down one index
+            self._lazy_blocks = {(i - 1 if i > index else i): lazy
+                                 for i, lazy in self._lazy_blocks.items()
+                                 if i != index}
 
 
     def __iter__(self):
         """The iterator across all blocks"""
-        self._iter_n = 0
-        return self
-
-    def next(self):
-        """Get the next block from the iterator"""
-        if self._iter_n < self.n_blocks:
-            result = self[self._iter_n]
-            self._iter_n += 1
-            return result
-        else:
-            raise StopIteration
-
-    __next__ = next
+        for i in range(self.n_blocks):
+            yield self[i]
 
 
     def pop(self, index):
@@ -422,8 +623,12 @@ class MultiBlock(vtkMultiBlockDataSet, CompositeFilters):
         fmt += row.format("Index", "Name", "Type")
 
         for i in range(self.n_blocks):
-            data = self[i]
-            fmt += row.format(i, self.get_block_name(i), type(data).__name__)
+            if i in self._lazy_blocks:
+                # describe blocks that are not built yet without building them
+                kind = self._lazy_blocks[i][1]['type']
+            else:
+                kind = type(self[i])
+            fmt += row.format(i, self.get_block_name(i), kind.__name__)
 
         fmt += "</table>\n"
         fmt += "\n"
@@ -470,6 +675,7 @@ class MultiBlock(vtkMultiBlockDataSet, CompositeFilters):
         newobject : same as input
            Deep or shallow copy of the input.
         """
+        self._load_lazy_blocks()
         thistype = type(self)
         newobject = thistype()
         if deep:
@@ -0,0 +1,92 @@
+"""An internal module tracking datasets that share their arrays until one
+of them writes to an array
+
+Datasets copied with ``copy(copy_on_write=True)`` or overwritten by
+another mesh share the same VTK arrays.  Before PyVista writes to an
+array of one of them in place, the other datasets of its group are
+given their own copy of that array.
+"""
+import weakref
+
+import vtk
+
+
+def share_arrays(dataset, other):
+    """Put two datasets sharing their arrays in the same group"""
+    group = getattr(dataset, '_cow_group', None)
+    other_group = getattr(other, '_cow_group', None)
+    if group is None:
+        group = other_group if other_group is not None else weakref.WeakSet()
+    elif other_group is not None and other_group is not group:
+        for member in list(other_group):
+            group.add(member)
+            member._cow_group = group
+    for member in (dataset, other):
+        group.add(member)
+        member._cow_group = group
+
+
+def is_shared(dataset):
+    """Return True when other datasets may share arrays with ``dataset``"""
+    group = getattr(dataset, '_cow_group', None)
+    return group is not None and len(group) > 1
+
+
+def _address(obj):
+    return obj.GetAddressAsString('vtkObject')
+
+
+def _deep_copy(vtkobj):
+    copy = vtkobj.NewInstance()
+    copy.DeepCopy(vtkobj)
+    return copy
+
+
+def _replace_array(dataset, address):
+    """Give ``dataset`` its own copy of the array at ``address``.  Returns
+    True when the dataset held that array.
+    """
+    if isinstance(dataset, vtk.vtkPointSet):
+        points = dataset.GetPoints()
+        if points is not None and address in (_address(points),
+                                              _address(points.GetData())):
+            dataset.SetPoints(_deep_copy(points))
+            return True
+    if isinstance(dataset, vtk.vtkRectilinearGrid):
+        for get, set_ in ((dataset.GetXCoordinates, dataset.SetXCoordinates),
+                          (dataset.GetYCoordinates, dataset.SetYCoordinates),
+                          (dataset.GetZCoordinates, dataset.SetZCoordinates)):
+            coords = get()
+            if coords is not None and _address(coords) == address:
+                set_(_deep_copy(coords))
+                return True
+    for data, cached in ((dataset.GetPointData(), '_point_arrays'),
+                         (dataset.GetCellData(), '_cell_arrays'),
+                         (dataset.GetFieldData(), '_field_arrays')):
+        for i in range(data.GetNumberOfArrays()):
+            vtkarr = data.GetAbstractArray(i)
+            if vtkarr is None or _address(vtkarr) != address:
+                continue
+            if not vtkarr.GetName():
+                # arrays are replaced by name
+                return False
+            # an array of the same name is replaced at the same index,
+            # which preserves the active attributes
+            data.AddArray(_deep_copy(vtkarr))
+            # drop the cached views of the previous array
+            dataset.__dict__.pop(cached, None)
+            return True
+    return False
+
+
+def detach_shared(dataset, vtkobj):
+    """Prepare ``dataset`` to write to the array ``vtkobj`` in place by
+    giving every other dataset of its group a copy of that array.
+    """
+    group = getattr(dataset, '_cow_group', None)
+    if group is None or vtkobj is None:
+        return
+    address = _address(vtkobj)
+    for other in list(group):
+        if other is not dataset:
+            _replace_array(other, address)
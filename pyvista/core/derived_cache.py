@@ -0,0 +1,117 @@
+"""An internal module for caching quantities derived from the geometry of
+datasets
+"""
+import collections
+
+import vtk
+
+# maximum number of quantities cached per dataset
+DERIVED_CACHE_SIZE = 16
+
+
+def _object_key(obj):
+    """Identify a VTK object by its address, as its Python wrapper may be
+    recreated, and by its modification time
+    """
+    if obj is None:
+        return None
+    return obj.GetAddressAsString('vtkObject'), obj.GetMTime()
+
+
+def geometry_key(dataset):
+    """Return a key that changes whenever the points or the cells of a
+    dataset change, but not when its point or cell arrays do.
+    """
+    if isinstance(dataset, vtk.vtkImageData):
+        return (tuple(dataset.GetDimensions()), tuple(dataset.GetOrigin()),
+                tuple(dataset.GetSpacing()))
+    if isinstance(dataset, vtk.vtkRectilinearGrid):
+        return (tuple(dataset.GetDimensions()),) + tuple(
+            _object_key(c) for c in (dataset.GetXCoordinates(),
+                                     dataset.GetYCoordinates(),
+                                     dataset.GetZCoordinates()))
+    parts = []
+    if isinstance(dataset, vtk.vtkPointSet):
+        parts.append(dataset.GetPoints())
+    if isinstance(dataset, vtk.vtkPolyData):
+        parts.extend((dataset.GetVerts(), dataset.GetLines(),
+                      dataset.GetPolys(), dataset.GetStrips()))
+    elif isinstance(dataset, vtk.vtkUnstructuredGrid):
+        parts.extend((dataset.GetCells(), dataset.GetCellTypesArray()))
+    elif isinstance(dataset, vtk.vtkStructuredGrid):
+        return (tuple(dataset.GetDimensions()),) + tuple(
+            _object_key(p) for p in parts)
+    elif not parts:
+        # unknown dataset, also invalidated by changes of its arrays
+        return (dataset.GetMTime(), )
+    return tuple(_object_key(p) for p in parts)
+
+
+class DerivedCache(object):
+    """Least recently used cache of the quantities derived from the
+    geometry of a dataset (volume, area, normals, ...).
+
+    All entries are dropped as soon as the points or cells of the dataset
+    are modified.  Arrays are returned as copies so that the cached
+    values cannot be altered.
+
+    Parameters
+    ----------
+    max_items : int, optional
+        Maximum number of quantities held.
+
+    """
+
+    def __init__(self, max_items=DERIVED_CACHE_SIZE):
+        self.max_items = max_items
+        self._geometry = None
+        self._items = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def keys(self):
+        """Keys of the cached quantities, least recently used first"""
+        return list(self._items.keys())
+
+    @property
+    def nbytes(self):
+        """Total size of the cached arrays in bytes"""
+        return sum(getattr(value, 'nbytes', 0) for value in self._items.values())
+
+    def clear(self):
+        """Drop all cached quantities"""
+        self._items.clear()
+        self._geometry = None
+
+    def get(self, dataset, key, compute):
+        """Return the quantity ``key`` of ``dataset``, calling ``compute``
+        on a miss or when the geometry of ``dataset`` was modified since
+        it was cached.
+        """
+        geometry = geometry_key(dataset)
+        if geometry != self._geometry:
+            self._items.clear()
+            self._geometry = geometry
+        if key in self._items:
+            value = self._items.pop(key)
+        else:
+            value = compute()
+        self._items[key] = value
+        while len(self._items) > max(self.max_items, 1):
+            self._items.popitem(last=False)
+        if hasattr(value, 'copy'):
+            return value.copy()
+        return value
+
+
+def get_derived_cache(dataset):
+    """Return the derived quantity cache stored on ``dataset``, creating it
+    if needed
+    """
+    if not hasattr(dataset, '_derived_cache'):
+        dataset._derived_cache = DerivedCache()
+    return dataset._derived_cache
@@ -0,0 +1,244 @@
+"""An internal module for memoizing the outputs of the dataset filters
+
+The cache is disabled by default and is turned on with
+:func:`pyvista.set_filter_cache`.
+"""
+import collections
+import functools
+import threading
+
+try:
+    from inspect import signature
+except ImportError:  # pragma: no cover
+    signature = None
+
+import numpy as np
+import vtk
+
+# outputs kept by default
+FILTER_CACHE_SIZE = 32
+FILTER_CACHE_BYTES = 512*1024**2
+
+
+class _Uncacheable(Exception):
+    """Raised when the arguments of a filter cannot be hashed"""
+    pass
+
+
+def _object_key(obj):
+    """Identify a VTK data object by its address and modification time.
+
+    The modification time of composite datasets does not change with
+    their blocks, so the leaves are included.
+    """
+    key = (obj.GetAddressAsString('vtkObject'), obj.GetMTime())
+    if isinstance(obj, vtk.vtkCompositeDataSet):
+        iterator = obj.NewIterator()
+        iterator.InitTraversal()
+        while not iterator.IsDoneWithTraversal():
+            key += _object_key(iterator.GetCurrentDataObject())
+            iterator.GoToNextItem()
+    return key
+
+
+def _freeze(value):
+    """Return a hashable equivalent of a filter argument"""
+    if isinstance(value, vtk.vtkDataObject):
+        if getattr(value, '_get_pending_transform', lambda: None)() is not None:
+            raise _Uncacheable
+        return _object_key(value)
+    if isinstance(value, np.ndarray):
+        return (value.shape, value.dtype.str, value.tobytes())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (str, bytes, int, float, complex, bool, type(None),
+                          np.generic)):
+        return value
+    raise _Uncacheable
+
+
+def _nbytes(dataset):
+    """Memory used by a dataset in bytes"""
+    return dataset.GetActualMemorySize()*1024
+
+
+class FilterCache(object):
+    """Least recently used cache of filter outputs.
+
+    Outputs are keyed on the name of the filter, its arguments and the
+    identity and modification time of the input datasets, so modifying an
+    input invalidates its outputs.  Each hit returns a shallow copy of
+    the cached output; outputs modified since they were cached are
+    discarded.
+
+    Parameters
+    ----------
+    max_items : int, optional
+        Maximum number of outputs held.
+
+    max_bytes : int, optional
+        Maximum total size of the outputs held in bytes.
+
+    """
+
+    def __init__(self, max_items=FILTER_CACHE_SIZE, max_bytes=FILTER_CACHE_BYTES):
+        self.enabled = False
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        self._items = collections.OrderedDict()
+        self._lock = threading.RLock()
+        # nested filter calls are not cached separately
+        self._local = threading.local()
+
+    def __len__(self):
+        return len(self._items)
+
+    def clear(self):
+        """Drop all cached outputs and reset the statistics"""
+        with self._lock:
+            self._items.clear()
+            self.hits = 0
+            self.misses = 0
+            self.nbytes = 0
+
+    def stats(self):
+        """Return the number of hits, misses, outputs and bytes held"""
+        return {'hits': self.hits, 'misses': self.misses,
+                'items': len(self._items), 'bytes': self.nbytes}
+
+    def _pop(self, key):
+        output, _, nbytes = self._items.pop(key)
+        self.nbytes -= nbytes
+        return output
+
+    def get(self, key):
+        """Return a shallow copy of a cached output or ``None``"""
+        with self._lock:
+            if key not in self._items:
+                self.misses += 1
+                return None
+            output, output_key, nbytes = self._items.pop(key)
+            if _object_key(output) != output_key:
+                # the output was modified
+                self.nbytes -= nbytes
+                self.misses += 1
+                return None
+            copy = output.copy(deep=False)
+            # copying may activate the scalars of the output
+            self._items[key] = (output, _object_key(output), nbytes)
+            self.hits += 1
+        return copy
+
+    def put(self, key, output):
+        """Cache ``output`` and return a shallow copy of it to the caller"""
+        nbytes = _nbytes(output)
+        copy = output.copy(deep=False)
+        with self._lock:
+            if key in self._items:
+                self._pop(key)
+            if nbytes <= self.max_bytes:
+                self._items[key] = (output, _object_key(output), nbytes)
+                self.nbytes += nbytes
+            while self._items and (len(self._items) > max(self.max_items, 1)
+                                   or self.nbytes > self.max_bytes):
+                self._pop(next(iter(self._items)))
+        return copy
+
+    def wrap(self, name, func):
+        """Return ``func`` memoized through this cache when it is enabled"""
+        sig = signature(func) if signature is not None else None
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not self.enabled or sig is None or getattr(self._local, 'active', False):
+                return func(*args, **kwargs)
+
+            def make_key():
+                return (name, ) + tuple((k, _freeze(v))
+                                        for k, v in bound.arguments.items())
+
+            try:
+                bound = sig.bind(*args, **kwargs)
+                bound.apply_defaults()
+                if bound.arguments.get('inplace', False):
+                    raise _Uncacheable
+                key = make_key()
+            except (_Uncacheable, TypeError):
+                return func(*args, **kwargs)
+            output = self.get(key)
+            if output is not None:
+                return output
+            self._local.active = True
+            try:
+                output = func(*args, **kwargs)
+            finally:
+                self._local.active = False
+            if not isinstance(output, vtk.vtkDataObject) or \
+               getattr(output, '_lazy_blocks', None):
+                return output
+            # filters may modify their input, e.g. by activating scalars,
+            # so the output is stored under the state seen by later calls
+            return self.put(make_key(), output)
+
+        return wrapper
+
+
+_FILTER_CACHE = FilterCache()
+
+
+def get_filter_cache():
+    """Return the cache of filter outputs.
+
+    Examples
+    --------
+    >>> import pyvista
+    >>> pyvista.get_filter_cache().stats()  # doctest:+SKIP
+    {'hits': 0, 'misses': 0, 'items': 0, 'bytes': 0}
+
+    """
+    return _FILTER_CACHE
+
+
+def set_filter_cache(enabled=True, max_items=None, max_bytes=None):
+    """Enable or disable the memoization of the outputs of the filters.
+
+    While enabled, calling a filter of ``DataSetFilters`` or
+    ``CompositeFilters`` again with the same arguments on an unmodified
+    dataset returns a shallow copy of the previous output.  Disabling
+    the cache drops the outputs it holds.
+
+    Parameters
+    ----------
+    enabled : bool, optional
+        Enable the cache.
+
+    max_items : int, optional
+        Maximum number of outputs held.
+
+    max_bytes : int, optional
+        Maximum total size of the outputs held in bytes.
+
+    """
+    cache = _FILTER_CACHE
+    with cache._lock:
+        cache.enabled = enabled
+        if max_items is not None:
+            cache.max_items = max_items
+        if max_bytes is not None:
+            cache.max_bytes = max_bytes
+        if not enabled:
+            cache.clear()
+
+
+def memoize_filters(cls, exclude=()):
+    """Route the public filters of ``cls`` through the filter cache"""
+    for name, func in list(vars(cls).items()):
+        if name.startswith('_') or name in exclude or not callable(func):
+            continue
+        setattr(cls, name, _FILTER_CACHE.wrap(name, func))
+    return cls
@@ -24,14 +24,18 @@ Example
 
 """
 import collections
+import weakref
 
 import numpy as np
 import vtk
+from vtk.util.numpy_support import (numpy_to_vtk, numpy_to_vtkIdTypeArray,
+                                    vtk_to_numpy)
 
 import pyvista
+from pyvista.core.filter_cache import memoize_filters
 from pyvista.utilities import (CELL_DATA_FIELD, POINT_DATA_FIELD,
                                generate_plane, get_scalar, is_inside_bounds,
-                               wrap)
+                               is_pyvista_obj, wrap)
 
 NORMALS = {
     'x': [1, 0, 0],
@@ -42,10 +46,39 @@ NORMALS = {
     '-z': [0, 0, -1],
 }
 
+INTERPOLATION_KERNELS = {
+    'gaussian': vtk.vtkGaussianKernel,
+    'shepard': vtk.vtkShepardKernel,
+    'voronoi': vtk.vtkVoronoiKernel,
+    'linear': vtk.vtkLinearKernel,
+}
+
+
+def _apply_pending(dataset):
+    """Apply the lazy transformations of a dataset or of its blocks.
+    Returns True when a transformation was applied.
+    """
+    applied = False
+    if isinstance(dataset, vtk.vtkMultiBlockDataSet):
+        for i in range(dataset.GetNumberOfBlocks()):
+            applied = _apply_pending(dataset.GetBlock(i)) or applied
+    elif getattr(dataset, '_get_pending_transform', lambda: None)() is not None:
+        dataset.apply_pending_transform()
+        applied = True
+    return applied
+
 
 def _get_output(algorithm, iport=0, iconnection=0, oport=0, active_scalar=None,
                 active_scalar_field='point'):
     """A helper to get the algorithm's output and copy input's pyvista meta info"""
+    # inputs with a lazy transformation were read untransformed, so the
+    # algorithm runs again on the transformed inputs
+    applied = False
+    for port in range(algorithm.GetNumberOfInputPorts()):
+        for connection in range(algorithm.GetNumberOfInputConnections(port)):
+            applied = _apply_pending(algorithm.GetInputDataObject(port, connection)) or applied
+    if applied:
+        algorithm.Update()
     ido = algorithm.GetInputDataObject(iport, iconnection)
     data = wrap(algorithm.GetOutputDataObject(oport))
     if not isinstance(data, pyvista.MultiBlock):
@@ -56,6 +89,94 @@ def _get_output(algorithm, iport=0, iconnection=0, oport=0, active_scalar=None,
 
 
 
+# locators of datasets, held only as long as their dataset.  Keeping
+# them on the dataset itself would make a reference cycle through VTK
+# that is never collected, as the locators reference their dataset.
+_CELL_LOCATORS = weakref.WeakKeyDictionary()
+_POINT_LOCATORS = weakref.WeakKeyDictionary()
+
+
+def _cell_locator(dataset):
+    """Return the cell locator cached for a dataset.
+
+    The locator is built on first use and only rebuilt by VTK when the
+    dataset is modified.
+    """
+    _apply_pending(dataset)
+    if dataset not in _CELL_LOCATORS:
+        if hasattr(vtk, 'vtkStaticCellLocator'):
+            locator = vtk.vtkStaticCellLocator()
+        else:  # pragma: no cover
+            locator = vtk.vtkCellLocator()
+        locator.SetDataSet(dataset)
+        _CELL_LOCATORS[dataset] = locator
+    return _CELL_LOCATORS[dataset]
+
+
+def _point_locator(dataset):
+    """Return the static point locator cached for a dataset.  Its dataset
+    is set by the algorithm using it.
+    """
+    if dataset not in _POINT_LOCATORS:
+        _POINT_LOCATORS[dataset] = vtk.vtkStaticPointLocator()
+    return _POINT_LOCATORS[dataset]
+
+
+def _polyline_vertices(lines):
+    """Return the vertices of polylines as an ``(n_lines, n_vertices, 3)``
+    array, padding shorter polylines by repeating their last vertex.
+    """
+    if isinstance(lines, vtk.vtkPolyData):
+        cells = vtk_to_numpy(lines.GetLines().GetData())
+        locations = pyvista.cell_array_locations(lines.GetLines())
+        points = np.asarray(lines.points)
+        lines = [points[cells[loc + 1:loc + 1 + cells[loc]]] for loc in locations]
+    if isinstance(lines, np.ndarray) and lines.ndim == 3:
+        vertices = lines
+    else:
+        lines = [np.asarray(line, dtype=np.float64) for line in lines]
+        n_vertices = max([len(line) for line in lines] + [2])
+        vertices = np.empty((len(lines), n_vertices, 3))
+        for i, line in enumerate(lines):
+            if line.ndim != 2 or line.shape[1] != 3 or len(line) < 2:
+                raise ValueError('Each line must be an (N, 3) array of at '
+                                 'least two points.')
+            vertices[i, :len(line)] = line
+            vertices[i, len(line):] = line[-1]
+    if vertices.shape[1] < 2 or vertices.shape[2] != 3:
+        raise ValueError('Lines must be an (n_lines, n_vertices, 3) array '
+                         'with at least two vertices per line.')
+    return vertices
+
+
+def _resample_polylines(vertices, n_samples):
+    """Return ``n_samples`` points equally spaced along the arc length of
+    each polyline and their distance from the start of the polyline.
+    """
+    n_lines, n_vertices = vertices.shape[:2]
+    segments = np.diff(vertices, axis=1)
+    seg_length = np.sqrt((segments**2).sum(2))
+    cum_length = np.zeros((n_lines, n_vertices))
+    np.cumsum(seg_length, axis=1, out=cum_length[:, 1:])
+    distance = cum_length[:, -1:] * np.linspace(0.0, 1.0, n_samples)
+
+    # find the segment of every sample with a single sorted search by
+    # offsetting each line beyond the length of all others
+    shift = (np.arange(n_lines) * (cum_length[:, -1].max() + 1.0))[:, np.newaxis]
+    index = np.searchsorted((cum_length + shift).ravel(),
+                            (distance + shift).ravel(), side='right')
+    index -= np.repeat(np.arange(n_lines) * n_vertices, n_samples) + 1
+    index = np.clip(index, 0, n_vertices - 2).reshape(n_lines, n_samples)
+
+    rows = np.arange(n_lines)[:, np.newaxis]
+    length = seg_length[rows, index]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        frac = (distance - cum_length[rows, index]) / length
+    frac[length == 0] = 0.0
+    points = vertices[rows, index] + frac[..., np.newaxis]*segments[rows, index]
+    return points, distance
+
+
 class DataSetFilters(object):
     """A set of common filters that can be applied to any vtkDataSet"""
 
@@ -341,10 +462,10 @@ class DataSetFilters(object):
     def threshold(dataset, value=None, scalars=None, invert=False, continuous=False,
                   preference='cell'):
         """
-        This filter will apply a ``vtkThreshold`` filter to the input dataset and
-        return the resulting object. This extracts cells where scalar value in each
-        cell satisfies threshold criterion.  If scalars is None, the inputs
-        active_scalar is used.
+        This filter extracts cells where scalar value in each cell satisfies
+        threshold criterion and returns the resulting object, as done by
+        ``vtkThreshold``.  If scalars is None, the inputs active_scalar is
+        used.  See :func:`threshold_criteria` to combine several criteria.
 
         Parameters
         ----------
@@ -360,7 +481,8 @@ class DataSetFilters(object):
             If value is a single value, when invert is True cells are kept when
             their values are below parameter "value".  When invert is False
             cells are kept when their value is above the threshold "value".
-            Default is False: yielding above the threshold "value".
+            Default is False: yielding above the threshold "value".  If value
+            is a range, cells outside of the range are kept.
 
         continuous : bool, optional
             When True, the continuous interval [minimum cell scalar,
@@ -380,44 +502,119 @@ class DataSetFilters(object):
         if arr is None:
             raise AssertionError('No arrays present to threshold.')
 
-        # If using an inverted range, merge the result of two fitlers:
-        if isinstance(value, collections.Iterable) and invert:
-            valid_range = [np.nanmin(arr), np.nanmax(arr)]
-            # Create two thresholds
-            t1 = dataset.threshold([valid_range[0], value[0]], scalars=scalars,
-                    continuous=continuous, preference=preference, invert=False)
-            t2 = dataset.threshold([value[1], valid_range[1]], scalars=scalars,
-                    continuous=continuous, preference=preference, invert=False)
-            # Use an AppendFilter to merge the two results
-            appender = vtk.vtkAppendFilter()
-            appender.AddInputData(t1)
-            appender.AddInputData(t2)
-            appender.Update()
-            return _get_output(appender)
-
-        # Run a standard threshold algorithm
-        alg = vtk.vtkThreshold()
-        alg.SetInputDataObject(dataset)
-        alg.SetInputArrayToProcess(0, 0, 0, field, scalars) # args: (idx, port, connection, field, name)
-        # set thresholding parameters
-        alg.SetUseContinuousCellRange(continuous)
-        # use valid range if no value given
-        if value is None:
-            value = dataset.get_data_range(scalars)
+        preference = 'point' if field == POINT_DATA_FIELD else 'cell'
         # check if value is iterable (if so threshold by min max range like ParaView)
         if isinstance(value, collections.Iterable):
             if len(value) != 2:
                 raise AssertionError('Value range must be length one for a float value or two for min/max; not ({}).'.format(value))
-            alg.ThresholdBetween(value[0], value[1])
+            criteria = pyvista.ScalarRange(scalars, value[0], value[1],
+                                           invert=invert, preference=preference)
+        elif value is None:
+            # keep every non-NaN value
+            criteria = pyvista.ScalarRange(scalars, preference=preference)
+        elif invert:
+            criteria = pyvista.ScalarRange(scalars, upper=value,
+                                           preference=preference)
         else:
-            # just a single value
-            if invert:
-                alg.ThresholdByLower(value)
-            else:
-                alg.ThresholdByUpper(value)
-        # Run the threshold
-        alg.Update()
-        return _get_output(alg)
+            criteria = pyvista.ScalarRange(scalars, lower=value,
+                                           preference=preference)
+        return DataSetFilters.threshold_criteria(dataset, criteria,
+                                                 continuous=continuous)
+
+
+    def threshold_criteria(dataset, criteria, continuous=False):
+        """Extract the cells meeting a combination of range criteria on
+        any number of point and cell arrays.
+
+        All criteria are evaluated in one vectorized pass and the cells
+        are extracted once.
+
+        Parameters
+        ----------
+        criteria : pyvista.Criterion
+            Criteria built from :class:`pyvista.ScalarRange` and combined
+            with ``&``, ``|`` and ``~``.
+
+        continuous : bool, optional
+            When True, the continuous interval [minimum cell scalar,
+            maxmimum cell scalar] will be used to intersect the threshold bound,
+            rather than the set of discrete scalar values from the vertices.
+
+        Returns
+        -------
+        subset : pyvista.UnstructuredGrid
+            The selected cells.
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> from pyvista import examples
+        >>> mesh = examples.load_uniform()
+        >>> criteria = (pyvista.ScalarRange('Spatial Cell Data', 0, 100) |
+        ...             pyvista.ScalarRange('Spatial Cell Data', 600, 700))
+        >>> subset = mesh.threshold_criteria(criteria)
+
+        """
+        mask = criteria.cell_mask(dataset, continuous=continuous)
+        output = dataset.extract_cells(mask)
+        # only keep the arrays of the input as with vtkThreshold
+        for name in ('vtkOriginalPointIds', 'vtkOriginalCellIds'):
+            output.GetPointData().RemoveArray(name)
+            output.GetCellData().RemoveArray(name)
+        return output
+
+
+    def extract_cells(dataset, ind):
+        """
+        Returns a subset of the grid
+
+        Parameters
+        ----------
+        ind : np.ndarray
+            Numpy array of cell indices to be extracted.
+
+        Returns
+        -------
+        subgrid : pyvista.UnstructuredGrid
+            Subselected grid
+
+        """
+        if not isinstance(ind, np.ndarray):
+            ind = np.array(ind, np.ndarray)
+
+        if ind.dtype == np.bool:
+            ind = ind.nonzero()[0].astype(pyvista.ID_TYPE)
+
+        if ind.dtype != pyvista.ID_TYPE:
+            ind = ind.astype(pyvista.ID_TYPE)
+
+        if not ind.flags.c_contiguous:
+            ind = np.ascontiguousarray(ind)
+
+        vtk_ind = numpy_to_vtkIdTypeArray(ind, deep=False)
+
+        # Create selection objects
+        selectionNode = vtk.vtkSelectionNode()
+        selectionNode.SetFieldType(vtk.vtkSelectionNode.CELL)
+        selectionNode.SetContentType(vtk.vtkSelectionNode.INDICES)
+        selectionNode.SetSelectionList(vtk_ind)
+
+        selection = vtk.vtkSelection()
+        selection.AddNode(selectionNode)
+
+        # extract
+        extract_sel = vtk.vtkExtractSelection()
+        extract_sel.SetInputData(0, dataset)
+        extract_sel.SetInputData(1, selection)
+        extract_sel.Update()
+        subgrid = _get_output(extract_sel)
+
+        # extracts only in float32
+        if subgrid.n_points and dataset.points.dtype is not np.dtype('float32'):
+            ind = subgrid.point_arrays['vtkOriginalPointIds']
+            subgrid.points = dataset.points[ind]
+
+        return subgrid
 
 
     def threshold_percent(dataset, percent=0.50, scalars=None, invert=False,
@@ -492,6 +689,7 @@ class DataSetFilters(object):
             Generate solid faces for the box. This is off by default
 
         """
+        _apply_pending(dataset)
         alg = vtk.vtkOutlineFilter()
         alg.SetInputDataObject(dataset)
         alg.SetGenerateFaces(generate_faces)
@@ -508,6 +706,7 @@ class DataSetFilters(object):
             corresponding bounds
 
         """
+        _apply_pending(dataset)
         alg = vtk.vtkOutlineCornerFilter()
         alg.SetInputDataObject(dataset)
         alg.SetCornerFactor(factor)
@@ -750,6 +949,39 @@ class DataSetFilters(object):
         alg.Update()
         return _get_output(alg)
 
+    def compute_cell_quality(dataset, metrics='scaled_jacobian'):
+        """Compute quality metrics of the cells and add them as cell arrays
+        named after each metric.  The first metric becomes the active
+        scalars.  See :func:`pyvista.cell_quality` for the metrics.
+
+        Parameters
+        ----------
+        metrics : str or list of str, optional
+            Any of ``'scaled_jacobian'``, ``'jacobian'``,
+            ``'aspect_ratio'``, ``'skew'`` and ``'volume'``.
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> from pyvista import examples
+        >>> hexbeam = examples.load_hexbeam()
+        >>> qual = hexbeam.compute_cell_quality(['scaled_jacobian', 'skew'])
+        >>> summary = pyvista.quality_summary(qual.cell_arrays['skew'])
+
+        """
+        if isinstance(metrics, str):
+            metrics = [metrics]
+        output = dataset.copy(deep=False)
+        # cast once rather than for every metric
+        grid = dataset
+        if not isinstance(grid, vtk.vtkUnstructuredGrid):
+            grid = dataset.cast_to_unstructured_grid()
+        for metric in metrics:
+            output._add_cell_scalar(pyvista.cell_quality(grid, metric), metric)
+        if metrics:
+            output.set_active_scalar(metrics[0], preference='cell')
+        return output
+
     def cell_centers(dataset, vertex=True):
         """Generate points at the center of the cells in this dataset.
         These points can be used for placing glyphs / vectors.
@@ -852,31 +1084,102 @@ class DataSetFilters(object):
         return _get_output(alg)
 
 
-    def split_bodies(dataset, label=False):
+    def split_bodies(dataset, label=False, min_cells=0, lazy=False):
         """Find, label, and split connected bodies/volumes. This splits
         different connected bodies into blocks in a MultiBlock dataset.
 
+        The cells and points are sorted by body once, so every body is
+        built from contiguous slices of the sorted arrays.
+
         Parameters
         ----------
         label : bool
             A flag on whether to keep the ID arrays given by the
             ``connectivity`` filter.
+
+        min_cells : int, optional
+            Only return bodies with at least this many cells.
+
+        lazy : bool, optional
+            Only build each body when its block is first accessed.
+
+        Returns
+        -------
+        bodies : pyvista.MultiBlock
+            A ``pyvista.UnstructuredGrid`` for each body.
+
         """
-        # Get the connectivity and label different bodies
         labeled = dataset.connectivity()
-        classifier = labeled.cell_arrays['RegionId']
+        if not isinstance(labeled, pyvista.UnstructuredGrid):
+            labeled = labeled.cast_to_unstructured_grid()
         bodies = pyvista.MultiBlock()
-        for vid in np.unique(classifier):
-            # Now extract it:
-            b = labeled.threshold([vid-0.5, vid+0.5], scalars='RegionId')
-            if not label:
-                # strange behavior:
-                # must use this method rather than deleting from the point_arrays
-                # or else object is collected.
-                b._remove_array(CELL_DATA_FIELD, 'RegionId')
-                b._remove_array(POINT_DATA_FIELD, 'RegionId')
-            bodies.append(b)
-
+        if labeled.n_cells < 1:
+            return bodies
+        cell_region = labeled.cell_arrays['RegionId']
+        point_region = labeled.point_arrays['RegionId']
+        n_regions = int(cell_region.max()) + 1
+
+        # sort cells and points by region once
+        cell_order = np.argsort(cell_region, kind='mergesort')
+        point_order = np.argsort(point_region, kind='mergesort')
+        cell_start = np.zeros(n_regions + 1, pyvista.ID_TYPE)
+        np.cumsum(np.bincount(cell_region, minlength=n_regions), out=cell_start[1:])
+        point_counts = np.bincount(point_region, minlength=n_regions)
+        point_start = np.zeros(n_regions + 1, pyvista.ID_TYPE)
+        np.cumsum(point_counts, out=point_start[1:])
+
+        # point ids local to each region
+        local_ids = np.empty(labeled.n_points, pyvista.ID_TYPE)
+        local_ids[point_order] = (np.arange(labeled.n_points, dtype=pyvista.ID_TYPE)
+                                  - np.repeat(point_start[:-1], point_counts))
+
+        cells, locations = pyvista.gather_cells(labeled.cells,
+                                                pyvista.cell_locations(labeled),
+                                                cell_order)
+        ids = pyvista.cell_id_mask(cells, locations)
+        cells[ids] = local_ids[cells[ids]]
+        locations = np.append(locations, cells.size)
+        celltypes = labeled.celltypes[cell_order]
+        points = labeled.points[point_order]
+
+        skip = [] if label else ['RegionId']
+        point_arrays = {name: labeled.point_arrays[name][point_order]
+                        for name in labeled.point_arrays if name not in skip}
+        cell_arrays = {name: labeled.cell_arrays[name][cell_order]
+                       for name in labeled.cell_arrays if name not in skip}
+
+        def build(region):
+            c0, c1 = cell_start[region], cell_start[region + 1]
+            p0, p1 = point_start[region], point_start[region + 1]
+            start = locations[c0]
+            body = pyvista.UnstructuredGrid(locations[c0:c1] - start,
+                                            cells[start:locations[c1]],
+                                            celltypes[c0:c1], points[p0:p1])
+            for name, arr in point_arrays.items():
+                body.point_arrays[name] = arr[p0:p1]
+            for name, arr in cell_arrays.items():
+                body.cell_arrays[name] = arr[c0:c1]
+            return body
+
+        regions = np.nonzero(np.diff(cell_start) >= max(min_cells, 1))[0]
+        if lazy:
+            # bounds of each region so that the bodies can be described
+            # without building them
+            lower = np.minimum.reduceat(points, point_start[:-1])
+            upper = np.maximum.reduceat(points, point_start[:-1])
+            bodies.n_blocks = len(regions)
+            for i, region in enumerate(regions):
+                bodies.set_block_name(i, 'Block-{0:02}'.format(i))
+                summary = {'type': pyvista.UnstructuredGrid,
+                           'bounds': np.column_stack((lower[region],
+                                                      upper[region])).ravel(),
+                           'n_points': int(point_counts[region]),
+                           'n_cells': int(cell_start[region + 1] - cell_start[region])}
+                bodies._lazy_blocks[i] = (lambda region=region: build(region),
+                                          summary)
+        else:
+            for region in regions:
+                bodies.append(build(region))
         return bodies
 
 
@@ -1060,19 +1363,21 @@ class DataSetFilters(object):
             algorithm first checks to see if the surface is closed and
             manifold.
         """
-        alg = vtk.vtkSelectEnclosedPoints()
-        alg.SetInputData(dataset)
-        alg.SetSurfaceData(surface)
-        alg.SetTolerance(tolerance)
-        alg.SetCheckSurface(check_surface)
-        alg.Update()
-        result = _get_output(alg)
-        out = dataset.copy()
-        out['SelectedPoints'] = result['SelectedPoints']
+        if check_surface and surface.GetNumberOfCells() and \
+           not vtk.vtkSelectEnclosedPoints.IsSurfaceClosed(surface):
+            # surface is not closed: all points are outside
+            mask = np.zeros(dataset.n_points, dtype=bool)
+        else:
+            containment = pyvista.SurfaceContainment(surface,
+                                                     tolerance=tolerance,
+                                                     check_surface=False)
+            mask = containment(dataset.points, inside_out=inside_out)
+        # only the point data container differs from the input
+        out = dataset.copy(deep=False)
+        out['SelectedPoints'] = mask.view(np.uint8)
         return out
 
 
-
     def sample(dataset, target, tolerance=None, pass_cell_arrays=True,
                     pass_point_arrays=True):
         """Resample scalar data from a passed mesh onto this mesh using
@@ -1109,53 +1414,103 @@ class DataSetFilters(object):
         return _get_output(alg)
 
 
-    def interpolate(dataset, points, sharpness=2, radius=1.0,
-            dimensions=(101, 101, 101), pass_cell_arrays=True,
-            pass_point_arrays=True, kernel='gaussian'):
+    def interpolate(dataset, points, sharpness=None, radius=None,
+            dimensions=None, pass_cell_arrays=True,
+            pass_point_arrays=True, kernel='gaussian', n_points=None,
+            null_value=0.0):
         """Interpolate values onto this mesh from the point data of a given
         :class:`pyvista.PolyData` object (typically a point cloud).
 
-        This uses a guassian interpolation kernel. Use the ``sharpness`` and
-        ``radius`` parameters to adjust this kernel.
+        The point data of ``points`` is interpolated straight onto the
+        points of this mesh with ``vtkPointInterpolator``.  The static
+        point locator of the source points is cached while they exist and
+        reused by later interpolations from the same, unmodified points.
 
-        Please note that the source dataset is first interpolated onto a fine
-        UniformGrid which is then sampled to this mesh. The interpolation grid's
-        dimensions will likely need to be tweaked for each individual use case.
+        Points of this mesh without any source point within the kernel
+        footprint are given ``null_value`` and marked invalid in the
+        ``'vtkValidPointMask'`` point array of the output.
 
         Parameters
         ----------
         points : pyvista.PolyData
             The points whose values will be interpolated onto this mesh.
 
-        sharpness : float
+        sharpness : float, optional
             Set / Get the sharpness (i.e., falloff) of the Gaussian. By
             default Sharpness=2. As the sharpness increases the effects of
             distant points are reduced.
 
-        radius : float
+        radius : float, optional
             Specify the radius within which the basis points must lie.
+            Defaults to 1.0.
 
-        dimensions : tuple(int)
-            When interpolating the points, they are first interpolating on to a
-            :class:`pyvista.UniformGrid` with the same spatial extent -
-            ``dimensions`` is number of points along each axis for that grid.
+        dimensions : tuple(int), optional
+            When given, the points are first interpolated on to a
+            :class:`pyvista.UniformGrid` with the same spatial extent as
+            this mesh and ``dimensions`` points along each axis, which is
+            then sampled to this mesh.
 
         pass_cell_arrays: bool, optional
             Preserve source mesh's original cell data arrays
 
         pass_point_arrays: bool, optional
             Preserve source mesh's original point data arrays
-        """
-        box = pyvista.create_grid(dataset, dimensions=dimensions)
 
-        gaussian_kernel = vtk.vtkGaussianKernel()
-        gaussian_kernel.SetSharpness(sharpness)
-        gaussian_kernel.SetRadius(radius)
+        kernel : str or vtk.vtkInterpolationKernel, optional
+            One of ``'gaussian'``, ``'shepard'``, ``'voronoi'`` or
+            ``'linear'``, or a configured VTK kernel, in which case
+            ``sharpness``, ``radius`` and ``n_points`` may not be given.
+
+        n_points : int, optional
+            Use the ``n_points`` closest source points rather than all the
+            points within ``radius``.  Not used by the Voronoi kernel.
+
+        null_value : float, optional
+            Value given to the points that could not be interpolated.
+
+        """
+        if not is_pyvista_obj(points):
+            points = wrap(points)
+
+        if isinstance(kernel, vtk.vtkInterpolationKernel):
+            if sharpness is not None or radius is not None or n_points is not None:
+                raise ValueError('sharpness, radius and n_points cannot be '
+                                 'given with a vtkInterpolationKernel; '
+                                 'configure the kernel instead.')
+            interp_kernel = kernel
+        elif isinstance(kernel, str) and kernel.lower() in INTERPOLATION_KERNELS:
+            interp_kernel = INTERPOLATION_KERNELS[kernel.lower()]()
+            if isinstance(interp_kernel, vtk.vtkGaussianKernel):
+                interp_kernel.SetSharpness(2 if sharpness is None else sharpness)
+            if isinstance(interp_kernel, vtk.vtkGeneralizedKernel):
+                interp_kernel.SetRadius(1.0 if radius is None else radius)
+                if n_points is not None:
+                    interp_kernel.SetKernelFootprintToNClosest()
+                    interp_kernel.SetNumberOfPoints(int(n_points))
+                else:
+                    interp_kernel.SetKernelFootprintToRadius()
+        else:
+            raise ValueError('Kernel ({}) must be one of {} or a '
+                             'vtkInterpolationKernel'
+                             .format(kernel, list(INTERPOLATION_KERNELS.keys())))
 
         interpolator = vtk.vtkPointInterpolator()
-        interpolator.SetInputData(box)
         interpolator.SetSourceData(points)
-        interpolator.SetKernel(gaussian_kernel)
+        interpolator.SetKernel(interp_kernel)
+        interpolator.SetLocator(_point_locator(points))
+        interpolator.SetNullPointsStrategyToMaskPoints()
+        interpolator.SetNullValue(null_value)
+        interpolator.SetValidPointsMaskArrayName('vtkValidPointMask')
+
+        if dimensions is None:
+            interpolator.SetInputData(dataset)
+            interpolator.SetPassPointArrays(pass_point_arrays)
+            interpolator.SetPassCellArrays(pass_cell_arrays)
+            interpolator.Update()
+            return _get_output(interpolator)
+
+        box = pyvista.create_grid(dataset, dimensions=dimensions)
+        interpolator.SetInputData(box)
         interpolator.Update()
 
         return dataset.sample(interpolator.GetOutput(),
@@ -1361,6 +1716,148 @@ class DataSetFilters(object):
         return dataset.extract_geometry().tri_filter().decimate(target_reduction)
 
 
+    def probe(dataset, points, scalars=None, tolerance=None,
+              chunk_size=1000000):
+        """Interpolate an array of this dataset at arbitrary points.
+
+        A cell locator is built once and cached while the dataset exists,
+        so repeated probes of an unmodified dataset do not rebuild it.  The
+        points are probed in chunks of ``chunk_size`` and no dataset is
+        created per call.
+
+        Parameters
+        ----------
+        points : np.ndarray
+            ``(N, 3)`` array of points to probe.
+
+        scalars : str, optional
+            Name of the point or cell array to probe.  Defaults to the
+            active scalars.
+
+        tolerance : float, optional
+            Tolerance used to compute whether a point is in a cell.  If not
+            given, tolerance is automatically generated.
+
+        chunk_size : int, optional
+            Number of points probed at once.
+
+        Returns
+        -------
+        values : np.ndarray
+            Values of the array at each point; zero for invalid points.
+
+        valid : np.ndarray
+            Boolean mask of the points found within the dataset.
+
+        """
+        points = np.asarray(points, dtype=np.float64)
+        if points.ndim != 2 or points.shape[1] != 3:
+            raise ValueError('Points must be an (N, 3) array')
+        if scalars is None:
+            field, scalars = dataset.active_scalar_info
+        arr = get_scalar(dataset, scalars)
+        if arr is None:
+            raise KeyError('Array ({}) not present in dataset.'.format(scalars))
+        chunk_size = int(chunk_size)
+        if chunk_size < 1:
+            raise ValueError('chunk_size must be a positive integer')
+
+        values = np.zeros((len(points), ) + arr.shape[1:], dtype=arr.dtype)
+        valid = np.zeros(len(points), dtype=bool)
+
+        _apply_pending(dataset)
+        alg = vtk.vtkProbeFilter()
+        alg.SetSourceData(dataset)
+        if tolerance is not None:
+            alg.SetComputeTolerance(False)
+            alg.SetTolerance(tolerance)
+        if hasattr(vtk, 'vtkCellLocatorStrategy'):
+            strategy = vtk.vtkCellLocatorStrategy()
+            strategy.SetCellLocator(_cell_locator(dataset))
+            alg.SetFindCellStrategy(strategy)
+        probe_points = vtk.vtkPoints()
+        probe_input = vtk.vtkPolyData()
+        probe_input.SetPoints(probe_points)
+        alg.SetInputData(probe_input)
+        for start in range(0, len(points), chunk_size):
+            chunk = np.ascontiguousarray(points[start:start + chunk_size])
+            probe_points.SetData(numpy_to_vtk(chunk))
+            probe_points.Modified()
+            alg.Update()
+            output = alg.GetOutput().GetPointData()
+            stop = start + len(chunk)
+            values[start:stop] = vtk_to_numpy(output.GetArray(scalars))
+            mask = output.GetArray(alg.GetValidPointMaskArrayName())
+            valid[start:stop] = vtk_to_numpy(mask) != 0
+        return values, valid
+
+
+    def sample_over_lines(dataset, lines, resolution=100, scalars=None,
+                          tolerance=None, chunk_size=1000000):
+        """Sample an array of this dataset along many polylines at once.
+
+        Every polyline is divided into ``resolution`` pieces of equal arc
+        length and all the sample points are probed together with
+        :func:`probe`.
+
+        Parameters
+        ----------
+        lines : np.ndarray, list, or pyvista.PolyData
+            ``(n_lines, n_vertices, 3)`` array of polylines, a list of
+            ``(n, 3)`` arrays of polylines of any lengths, or a
+            :class:`pyvista.PolyData` of line cells.  Straight lines are
+            given by their two end points.
+
+        resolution : int, optional
+            Number of pieces to divide each line into.
+
+        scalars : str, optional
+            Name of the point or cell array to sample.  Defaults to the
+            active scalars.
+
+        tolerance : float, optional
+            Tolerance used to compute whether a point is in a cell.
+
+        chunk_size : int, optional
+            Number of points probed at once.
+
+        Returns
+        -------
+        distance : np.ndarray
+            ``(n_lines, resolution + 1)`` distance of each sample along its
+            line.
+
+        values : np.ndarray
+            ``(n_lines, resolution + 1, ...)`` sampled values.
+
+        valid : np.ndarray
+            ``(n_lines, resolution + 1)`` boolean mask of the samples within
+            the dataset.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from pyvista import examples
+        >>> mesh = examples.load_uniform()
+        >>> lines = np.array([[[0, 0, 0], [9, 9, 9]],
+        ...                   [[0, 9, 0], [9, 0, 9]]])
+        >>> distance, values, valid = mesh.sample_over_lines(lines, 10)
+        >>> values.shape
+        (2, 11)
+
+        """
+        if not isinstance(resolution, int) or resolution < 1:
+            raise RuntimeError('`resolution` must be a positive integer.')
+        vertices = _polyline_vertices(lines)
+        points, distance = _resample_polylines(vertices, resolution + 1)
+        values, valid = DataSetFilters.probe(dataset, points.reshape(-1, 3),
+                                             scalars=scalars,
+                                             tolerance=tolerance,
+                                             chunk_size=chunk_size)
+        shape = distance.shape
+        return distance, values.reshape(shape + values.shape[1:]), valid.reshape(shape)
+
+
     def plot_over_line(dataset, pointa, pointb, resolution=None, scalars=None,
                        title=None, ylabel=None, figsize=None, figure=True,
                        show=True):
@@ -1409,15 +1906,16 @@ class DataSetFilters(object):
             resolution = dataset.n_cells
         if not isinstance(resolution, int) or resolution < 0:
             raise RuntimeError('`resolution` must be a positive integer.')
-        # Make a line and probe the dataset
-        line = pyvista.Line(pointa, pointb, resolution=resolution)
-        sampled = line.sample(dataset)
-
         # Get variable of interest
         if scalars is None:
             field, scalars = dataset.active_scalar_info
-        values = sampled.get_scalar(scalars)
-        distance = sampled['Distance']
+
+        # Probe the dataset along the line
+        line = np.array([[pointa, pointb]], dtype=np.float64)
+        distance, values, _ = DataSetFilters.sample_over_lines(dataset, line,
+                                                               resolution=resolution,
+                                                               scalars=scalars)
+        distance, values = distance[0], values[0]
 
         # Remainder of the is plotting
         if figure:
@@ -1442,6 +1940,30 @@ class DataSetFilters(object):
          return plt.show()
 
 
+    def pipeline(dataset, release_data=False):
+        """Start a lazy chain of filters on this dataset.
+
+        Filters called on the returned :class:`pyvista.Pipeline` are
+        connected as VTK algorithms and only executed when its output is
+        requested.
+
+        Parameters
+        ----------
+        release_data : bool, optional
+            Release the intermediate outputs once they are consumed.
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> from pyvista import examples
+        >>> dataset = examples.load_uniform()
+        >>> pipe = dataset.pipeline().clip().contour([100, 200])
+        >>> iso = pipe.update()
+
+        """
+        return pyvista.Pipeline(dataset, release_data=release_data)
+
+
 
 class CompositeFilters(object):
     """An internal class to manage filtes/algorithms for composite datasets.
@@ -1454,6 +1976,7 @@ class CompositeFilters(object):
         consumer such as a polydata mapper to extract geometry from all blocks
         and append them to one polydata object.
         """
+        _apply_pending(composite)
         gf = vtk.vtkCompositeDataGeometryFilter()
         gf.SetInputData(composite)
         gf.Update()
@@ -1470,7 +1993,8 @@ class CompositeFilters(object):
 
         """
         alg = vtk.vtkAppendFilter()
-        for block in composite:
+        for _, _, _, block in composite.leaves():
+            _apply_pending(block)
             alg.AddInputData(block)
         alg.SetMergePoints(merge_points)
         alg.Update()
@@ -1516,6 +2040,9 @@ class CompositeFilters(object):
     triangulate = DataSetFilters.triangulate
 
 
+    pipeline = DataSetFilters.pipeline
+
+
     def outline(composite, generate_faces=False, nested=False):
         """Produces an outline of the full extent for the all blocks in this
         composite dataset.
@@ -1551,3 +2078,8 @@ class CompositeFilters(object):
             return DataSetFilters.outline_corners(composite, factor=factor)
         box = pyvista.Box(bounds=composite.bounds)
         return box.outline_corners(factor=factor)
+
+
+# outputs are only memoized while the filter cache is enabled
+memoize_filters(DataSetFilters, exclude=('plot_over_line', 'pipeline'))
+memoize_filters(CompositeFilters, exclude=('pipeline', ))
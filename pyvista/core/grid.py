@@ -12,12 +12,130 @@ from vtk.util.numpy_support import numpy_to_vtk, vtk_to_numpy
 import pyvista
 
 from .common import Common
+from .copy_on_write import detach_shared
 from .filters import _get_output
 
 log = logging.getLogger(__name__)
 log.setLevel('CRITICAL')
 
 
+def _run_length(values, columns):
+    """Number of leading rows of ``values`` whose ``columns`` equal those
+    of the first row, found by a doubling search so that only about twice
+    the run is read.
+    """
+    n = len(values)
+    first = values[0, columns]
+    start, length = 1, 1
+    while start < n:
+        stop = min(start + length, n)
+        block = values[start:stop][:, columns]
+        changed = np.flatnonzero(np.any(block != first, axis=1))
+        if changed.size:
+            return start + changed[0]
+        start, length = stop, length*2
+    return n
+
+
+def _structured_axis_vectors(points):
+    """Read the coordinates along each axis of structured points.
+
+    The points must be ordered with one axis varying fastest, then
+    another, as produced by ``np.meshgrid(...).ravel()`` or VTK.  The axis
+    vectors are read from strided views of ``points`` and every point is
+    then checked against them with one vectorized comparison per axis.
+
+    Returns
+    -------
+    axes : list(np.ndarray) or None
+        Strictly increasing x, y and z coordinates or ``None`` if the
+        points are not ordered this way.
+
+    """
+    n = len(points)
+    if n == 0:
+        return None
+    remaining = [0, 1, 2]
+    axes = [None, None, None]
+    strides = [0, 0, 0]
+    stride = 1
+    while stride < n and remaining:
+        step = points[stride] - points[0]
+        changed = [ax for ax in remaining if step[ax] != 0]
+        if len(changed) != 1:
+            return None
+        ax = changed[0]
+        remaining.remove(ax)
+        view = points[::stride]
+        count = _run_length(view, remaining) if remaining else len(view)
+        axes[ax] = np.array(view[:count, ax])
+        strides[ax] = stride
+        stride *= count
+    if stride != n:
+        return None
+    for ax in remaining:
+        axes[ax] = np.array(points[:1, ax])
+    if any(np.any(np.diff(axis) <= 0) for axis in axes):
+        return None
+
+    # check all points against the axes
+    for ax in range(3):
+        if strides[ax]:
+            coords = points[:, ax].reshape(-1, len(axes[ax]), strides[ax])
+            expected = axes[ax][np.newaxis, :, np.newaxis]
+        else:
+            coords, expected = points[:, ax], axes[ax][0]
+        if not np.array_equal(coords, np.broadcast_to(expected, coords.shape)):
+            return None
+    return axes
+
+
+def _axis_vectors(points):
+    """Return the coordinates along each axis of points on a rectilinear
+    lattice, reading them from strided views when possible.
+    """
+    if not isinstance(points, np.ndarray):
+        raise TypeError('Points must be a numpy array')
+    if points.ndim != 2 or points.shape[1] != 3:
+        raise ValueError('Points must be an (N, 3) array')
+    axes = _structured_axis_vectors(points)
+    if axes is None:
+        # arbitrary order
+        axes = [np.unique(points[:, i]) for i in range(3)]
+        if np.prod([len(axis) for axis in axes]) != len(points):
+            raise ValueError('Points do not lie on a rectilinear lattice: '
+                             '{} unique coordinates along the axes can not '
+                             'make {} points.'.format([len(axis) for axis in axes],
+                                                      len(points)))
+    return axes
+
+
+def _axis_vector(coords):
+    """Return the 1-D coordinates of one axis from a 1-D array or a
+    meshgrid array in which they vary along a single dimension.
+    """
+    coords = np.asarray(coords)
+    if coords.ndim <= 1:
+        coords = coords.ravel()
+        if np.all(np.diff(coords) > 0):
+            return coords
+        return np.unique(coords)
+    for dim in range(coords.ndim):
+        index = [0]*coords.ndim
+        index[dim] = slice(None)
+        vector = coords[tuple(index)]
+        if len(vector) > 1 and np.all(np.diff(vector) > 0):
+            # the coordinates must only vary along this dimension
+            shape = [1]*coords.ndim
+            shape[dim] = len(vector)
+            if np.array_equal(coords, np.broadcast_to(vector.reshape(shape),
+                                                      coords.shape)):
+                return vector
+            break
+    # fall back to a full search
+    return np.unique(coords.ravel())
+
+
 class Grid(Common):
     """A class full of common methods for non-pointset grids """
 
@@ -49,6 +167,20 @@ class Grid(Common):
         attrs.append(("Dimensions", self.dimensions, "{:d}, {:d}, {:d}"))
         return attrs
 
+    def _apply_transform(self, t, transform_vectors):
+        """Scale and translate the grid along its axes in place"""
+        scale = np.diag(t)[:3]
+        if not pyvista.is_affine(t) or np.any(t[:3, :3] != np.diag(scale)) \
+           or np.any(scale <= 0):
+            raise ValueError('A {} can only be scaled and translated along '
+                             'its axes.  Transform a StructuredGrid or '
+                             'UnstructuredGrid cast of it instead.'
+                             .format(type(self).__name__))
+        self._scale_translate(scale, t[:3, 3])
+        self.Modified()
+        if transform_vectors:
+            self._transform_vectors(t)
+
 
 class RectilinearGrid(vtkRectilinearGrid, Grid):
     """
@@ -120,8 +252,9 @@ class RectilinearGrid(vtkRectilinearGrid, Grid):
         """
         Create VTK rectilinear grid directly from numpy arrays. Each array
         gives the uniques coordinates of the mesh along each axial direction.
-        To help ensure you are using this correctly, we take the unique values
-        of each argument.
+        Increasing 1-D arrays are used as is; the coordinates of ``np.meshgrid``
+        arrays are read along the dimension in which they vary and the unique
+        values are taken of anything else.
 
         Parameters
         ----------
@@ -134,9 +267,9 @@ class RectilinearGrid(vtkRectilinearGrid, Grid):
         z : np.ndarray
             Coordinates of the nodes in z direction.
         """
-        x = np.unique(x.ravel())
-        y = np.unique(y.ravel())
-        z = np.unique(z.ravel())
+        x = _axis_vector(x)
+        y = _axis_vector(y)
+        z = _axis_vector(z)
         # Set the cell spacings and dimensions of the grid
         self.SetDimensions(len(x), len(y), len(z))
         self.SetXCoordinates(numpy_to_vtk(x))
@@ -147,6 +280,7 @@ class RectilinearGrid(vtkRectilinearGrid, Grid):
     @property
     def points(self):
         """ returns a pointer to the points as a numpy object """
+        self.apply_pending_transform()
         x = vtk_to_numpy(self.GetXCoordinates())
         y = vtk_to_numpy(self.GetYCoordinates())
         z = vtk_to_numpy(self.GetZCoordinates())
@@ -156,18 +290,37 @@ class RectilinearGrid(vtkRectilinearGrid, Grid):
     @points.setter
     def points(self, points):
         """ set points without copying """
-        if not isinstance(points, np.ndarray):
-            raise TypeError('Points must be a numpy array')
-        # get the unique coordinates along each axial direction
-        x = np.unique(points[:,0])
-        y = np.unique(points[:,1])
-        z = np.unique(points[:,2])
+        # the new points replace any lazy transformation of the old ones
+        self._pending_transform = None
+        # get the coordinates along each axial direction
+        x, y, z = _axis_vectors(points)
         # Set the vtk coordinates
         self._from_arrays(x, y, z)
         #self._point_ref = points
         self.Modified()
 
 
+    def _geometry_key(self):
+        """Identify the coordinate arrays of this grid"""
+        return tuple(coords.GetAddressAsString('vtkDataArray')
+                     if coords is not None else None
+                     for coords in (self.GetXCoordinates(), self.GetYCoordinates(),
+                                    self.GetZCoordinates()))
+
+    def _scale_translate(self, scale, offset):
+        """Scale and translate the coordinates in place"""
+        for i, (get, set_) in enumerate(((self.GetXCoordinates, self.SetXCoordinates),
+                                         (self.GetYCoordinates, self.SetYCoordinates),
+                                         (self.GetZCoordinates, self.SetZCoordinates))):
+            coords = vtk_to_numpy(get())
+            if coords.dtype not in (np.float32, np.float64):
+                set_(numpy_to_vtk(coords.astype(np.float64), deep=True))
+                coords = vtk_to_numpy(get())
+            detach_shared(self, get())
+            coords *= scale[i]
+            coords += offset[i]
+            get().Modified()
+
     def _load_file(self, filename):
         """
         Load a rectilinear grid from a file.
@@ -230,6 +383,7 @@ class RectilinearGrid(vtkRectilinearGrid, Grid):
         only with the legacy writer.
 
         """
+        self.apply_pending_transform()
         filename = os.path.abspath(os.path.expanduser(filename))
         # Use legacy writer if vtk is in filename
         if '.vtk' in filename:
@@ -406,6 +560,7 @@ class UniformGrid(vtkImageData, Grid):
     @property
     def points(self):
         """ returns a pointer to the points as a numpy object """
+        self.apply_pending_transform()
         # Get grid dimensions
         nx, ny, nz = self.dimensions
         nx -= 1
@@ -424,18 +579,23 @@ class UniformGrid(vtkImageData, Grid):
     @points.setter
     def points(self, points):
         """ set points without copying """
-        if not isinstance(points, np.ndarray):
-            raise TypeError('Points must be a numpy array')
-        # get the unique coordinates along each axial direction
-        x = np.unique(points[:,0])
-        y = np.unique(points[:,1])
-        z = np.unique(points[:,2])
-        nx, ny, nz = len(x), len(y), len(z)
-        # TODO: this needs to be tested (unique might return a tuple)
-        dx, dy, dz = np.unique(np.diff(x)), np.unique(np.diff(y)), np.unique(np.diff(z))
-        ox, oy, oz = np.min(x), np.min(y), np.min(z)
+        # the new points replace any lazy transformation of the old ones
+        self._pending_transform = None
+        # get the coordinates along each axial direction
+        axes = _axis_vectors(points)
+        dims, spacing, origin = [], [], []
+        for i, axis in enumerate(axes):
+            steps = np.diff(axis)
+            step = steps[0] if steps.size else 1.0
+            if not np.allclose(steps, step, rtol=1E-6, atol=0):
+                raise ValueError('Points are not uniformly spaced along the '
+                                 '{} axis; use a RectilinearGrid instead.'
+                                 .format('xyz'[i]))
+            dims.append(len(axis))
+            spacing.append(step)
+            origin.append(axis[0])
         # Build the vtk object
-        self._from_specs((nx,ny,nz), (dx,dy,dz), (ox,oy,oz))
+        self._from_specs(dims, spacing, origin)
         #self._point_ref = points
         self.Modified()
 
@@ -502,6 +662,7 @@ class UniformGrid(vtkImageData, Grid):
         only with the legacy writer.
 
         """
+        self.apply_pending_transform()
         filename = os.path.abspath(os.path.expanduser(filename))
         # Use legacy writer if vtk is in filename
         if '.vtk' in filename:
@@ -561,6 +722,17 @@ class UniformGrid(vtkImageData, Grid):
         self.Modified()
 
 
+    def _geometry_key(self):
+        """Identify the geometry of this grid by its dimensions, origin
+        and spacing
+        """
+        return (self.GetDimensions(), self.GetOrigin(), self.GetSpacing())
+
+    def _scale_translate(self, scale, offset):
+        """Scale and translate the origin and spacing"""
+        self.SetOrigin(scale*np.array(self.GetOrigin()) + offset)
+        self.SetSpacing(scale*np.array(self.GetSpacing()))
+
     def _get_attrs(self):
         """An internal helper for the representation methods"""
         attrs = Grid._get_attrs(self)
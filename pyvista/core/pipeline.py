@@ -0,0 +1,237 @@
+"""
+Lazy chains of filters connected as a VTK pipeline
+
+Each filter of a :class:`Pipeline` is a VTK algorithm connected to the
+previous one with ``SetInputConnection``.  Nothing is computed until the
+output is requested, and VTK then only re-executes the stages that are
+downstream of a modified dataset or parameter.
+
+Example
+-------
+
+>>> import pyvista
+>>> from pyvista import examples
+>>> dataset = examples.load_uniform()
+>>> pipe = dataset.pipeline().clip(normal='x').threshold([100, 500])
+>>> subset = pipe.update()
+>>> pipe.stages[0].set_parameters(normal='y')
+>>> subset = pipe.update()  # the clip and the threshold are rerun
+
+"""
+import vtk
+
+try:
+    from vtk.util.vtkAlgorithm import VTKPythonAlgorithmBase
+except ImportError:  # pragma: no cover
+    VTKPythonAlgorithmBase = None
+
+from pyvista.utilities import wrap
+
+# filters returning arrays or plotting, which cannot be chained
+_UNCHAINABLE = ('pipeline', 'plot_over_line', 'probe', 'sample_over_lines')
+
+
+def _filter_names():
+    """Names of the filters that may be chained in a pipeline"""
+    from .filters import CompositeFilters, DataSetFilters
+    names = set()
+    for cls in (DataSetFilters, CompositeFilters):
+        names.update(name for name, func in vars(cls).items()
+                     if not name.startswith('_') and callable(func))
+    return names.difference(_UNCHAINABLE)
+
+
+class PipelineStage(VTKPythonAlgorithmBase or object):
+    """A filter of a :class:`Pipeline`, as a VTK algorithm.
+
+    The stage calls the PyVista filter ``name`` on its input whenever VTK
+    executes it, which only happens when the output is requested and the
+    input or the parameters were modified since the last execution.
+
+    Parameters
+    ----------
+    name : str
+        Name of the filter, e.g. ``'clip'``.
+
+    args : tuple
+        Positional arguments of the filter after the dataset.
+
+    kwargs : dict
+        Keyword arguments of the filter.
+
+    """
+
+    def __init__(self, name, args=(), kwargs=None):
+        VTKPythonAlgorithmBase.__init__(self, nInputPorts=1, nOutputPorts=1,
+                                        outputType='vtkDataObject')
+        self.name = name
+        self.args = tuple(args)
+        self.parameters = dict(kwargs or {})
+        self.n_executions = 0
+        self._error = None
+
+    def __repr__(self):
+        return '{}({!r}, {}, {})'.format(type(self).__name__, self.name,
+                                         self.args, self.parameters)
+
+    def set_parameters(self, *args, **kwargs):
+        """Update the arguments of the filter.
+
+        Positional arguments replace the previous ones when given and
+        keyword arguments are merged into the previous ones.  Only this
+        stage and the stages downstream of it are executed again.
+        """
+        if kwargs.get('inplace', False):
+            raise ValueError('Filters of a pipeline cannot be applied inplace.')
+        if args:
+            self.args = tuple(args)
+        self.parameters.update(kwargs)
+        self.Modified()
+
+    def FillInputPortInformation(self, port, info):
+        """Accept any dataset, including composite datasets"""
+        info.Set(vtk.vtkAlgorithm.INPUT_REQUIRED_DATA_TYPE(), 'vtkDataObject')
+        return 1
+
+    def RequestDataObject(self, request, inInfo, outInfo):
+        """The type of the output is only known once the filter ran"""
+        return 1
+
+    def RequestData(self, request, inInfo, outInfo):
+        """Run the filter on the input and shallow copy its result"""
+        self._error = None
+        self.n_executions += 1
+        try:
+            # filters may activate the scalars of their input, which
+            # must not modify the upstream output
+            source = vtk.vtkDataObject.GetData(inInfo[0])
+            data = source.NewInstance()
+            data.ShallowCopy(source)
+            data = wrap(data)
+            result = getattr(data, self.name)(*self.args, **self.parameters)
+            if not isinstance(result, vtk.vtkDataObject):
+                raise TypeError('Filter ({}) does not return a dataset.'
+                                .format(self.name))
+        except Exception as e:
+            # exceptions cannot propagate through VTK, they are raised
+            # again by ``Pipeline.update``
+            self._error = e
+            return 0
+        info = outInfo.GetInformationObject(0)
+        output = info.Get(vtk.vtkDataObject.DATA_OBJECT())
+        if output is None or output.GetClassName() != result.GetClassName():
+            output = result.NewInstance()
+            info.Set(vtk.vtkDataObject.DATA_OBJECT(), output)
+        output.ShallowCopy(result)
+        return 1
+
+
+class Pipeline(object):
+    """A lazy chain of filters applied to a dataset.
+
+    Filters are chained by calling them on the pipeline, which returns a
+    new pipeline ending with that filter.  Pipelines sharing their first
+    stages share the outputs of those stages.
+
+    Parameters
+    ----------
+    source : pyvista.Common or pyvista.MultiBlock
+        Input of the first filter.  Modifying it causes the whole
+        pipeline to be executed again on the next update.
+
+    release_data : bool, optional
+        Release the output of each stage once the following stage has
+        consumed it.  This reduces the peak memory use of long
+        pipelines, but changing a parameter then executes the upstream
+        stages again.
+
+    """
+
+    def __init__(self, source, release_data=False):
+        if VTKPythonAlgorithmBase is None:  # pragma: no cover
+            raise ImportError('Pipelines require vtk.util.vtkAlgorithm, '
+                              'available from VTK 7.')
+        if not isinstance(source, vtk.vtkDataObject):
+            raise TypeError('Source must be a dataset, not {}'
+                            .format(type(source).__name__))
+        self.source = source
+        self.release_data = release_data
+        self._producer = vtk.vtkTrivialProducer()
+        self._producer.SetOutput(source)
+        self._stages = ()
+
+    def __repr__(self):
+        chain = ''.join('.{}(...)'.format(stage.name) for stage in self._stages)
+        return '{}({}){}'.format(type(self).__name__,
+                                 type(self.source).__name__, chain)
+
+    def __dir__(self):
+        return sorted(set(dir(type(self))).union(self.__dict__, _filter_names()))
+
+    def __getattr__(self, name):
+        if name.startswith('_') or name not in _filter_names():
+            raise AttributeError("'{}' object has no attribute '{}'"
+                                 .format(type(self).__name__, name))
+
+        def add_stage(*args, **kwargs):
+            return self.add_stage(name, *args, **kwargs)
+        add_stage.__name__ = name
+        return add_stage
+
+    @property
+    def stages(self):
+        """The filters of this pipeline, first to last"""
+        return list(self._stages)
+
+    def add_stage(self, filter_name, *args, **kwargs):
+        """Return a new pipeline applying the filter ``filter_name`` to the
+        output of this one.  Also available as ``pipeline.<filter_name>(...)``.
+        """
+        if filter_name not in _filter_names():
+            raise ValueError('Filter ({}) cannot be used in a pipeline.'
+                             .format(filter_name))
+        if kwargs.get('inplace', False):
+            raise ValueError('Filters of a pipeline cannot be applied inplace.')
+        stage = PipelineStage(filter_name, args, kwargs)
+        if self._stages:
+            stage.SetInputConnection(self._stages[-1].GetOutputPort())
+        else:
+            stage.SetInputConnection(self._producer.GetOutputPort())
+        if self.release_data:
+            stage.GetExecutive().SetReleaseDataFlag(0, 1)
+        pipeline = object.__new__(type(self))
+        pipeline.__dict__.update(self.__dict__)
+        pipeline._stages = self._stages + (stage, )
+        return pipeline
+
+    def update(self):
+        """Execute the modified stages and return the output.
+
+        Returns
+        -------
+        output : pyvista.Common or pyvista.MultiBlock
+            Shallow copy of the output of the last stage, which is not
+            affected by later updates.
+
+        """
+        if hasattr(self.source, 'apply_pending_transform'):
+            self.source.apply_pending_transform()
+        if not self._stages:
+            return wrap(self.source)
+        last = self._stages[-1]
+        last.Update()
+        for stage in self._stages:
+            if stage._error is not None:
+                error, stage._error = stage._error, None
+                # make sure the stage runs again on the next update
+                stage.Modified()
+                raise error
+        output = last.GetOutputDataObject(0)
+        copy = output.NewInstance()
+        copy.ShallowCopy(output)
+        return wrap(copy)
+
+    @property
+    def output(self):
+        """The output of the pipeline, see :func:`Pipeline.update`"""
+        return self.update()
@@ -7,12 +7,7 @@ import os
 
 import numpy as np
 import vtk
-from vtk import (VTK_HEXAHEDRON, VTK_PYRAMID, VTK_QUAD,
-                 VTK_QUADRATIC_HEXAHEDRON, VTK_QUADRATIC_PYRAMID,
-                 VTK_QUADRATIC_QUAD, VTK_QUADRATIC_TETRA,
-                 VTK_QUADRATIC_TRIANGLE, VTK_QUADRATIC_WEDGE, VTK_TETRA,
-                 VTK_TRIANGLE, VTK_WEDGE, vtkPolyData, vtkStructuredGrid,
-                 vtkUnstructuredGrid)
+from vtk import vtkPolyData, vtkStructuredGrid, vtkUnstructuredGrid
 from vtk.util.numpy_support import (numpy_to_vtk, numpy_to_vtkIdTypeArray,
                                     vtk_to_numpy)
 
@@ -26,6 +21,51 @@ log = logging.getLogger(__name__)
 log.setLevel('CRITICAL')
 
 
+def _id_list(ind):
+    """Copy the indices ``ind`` into a ``vtkIdList`` without a Python loop"""
+    # the indices are read back by VTK as the points of a single cell
+    vtkcells = pyvista.cell_array(ind, [0, len(ind)])
+    id_list = vtk.vtkIdList()
+    if hasattr(vtkcells, 'GetCellAtId'):
+        vtkcells.GetCellAtId(0, id_list)
+    else:
+        vtkcells.GetCell(0, id_list)
+    return id_list
+
+
+def _gather_attributes(source, target, ind):
+    """Add the arrays of the ``vtkDataSetAttributes`` ``source`` at the
+    indices ``ind`` to ``target``, keeping their types and the active
+    attributes.
+    """
+    id_list = None
+    for i in range(source.GetNumberOfArrays()):
+        vtkarr = source.GetAbstractArray(i)
+        if vtkarr is None:
+            continue
+        if isinstance(vtkarr, vtk.vtkDataArray) and not isinstance(vtkarr, vtk.vtkBitArray):
+            # the gathered values are a new array referenced by VTK
+            gathered = numpy_to_vtk(vtk_to_numpy(vtkarr)[ind], deep=False,
+                                    array_type=vtkarr.GetDataType())
+        else:
+            # arrays that numpy cannot view, like strings and bits
+            if id_list is None:
+                id_list = _id_list(ind)
+            gathered = vtkarr.NewInstance()
+            gathered.SetNumberOfComponents(vtkarr.GetNumberOfComponents())
+            gathered.SetNumberOfTuples(id_list.GetNumberOfIds())
+            vtkarr.GetTuples(id_list, gathered)
+        gathered.SetName(vtkarr.GetName())
+        for c in range(vtkarr.GetNumberOfComponents()):
+            if vtkarr.GetComponentName(c):
+                gathered.SetComponentName(c, vtkarr.GetComponentName(c))
+        target.AddArray(gathered)
+    for attribute in range(vtk.vtkDataSetAttributes.NUM_ATTRIBUTES):
+        active = source.GetAbstractAttribute(attribute)
+        if active is not None and active.GetName():
+            target.SetActiveAttribute(active.GetName(), attribute)
+
+
 class PointSet(Common):
     """PyVista's equivalant of vtk.vtkPointSet. This holds methods common to
     PolyData and UnstructuredGrid.
@@ -47,6 +87,7 @@ class PointSet(Common):
             Coordinates for the center of mass.
 
         """
+        self.apply_pending_transform()
         alg = vtk.vtkCenterOfMass()
         alg.SetInputDataObject(self)
         alg.SetUseScalarsAsWeights(scalars_weight)
@@ -504,7 +545,6 @@ class PolyData(vtkPolyData, PointSet):
 
         # Create curve filter and compute curvature
         curvefilter = vtk.vtkCurvatures()
-        curvefilter.SetInputData(self)
         if curv_type == 'mean':
             curvefilter.SetCurvatureTypeToMean()
         elif curv_type == 'gaussian':
@@ -516,11 +556,14 @@ class PolyData(vtkPolyData, PointSet):
         else:
             raise Exception('Curv_Type must be either "Mean", ' +
                             '"Gaussian", "Maximum", or "Minimum"')
-        curvefilter.Update()
 
-        # Compute and return curvature
-        curv = _get_output(curvefilter)
-        return vtk_to_numpy(curv.GetPointData().GetScalars())
+        def compute():
+            curvefilter.SetInputData(self)
+            curvefilter.Update()
+            curv = _get_output(curvefilter)
+            return vtk_to_numpy(curv.GetPointData().GetScalars())
+
+        return self._get_derived(('curvature', curv_type), compute)
 
     def save(self, filename, binary=True):
         """
@@ -544,6 +587,7 @@ class PolyData(vtkPolyData, PointSet):
         Binary files write much faster than ASCII and have a smaller
         file size.
         """
+        self.apply_pending_transform()
         filename = os.path.abspath(os.path.expanduser(filename))
         file_mode = True
         # Check filetype
@@ -1134,14 +1178,18 @@ class PolyData(vtkPolyData, PointSet):
     @property
     def point_normals(self):
         """ Point normals """
-        mesh = self.compute_normals(cell_normals=False, inplace=False)
-        return mesh.point_arrays['Normals']
+        def compute():
+            mesh = self.compute_normals(cell_normals=False, inplace=False)
+            return np.asarray(mesh.point_arrays['Normals'])
+        return self._get_derived('point_normals', compute)
 
     @property
     def cell_normals(self):
         """ Cell normals  """
-        mesh = self.compute_normals(point_normals=False, inplace=False)
-        return mesh.cell_arrays['Normals']
+        def compute():
+            mesh = self.compute_normals(point_normals=False, inplace=False)
+            return np.asarray(mesh.cell_arrays['Normals'])
+        return self._get_derived('cell_normals', compute)
 
     @property
     def face_normals(self):
@@ -1332,9 +1380,11 @@ class PolyData(vtkPolyData, PointSet):
             Total area of the mesh.
 
         """
-        mprop = vtk.vtkMassProperties()
-        mprop.SetInputData(self)
-        return mprop.GetSurfaceArea()
+        def compute():
+            mprop = vtk.vtkMassProperties()
+            mprop.SetInputData(self)
+            return mprop.GetSurfaceArea()
+        return self._get_derived('area', compute)
 
     @property
     def volume(self):
@@ -1347,9 +1397,11 @@ class PolyData(vtkPolyData, PointSet):
             Total volume of the mesh.
 
         """
-        mprop = vtk.vtkMassProperties()
-        mprop.SetInputData(self.tri_filter())
-        return mprop.GetVolume()
+        def compute():
+            mprop = vtk.vtkMassProperties()
+            mprop.SetInputData(self.tri_filter())
+            return mprop.GetVolume()
+        return self._get_derived('volume', compute)
 
     @property
     def obbTree(self):
@@ -1359,35 +1411,49 @@ class PolyData(vtkPolyData, PointSet):
         hierarchical tree structure of such boxes, where deeper levels of OBB
         confine smaller regions of space.
         """
-        if not hasattr(self, '_obbTree'):
-            self._obbTree = vtk.vtkOBBTree()
-            self._obbTree.SetDataSet(self)
-            self._obbTree.BuildLocator()
-
-        return self._obbTree
+        def compute():
+            obb_tree = vtk.vtkOBBTree()
+            obb_tree.SetDataSet(self)
+            obb_tree.BuildLocator()
+            return obb_tree
+        return self._get_derived('obbTree', compute)
 
 
-    def geodesic(self, start_vertex, end_vertex, inplace=False):
+    def geodesic(self, start_vertex, end_vertex=None, inplace=False):
         """
         Calculates the geodesic path betweeen two vertices using Dijkstra's
         algorithm.
 
         Parameters
         ----------
-        start_vertex : int
-            Vertex index indicating the start point of the geodesic segment.
+        start_vertex : int or np.ndarray
+            Vertex index indicating the start point of the geodesic
+            segment, or a ``(n, 2)`` array of start and end vertex pairs.
+            Pairs are computed over the cached :attr:`edge_graph`, which
+            requires ``scipy``.
 
-        end_vertex : int
+        end_vertex : int, optional
             Vertex index indicating the end point of the geodesic segment.
+            Required with a single ``start_vertex`` and not used when
+            pairs are given.
 
         Returns
         -------
         output : pyvista.PolyData
             PolyData object consisting of the line segment between the two given
-            vertices.
+            vertices, or of one line per pair.  The line of a pair without
+            a path between its vertices is empty.
 
         """
-        if start_vertex < 0 or end_vertex > self.n_points - 1:
+        if end_vertex is None:
+            if np.ndim(start_vertex) == 0:
+                raise ValueError('`end_vertex` is required with a single start '
+                                 'vertex.  To compute several paths, pass an '
+                                 '(n, 2) array of start and end vertex pairs.')
+            return self._geodesic_paths(start_vertex, inplace=inplace)
+
+        if not 0 <= start_vertex < self.n_points or \
+           not 0 <= end_vertex < self.n_points:
             raise IndexError('Invalid indices.')
 
         dijkstra = vtk.vtkDijkstraGraphGeodesicPath()
@@ -1406,6 +1472,28 @@ class PolyData(vtkPolyData, PointSet):
         else:
             return output
 
+    def _geodesic_paths(self, pairs, chunk_size=64, inplace=False):
+        """Build one line of mesh vertices per geodesic pair"""
+        _, paths = self._geodesic_batch(pairs, chunk_size, predecessors=True)
+        # pairs without a path keep an empty line so that line i is pair i
+        empty = np.empty(0, pyvista.ID_TYPE)
+        paths = [empty if path is None else path for path in paths]
+        ids = np.hstack([empty] + paths).astype(pyvista.ID_TYPE)
+        point_ids, inverse = np.unique(ids, return_inverse=True)
+        sizes = np.array([len(path) for path in paths], pyvista.ID_TYPE)
+        lines = np.insert(inverse.astype(pyvista.ID_TYPE),
+                          np.cumsum(np.hstack(([0], sizes[:-1]))), sizes)
+        output = pyvista.PolyData()
+        output.points = self.points[point_ids]
+        vtkcells = vtk.vtkCellArray()
+        vtkcells.SetCells(len(paths), numpy_to_vtkIdTypeArray(lines, deep=True))
+        output.SetLines(vtkcells)
+        output.point_arrays['vtkOriginalPointIds'] = point_ids
+        if inplace:
+            self.overwrite(output)
+        else:
+            return output
+
 
     def geodesic_distance(self, start_vertex, end_vertex):
         """
@@ -1426,6 +1514,10 @@ class PolyData(vtkPolyData, PointSet):
             Length of the geodesic segment.
 
         """
+        try:
+            return self.geodesic_distances([[start_vertex, end_vertex]])[0]
+        except ImportError:
+            pass
         path = self.geodesic(start_vertex, end_vertex)
         sizes = path.compute_cell_sizes(length=True, area=False, volume=False)
         distance = np.sum(sizes['Length'])
@@ -1433,6 +1525,158 @@ class PolyData(vtkPolyData, PointSet):
         del sizes
         return distance
 
+    def _cell_edges(self, vtkcells, closed=False, strips=False):
+        """Return the vertex pairs of the edges of a vtkCellArray"""
+        n_cells = vtkcells.GetNumberOfCells()
+        if n_cells == 0:
+            return np.empty((0, 2), pyvista.ID_TYPE)
+        cells = vtk_to_numpy(vtkcells.GetData())
+        locations = pyvista.cell_array_locations(vtkcells)
+        ids = cells[pyvista.cell_id_mask(cells, locations)]
+        sizes = cells[locations]
+        starts = np.zeros(n_cells, pyvista.ID_TYPE)
+        np.cumsum(sizes[:-1], out=starts[1:])
+        # position of each vertex within its cell
+        pos = np.arange(ids.size) - np.repeat(starts, sizes)
+        last = pos == np.repeat(sizes - 1, sizes)
+        edges = [np.column_stack((ids[:-1][~last[:-1]], ids[1:][~last[:-1]]))]
+        if closed:
+            edges.append(np.column_stack((ids[last], ids[starts])))
+        if strips:
+            second = pos < np.repeat(sizes - 2, sizes)
+            edges.append(np.column_stack((ids[:-2][second[:-2]], ids[2:][second[:-2]])))
+        return np.vstack(edges)
+
+    @property
+    def edge_graph(self):
+        """Sparse graph of the mesh edges weighted by their length.
+
+        The graph is a symmetric ``scipy.sparse.csr_matrix`` of shape
+        ``(n_points, n_points)`` built from the edges of the lines,
+        polygons and triangle strips.  It is cached until the points or
+        cells of the mesh are modified.  Requires ``scipy``.
+        """
+        try:
+            from scipy import sparse
+        except ImportError:
+            raise ImportError('scipy must be available to build the edge graph.')
+        parts = (self.GetPoints(), self.GetLines(), self.GetPolys(), self.GetStrips())
+        mtime = max([part.GetMTime() for part in parts if part is not None] + [0])
+        if hasattr(self, '_edge_graph') and self._edge_graph[0] == mtime:
+            return self._edge_graph[1]
+
+        n = self.n_points
+        if not n:
+            graph = sparse.csr_matrix((0, 0))
+            self._edge_graph = (mtime, graph)
+            return graph
+        edges = [np.empty((0, 2), pyvista.ID_TYPE)]
+        for vtkcells, kwargs in ((parts[1], {}), (parts[2], {'closed': True}),
+                                 (parts[3], {'strips': True})):
+            if vtkcells is not None:
+                edges.append(self._cell_edges(vtkcells, **kwargs))
+        edges = np.vstack(edges)
+        # keep each undirected edge once
+        edges.sort(axis=1)
+        edges = edges[edges[:, 0] != edges[:, 1]]
+        edges = np.unique(edges[:, 0]*n + edges[:, 1])
+        edges = np.column_stack((edges // n, edges % n))
+        points = self.points
+        length = np.linalg.norm(points[edges[:, 0]] - points[edges[:, 1]], axis=1)
+        graph = sparse.coo_matrix((np.hstack((length, length)),
+                                   (np.hstack((edges[:, 0], edges[:, 1])),
+                                    np.hstack((edges[:, 1], edges[:, 0])))),
+                                  shape=(n, n)).tocsr()
+        self._edge_graph = (mtime, graph)
+        return graph
+
+    def geodesic_distance_field(self, sources, limit=np.inf):
+        """
+        Calculates the geodesic distance of every vertex to the closest of
+        one or more source vertices.
+
+        All sources are handled by a single Dijkstra run over the cached
+        :attr:`edge_graph`.  Requires ``scipy``.
+
+        Parameters
+        ----------
+        sources : int or np.ndarray
+            Index or indices of the source vertices.
+
+        limit : float, optional
+            Stop the search at this distance.  Vertices further away
+            are set to ``np.inf``.
+
+        Returns
+        -------
+        distance : np.ndarray
+            Distance along the mesh edges of each vertex to the closest
+            source.  ``np.inf`` for unreachable vertices.
+
+        """
+        from scipy.sparse.csgraph import dijkstra
+        sources = np.unique(np.asarray(sources, dtype=pyvista.ID_TYPE).ravel())
+        if sources.size == 0:
+            raise ValueError('At least one source vertex is required.')
+        if sources[0] < 0 or sources[-1] > self.n_points - 1:
+            raise IndexError('Invalid indices.')
+        return dijkstra(self.edge_graph, directed=False, indices=sources,
+                        min_only=True, limit=limit)
+
+    def _geodesic_batch(self, pairs, chunk_size, predecessors=False):
+        """Run Dijkstra once per unique start vertex of ``pairs``"""
+        from scipy.sparse.csgraph import dijkstra
+        pairs = np.asarray(pairs, dtype=pyvista.ID_TYPE)
+        if pairs.ndim != 2 or pairs.shape[1] != 2:
+            raise ValueError('Vertex pairs must be an (n, 2) array of start '
+                             'and end vertices, not of shape {}.'
+                             .format(pairs.shape))
+        if pairs.size and (pairs.min() < 0 or pairs.max() > self.n_points - 1):
+            raise IndexError('Invalid indices.')
+        graph = self.edge_graph
+        starts, inverse = np.unique(pairs[:, 0], return_inverse=True)
+        distances = np.empty(len(pairs))
+        paths = [None]*len(pairs)
+        for i in range(0, len(starts), chunk_size):
+            result = dijkstra(graph, directed=False, indices=starts[i:i + chunk_size],
+                              return_predecessors=predecessors)
+            dist, pred = result if predecessors else (result, None)
+            for j in np.nonzero((inverse >= i) & (inverse < i + chunk_size))[0]:
+                row = inverse[j] - i
+                distances[j] = dist[row, pairs[j, 1]]
+                if predecessors and np.isfinite(distances[j]):
+                    # walk back from the end to the start vertex
+                    path = [pairs[j, 1]]
+                    while path[-1] != pairs[j, 0]:
+                        path.append(pred[row, path[-1]])
+                    paths[j] = path
+        return distances, paths
+
+    def geodesic_distances(self, pairs, chunk_size=64):
+        """
+        Calculates the geodesic distances between many pairs of vertices.
+
+        The cached :attr:`edge_graph` is reused and Dijkstra runs once
+        per unique start vertex.  Requires ``scipy``.
+
+        Parameters
+        ----------
+        pairs : np.ndarray
+            ``(n, 2)`` array of start and end vertex indices.
+
+        chunk_size : int, optional
+            Number of start vertices searched at once.  Each search
+            holds ``chunk_size * n_points`` distances in memory.
+
+        Returns
+        -------
+        distances : np.ndarray
+            Length of the geodesic path of each pair, ``np.inf`` when the
+            vertices are not connected.
+
+        """
+        return self._geodesic_batch(pairs, chunk_size)[0]
+
     def ray_trace(self, origin, end_point, first_point=False, plot=False,
                   off_screen=False):
         """
@@ -1527,10 +1771,11 @@ class PolyData(vtkPolyData, PointSet):
                            normals[::use_every], mag=mag)
         return plotter.show()
 
-    def remove_points(self, remove, mode='any', keep_scalars=True, inplace=False):
+    def remove_points(self, remove, mode='any', keep_scalars=True,
+                      inplace=False, return_cell_map=False):
         """
-        Rebuild a mesh by removing points.  Only valid for
-        all-triangle meshes.
+        Rebuild a mesh by removing points.  Vertices, lines, polygons
+        and strips of any size are supported.
 
         Parameters
         ----------
@@ -1539,8 +1784,8 @@ class PolyData(vtkPolyData, PointSet):
             removed.  Otherwise, it is treated as a list of indices.
 
         mode : str, optional
-            When 'all', only faces containing all points flagged for
-            removal will be removed.  Default 'all'
+            When 'all', only cells containing all points flagged for
+            removal will be removed.  Default 'any'
 
         keep_scalars : bool, optional
             When True, point and cell scalars will be passed on to the
@@ -1549,18 +1794,26 @@ class PolyData(vtkPolyData, PointSet):
         inplace : bool, optional
             Updates mesh in-place while returning nothing.
 
+        return_cell_map : bool, optional
+            Also return the indices of the remaining cells relative to
+            the original mesh.
+
         Returns
         -------
         mesh : pyvista.PolyData
             Mesh without the points flagged for removal.  Not returned
-            when inplace=False.
+            when inplace=True.
 
         ridx : np.ndarray
             Indices of new points relative to the original mesh.  Not
-            returned when inplace=False.
+            returned when inplace=True.
+
+        cell_ids : np.ndarray
+            Indices of new cells relative to the original mesh.  Only
+            returned when return_cell_map=True and inplace=False.
 
         """
-        if isinstance(remove, list):
+        if isinstance(remove, (list, range)):
             remove = np.asarray(remove)
 
         if remove.dtype == np.bool:
@@ -1571,44 +1824,81 @@ class PolyData(vtkPolyData, PointSet):
             remove_mask = np.zeros(self.n_points, np.bool)
             remove_mask[remove] = True
 
-        try:
-            f = self.faces.reshape(-1, 4)[:, 1:]
-        except:
-            raise Exception('Mesh must consist of only triangles')
-
-        vmask = remove_mask.take(f)
         if mode == 'all':
-            fmask = ~(vmask).all(1)
+            reduce_flags = np.logical_and
+        elif mode == 'any':
+            reduce_flags = np.logical_or
         else:
-            fmask = ~(vmask).any(1)
-
-        # Regenerate face and point arrays
-        uni = np.unique(f.compress(fmask, 0), return_inverse=True)
-        new_points = self.points.take(uni[0], 0)
-
-        nfaces = fmask.sum()
-        faces = np.empty((nfaces, 4), dtype=pyvista.ID_TYPE)
-        faces[:, 0] = 3
-        faces[:, 1:] = np.reshape(uni[1], (nfaces, 3))
-
-        newmesh = PolyData(new_points, faces, deep=True)
-        ridx = uni[0]
+            raise ValueError('mode must be either "any" or "all"')
+
+        # flag the cells of each cell array, which are numbered in the
+        # order verts, lines, polys and strips
+        gathered = []
+        cell_ids = []
+        n_cells = 0
+        used = np.zeros(self.n_points, np.bool)
+        for vtkcells in (self.GetVerts(), self.GetLines(), self.GetPolys(),
+                         self.GetStrips()):
+            if vtkcells is None or not vtkcells.GetNumberOfCells():
+                gathered.append(None)
+                continue
+            cells = vtk_to_numpy(vtkcells.GetData())
+            locations = pyvista.cell_array_locations(vtkcells)
+            ids = cells[pyvista.cell_id_mask(cells, locations)]
+            sizes = cells[locations]
+            starts = np.zeros(len(sizes), pyvista.ID_TYPE)
+            np.cumsum(sizes[:-1], out=starts[1:])
+            # cells without points are dropped
+            keep = sizes > 0
+            if ids.size:
+                keep[keep] = ~reduce_flags.reduceat(remove_mask[ids], starts[keep])
+            kept = keep.nonzero()[0]
+            new_cells, new_locations = pyvista.gather_cells(cells, locations, kept)
+            new_ids = pyvista.cell_id_mask(new_cells, new_locations)
+            used[new_cells[new_ids]] = True
+            gathered.append((new_cells, new_ids, len(kept)))
+            cell_ids.append(kept + n_cells)
+            n_cells += len(sizes)
+
+        # compact and renumber the remaining points
+        ridx = used.nonzero()[0]
+        new_index = np.cumsum(used, dtype=pyvista.ID_TYPE) - 1
+        newmesh = PolyData()
+        newmesh.points = self.points[ridx]
+        setters = (newmesh.SetVerts, newmesh.SetLines, newmesh.SetPolys,
+                   newmesh.SetStrips)
+        for setter, item in zip(setters, gathered):
+            if item is None:
+                continue
+            new_cells, new_ids, ncells = item
+            new_cells[new_ids] = new_index[new_cells[new_ids]]
+            vtkcells = vtk.vtkCellArray()
+            vtkcells.SetCells(ncells, numpy_to_vtkIdTypeArray(new_cells, deep=True))
+            setter(vtkcells)
+        if cell_ids:
+            cell_ids = np.concatenate(cell_ids)
+        else:
+            cell_ids = np.empty(0, pyvista.ID_TYPE)
 
-        # Add scalars back to mesh if requested
+        # Add scalars back to mesh if requested, sharing the arrays left
+        # untouched
         if keep_scalars:
-            for key in self.point_arrays:
-                newmesh.point_arrays[key] = self.point_arrays[key][ridx]
-
-            for key in self.cell_arrays:
-                try:
-                    newmesh.cell_arrays[key] = self.cell_arrays[key][fmask]
-                except:
-                    log.warning('Unable to pass cell key %s onto reduced mesh' %
-                                key)
+            if ridx.size == self.n_points:
+                newmesh.GetPointData().ShallowCopy(self.GetPointData())
+            else:
+                _gather_attributes(self.GetPointData(), newmesh.GetPointData(), ridx)
+            if cell_ids.size == self.n_cells:
+                newmesh.GetCellData().ShallowCopy(self.GetCellData())
+            else:
+                _gather_attributes(self.GetCellData(), newmesh.GetCellData(), cell_ids)
+            newmesh._point_bool_array_names = list(self._point_bool_array_names)
+            newmesh._cell_bool_array_names = list(self._cell_bool_array_names)
 
         # Return vtk surface and reverse indexing array
         if inplace:
             self.overwrite(newmesh)
+        elif return_cell_map:
+            return newmesh, ridx, cell_ids
         else:
             return newmesh, ridx
 
@@ -1724,8 +2014,10 @@ class PointGrid(PointSet):
         Computes volume by extracting the external surface and
         computing interior volume
         """
-        surf = self.extract_surface().tri_filter()
-        return surf.volume
+        def compute():
+            surf = self.extract_surface().tri_filter()
+            return surf.volume
+        return self._get_derived('volume', compute)
 
     def extract_surface(self, pass_pointid=True, pass_cellid=True, inplace=False):
         """
@@ -2036,6 +2328,7 @@ class UnstructuredGrid(vtkUnstructuredGrid, PointGrid):
         one system may not be readable on other systems.  Binary can be used
         only ".vtk" files
         """
+        self.apply_pending_transform()
         filename = os.path.abspath(os.path.expanduser(filename))
         # Use legacy writer if vtk is in filename
         if '.vtk' in filename:
@@ -2062,27 +2355,137 @@ class UnstructuredGrid(vtkUnstructuredGrid, PointGrid):
         """ returns a pointer to the cells as a numpy object """
         return vtk_to_numpy(self.GetCells().GetData())
 
+    @property
+    def cells_dict(self):
+        """The point ids of the cells grouped by cell type.
+
+        Returns a dictionary mapping each cell type to an
+        ``(n_cells_of_type, n_points_per_cell)`` array.  The arrays are
+        read-only and cached until the points or cells are modified.
+
+        Examples
+        --------
+        >>> import vtk
+        >>> from pyvista import examples
+        >>> hexbeam = examples.load_hexbeam()
+        >>> hexbeam.cells_dict[vtk.VTK_HEXAHEDRON].shape
+        (40, 8)
+
+        """
+        def compute():
+            cells = self.cells if self.GetCells() is not None else np.empty(0)
+            locations = pyvista.cell_locations(self)
+            celltypes = self.celltypes if self.n_cells else np.empty(0, np.uint8)
+            cells_dict = {}
+            for cell_type in np.unique(celltypes):
+                loc = locations[celltypes == cell_type]
+                sizes = cells[loc]
+                size = sizes[0]
+                if np.any(sizes != size):
+                    raise ValueError('Cells of type %d have different numbers '
+                                     'of points; use cells and offset instead'
+                                     % cell_type)
+                ids = cells[loc[:, np.newaxis] + np.arange(1, size + 1)]
+                ids.setflags(write=False)
+                cells_dict[int(cell_type)] = ids
+            return cells_dict
+        return self._get_derived('cells_dict', compute)
+
+    @classmethod
+    def from_cells_dict(cls, points, cells_dict, deep=False):
+        """Create an unstructured grid from its points and the point ids of
+        its cells grouped by cell type.
+
+        Parameters
+        ----------
+        points : np.ndarray
+            ``(n_points, 3)`` array of point locations.
+
+        cells_dict : dict
+            Maps each cell type to an ``(n_cells_of_type,
+            n_points_per_cell)`` array of point ids, like
+            :attr:`UnstructuredGrid.cells_dict`.  Cells are numbered by
+            increasing cell type, whatever the order of the dictionary.
+
+        deep : bool, optional
+            Copy the points rather than referencing them.
+
+        Returns
+        -------
+        grid : pyvista.UnstructuredGrid
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> import vtk
+        >>> import pyvista
+        >>> points = np.random.random((5, 3))
+        >>> cells = {vtk.VTK_TETRA: np.array([[0, 1, 2, 3], [1, 2, 3, 4]])}
+        >>> grid = pyvista.UnstructuredGrid.from_cells_dict(points, cells)
+        >>> grid.n_cells
+        2
+
+        """
+        points = np.asarray(points)
+        blocks, offsets, celltypes = [], [], []
+        start = 0
+        for cell_type in sorted(cells_dict):
+            ids = np.asarray(cells_dict[cell_type])
+            if ids.ndim != 2:
+                raise ValueError('The point ids of cell type %s must be an '
+                                 '(n_cells, n_points_per_cell) array'
+                                 % cell_type)
+            if ids.size and (ids.min() < 0 or ids.max() >= len(points)):
+                raise ValueError('Point ids of cell type %s out of range'
+                                 % cell_type)
+            n_cells, size = ids.shape
+            block = np.empty((n_cells, size + 1), pyvista.ID_TYPE)
+            block[:, 0] = size
+            block[:, 1:] = ids
+            blocks.append(block.ravel())
+            offsets.append(start + np.arange(n_cells, dtype=pyvista.ID_TYPE)*(size + 1))
+            celltypes.append(np.full(n_cells, cell_type, np.uint8))
+            start += block.size
+
+        grid = cls()
+        if not blocks:
+            grid.points = points
+            return grid
+        grid._from_arrays(np.concatenate(offsets), np.concatenate(blocks),
+                          np.concatenate(celltypes), points, deep=deep)
+        return grid
+
     @property
     def quality(self):
         """
-        Returns cell quality
+        Computes the minimum scaled jacobian of each cell.  Cells that have
+        values below 0 are invalid for a finite element analysis.
+
+        Returns
+        -------
+        cellquality : np.ndarray
+            Minimum scaled jacobian of each cell.  Ranges from -1 to 1.
+            ``NaN`` for cells of unsupported types.
+
+        Notes
+        -----
+        See :func:`pyvista.cell_quality` for other metrics.
+
         """
-        try:
-            import pyansys
-        except:
-            raise Exception('Install pyansys for this function')
-        return pyansys.CellQuality(self)
+        return pyvista.cell_quality(self, 'scaled_jacobian')
 
-    def linear_copy(self, deep=False):
+    def linear_copy(self, deep=False, compact_points=False):
         """
         Returns a copy of the input unstructured grid containing only
-        linear cells.  Converts the following cell types to their
-        linear equivalents.
+        linear cells.  Quadratic, biquadratic, triquadratic, Lagrange
+        and Bezier cells are converted to their linear equivalents by
+        keeping only their corner points, for example:
 
         - VTK_QUADRATIC_TETRA      --> VTK_TETRA
         - VTK_QUADRATIC_PYRAMID    --> VTK_PYRAMID
         - VTK_QUADRATIC_WEDGE      --> VTK_WEDGE
         - VTK_QUADRATIC_HEXAHEDRON --> VTK_HEXAHEDRON
+        - VTK_LAGRANGE_HEXAHEDRON  --> VTK_HEXAHEDRON
 
         Parameters
         ----------
@@ -2090,49 +2493,59 @@ class UnstructuredGrid(vtkUnstructuredGrid, PointGrid):
             When True, makes a copy of the points array.  Default
             False.  Cells and cell types are always copied.
 
+        compact_points : bool, optional
+            Also remove the points no longer used by any cell, like the
+            mid-side points, along with their point data.  The points
+            are then always copied.
+
         Returns
         -------
         grid : pyvista.UnstructuredGrid
             UnstructuredGrid containing only linear cells.
         """
-        lgrid = self.copy(deep)
-
-        # grab the vtk object
-        vtk_cell_type = numpy_to_vtk(self.GetCellTypesArray(), deep=True)
-        celltype = vtk_to_numpy(vtk_cell_type)
-        celltype[celltype == VTK_QUADRATIC_TETRA] = VTK_TETRA
-        celltype[celltype == VTK_QUADRATIC_PYRAMID] = VTK_PYRAMID
-        celltype[celltype == VTK_QUADRATIC_WEDGE] = VTK_WEDGE
-        celltype[celltype == VTK_QUADRATIC_HEXAHEDRON] = VTK_HEXAHEDRON
-
-        # track quad mask for later
-        quad_quad_mask = celltype == VTK_QUADRATIC_QUAD
-        celltype[quad_quad_mask] = VTK_QUAD
-
-        quad_tri_mask = celltype == VTK_QUADRATIC_TRIANGLE
-        celltype[quad_tri_mask] = VTK_TRIANGLE
-
-        vtk_offset = self.GetCellLocationsArray()
-        cells = vtk.vtkCellArray()
-        cells.DeepCopy(self.GetCells())
-        lgrid.SetCells(vtk_cell_type, vtk_offset, cells)
-
-        # fixing bug with display of quad cells
-        if np.any(quad_quad_mask):
-            quad_offset = lgrid.offset[quad_quad_mask]
-            base_point = lgrid.cells[quad_offset + 1]
-            lgrid.cells[quad_offset + 5] = base_point
-            lgrid.cells[quad_offset + 6] = base_point
-            lgrid.cells[quad_offset + 7] = base_point
-            lgrid.cells[quad_offset + 8] = base_point
-
-        if np.any(quad_tri_mask):
-            tri_offset = lgrid.offset[quad_tri_mask]
-            base_point = lgrid.cells[tri_offset + 1]
-            lgrid.cells[tri_offset + 4] = base_point
-            lgrid.cells[tri_offset + 5] = base_point
-            lgrid.cells[tri_offset + 6] = base_point
+        if not self.n_cells:
+            return self.copy(deep)
+        linear_types, n_corners = pyvista.linear_cell_tables()
+        celltypes = self.celltypes
+        cells = self.cells
+        locations = pyvista.cell_locations(self)
+
+        # number of points kept in each cell, its corners come first
+        sizes = cells[locations]
+        corners = n_corners[celltypes]
+        new_sizes = np.where(corners > 0, corners, sizes)
+        new_sizes[corners < 0] //= 2
+
+        # gather the corners of all cells at once
+        new_locations = np.zeros(len(locations), pyvista.ID_TYPE)
+        np.cumsum(new_sizes[:-1] + 1, out=new_locations[1:])
+        total = int(new_sizes.sum()) + len(new_sizes)
+        within = np.arange(total, dtype=pyvista.ID_TYPE) - np.repeat(new_locations, new_sizes + 1)
+        new_cells = cells[np.repeat(locations, new_sizes + 1) + within]
+        new_cells[new_locations] = new_sizes
+        new_types = linear_types[celltypes]
+
+        if compact_points:
+            ids = pyvista.cell_id_mask(new_cells, new_locations)
+            used = np.zeros(self.n_points, dtype=bool)
+            used[new_cells[ids]] = True
+            point_ids = used.nonzero()[0]
+            new_cells[ids] = (np.cumsum(used, dtype=pyvista.ID_TYPE) - 1)[new_cells[ids]]
+            lgrid = UnstructuredGrid()
+            lgrid.points = self.points[point_ids]
+            _gather_attributes(self.GetPointData(), lgrid.GetPointData(), point_ids)
+            lgrid.GetCellData().ShallowCopy(self.GetCellData())
+            lgrid.GetFieldData().ShallowCopy(self.GetFieldData())
+            lgrid.copy_meta_from(self)
+            lgrid._point_bool_array_names = list(self._point_bool_array_names)
+            lgrid._cell_bool_array_names = list(self._cell_bool_array_names)
+        else:
+            lgrid = self.copy(deep)
 
+        vtkcells = vtk.vtkCellArray()
+        vtkcells.SetCells(len(new_sizes), numpy_to_vtkIdTypeArray(new_cells, deep=True))
+        lgrid.SetCells(numpy_to_vtk(new_types, deep=True),
+                       numpy_to_vtkIdTypeArray(new_locations, deep=True), vtkcells)
         return lgrid
 
     @property
@@ -2145,58 +2558,113 @@ class UnstructuredGrid(vtkUnstructuredGrid, PointGrid):
         """Get Cell Locations Array"""
         return vtk_to_numpy(self.GetCellLocationsArray())
 
-    def extract_cells(self, ind):
+    def extract_cells(self, ind, return_index_maps=False):
         """
         Returns a subset of the grid
 
+        The connectivity, cell types, points and arrays are gathered
+        directly, so the points and arrays keep their precision.
+        Selections holding polyhedra are extracted with
+        ``vtkExtractCells``, which keeps their faces.
+
         Parameters
         ----------
         ind : np.ndarray
-            Numpy array of cell indices to be extracted.
+            Numpy array of cell indices or boolean mask of the cells to be
+            extracted.  Like ``vtkExtractCells``, each cell is extracted
+            once and the cells keep their order in this grid.
+
+        return_index_maps : bool, optional
+            Also return the indices of the extracted points and cells in
+            this grid.
 
         Returns
         -------
         subgrid : pyvista.UnstructuredGrid
             Subselected grid
 
-        """
-        if not isinstance(ind, np.ndarray):
-            ind = np.array(ind, np.ndarray)
+        point_ids : np.ndarray
+            Index of each point of ``subgrid`` in this grid.  Only
+            returned when ``return_index_maps`` is True.
 
+        cell_ids : np.ndarray
+            Index of each cell of ``subgrid`` in this grid.  Only
+            returned when ``return_index_maps`` is True.
+
+        """
+        ind = np.asarray(ind)
         if ind.dtype == np.bool:
+            if ind.size != self.n_cells:
+                raise ValueError('Cell mask must have one value per cell')
             ind = ind.nonzero()[0].astype(pyvista.ID_TYPE)
-
-        if ind.dtype != pyvista.ID_TYPE:
-            ind = ind.astype(pyvista.ID_TYPE)
-
-        if not ind.flags.c_contiguous:
-            ind = np.ascontiguousarray(ind)
-
-        vtk_ind = numpy_to_vtkIdTypeArray(ind, deep=False)
-
-        # Create selection objects
-        selectionNode = vtk.vtkSelectionNode()
-        selectionNode.SetFieldType(vtk.vtkSelectionNode.CELL)
-        selectionNode.SetContentType(vtk.vtkSelectionNode.INDICES)
-        selectionNode.SetSelectionList(vtk_ind)
-
-        selection = vtk.vtkSelection()
-        selection.AddNode(selectionNode)
-
-        # extract
-        extract_sel = vtk.vtkExtractSelection()
-        extract_sel.SetInputData(0, self)
-        extract_sel.SetInputData(1, selection)
-        extract_sel.Update()
-        subgrid = _get_output(extract_sel)
-
-        # extracts only in float32
-        if self.points.dtype is not np.dtype('float32'):
-            ind = subgrid.point_arrays['vtkOriginalPointIds']
-            subgrid.points = self.points[ind]
-
+        else:
+            ind = ind.astype(pyvista.ID_TYPE).ravel()
+            if ind.size and (ind.min() < -self.n_cells or ind.max() >= self.n_cells):
+                raise IndexError('Cell indices out of range for this grid.')
+            ind[ind < 0] += self.n_cells
+            # each cell is extracted once and in order, like vtkExtractCells
+            ind = np.unique(ind)
+
+        subgrid = UnstructuredGrid()
+        if ind.size and np.any(self.celltypes[ind] == vtk.VTK_POLYHEDRON):
+            # the faces of polyhedra are extracted by VTK
+            point_ids, ind = self._extract_cell_structure(ind, subgrid)
+        elif ind.size:
+            ids, offsets = pyvista.cell_point_ids(self)
+            ids, offsets = pyvista.gather_cell_point_ids(ids, offsets, ind)
+            # compact and renumber the points used by the cells
+            used = np.zeros(self.n_points, dtype=bool)
+            used[ids] = True
+            point_ids = used.nonzero()[0].astype(pyvista.ID_TYPE)
+            new_ids = np.cumsum(used, dtype=pyvista.ID_TYPE) - 1
+            vtkcells = pyvista.cell_array(new_ids[ids], offsets)
+            celltypes = numpy_to_vtk(self.celltypes[ind], deep=False,
+                                     array_type=vtk.VTK_UNSIGNED_CHAR)
+            subgrid.SetPoints(pyvista.vtk_points(self.points[point_ids], deep=False))
+            if hasattr(vtkcells, 'GetOffsetsArray'):
+                subgrid.SetCells(celltypes, vtkcells)
+            else:
+                locations = offsets[:-1] + np.arange(ind.size, dtype=pyvista.ID_TYPE)
+                subgrid.SetCells(celltypes, numpy_to_vtkIdTypeArray(locations, deep=False),
+                                 vtkcells)
+        else:
+            point_ids = np.empty(0, pyvista.ID_TYPE)
+
+        _gather_attributes(self.GetPointData(), subgrid.GetPointData(), point_ids)
+        _gather_attributes(self.GetCellData(), subgrid.GetCellData(), ind)
+        subgrid.GetFieldData().ShallowCopy(self.GetFieldData())
+        subgrid.copy_meta_from(self)
+        subgrid._point_bool_array_names = list(self._point_bool_array_names)
+        subgrid._cell_bool_array_names = list(self._cell_bool_array_names)
+        if return_index_maps:
+            return subgrid, point_ids, ind
         return subgrid
 
+    def _extract_cell_structure(self, ind, subgrid):
+        """Set the points and cells of ``subgrid`` to the cells ``ind`` of
+        this grid with ``vtkExtractCells``, which keeps the faces of
+        polyhedra.  Returns the indices of the extracted points and cells
+        in this grid.
+        """
+        source = vtk.vtkUnstructuredGrid()
+        source.CopyStructure(self)
+        for data, n in ((source.GetPointData(), self.n_points),
+                        (source.GetCellData(), self.n_cells)):
+            original = numpy_to_vtkIdTypeArray(np.arange(n, dtype=pyvista.ID_TYPE),
+                                               deep=True)
+            original.SetName('vtkOriginalIds')
+            data.AddArray(original)
+        alg = vtk.vtkExtractCells()
+        alg.SetInputData(source)
+        alg.SetCellList(_id_list(ind))
+        alg.Update()
+        output = alg.GetOutput()
+        subgrid.CopyStructure(output)
+        point_ids = vtk_to_numpy(output.GetPointData().GetArray('vtkOriginalIds'))
+        cell_ids = vtk_to_numpy(output.GetCellData().GetArray('vtkOriginalIds'))
+        return (point_ids.astype(pyvista.ID_TYPE),
+                cell_ids.astype(pyvista.ID_TYPE))
+
     def extract_selection_points(self, ind):
         """Returns a subset of the grid that contains the cells that
         contain any of the point indices.
@@ -2216,30 +2684,15 @@ class UnstructuredGrid(vtkUnstructuredGrid, PointGrid):
         except:
             raise Exception('indices must be either a mask, array, list, or iterable')
 
-        # Convert to vtk indices
-        if ind.dtype == np.bool:
-            ind = ind.nonzero()[0]
-
-        if ind.dtype != np.int64:
-            ind = ind.astype(np.int64)
-        vtk_ind = numpy_to_vtkIdTypeArray(ind, deep=True)
-
-        # Create selection objects
-        selectionNode = vtk.vtkSelectionNode()
-        selectionNode.SetFieldType(vtk.vtkSelectionNode.POINT)
-        selectionNode.SetContentType(vtk.vtkSelectionNode.INDICES)
-        selectionNode.SetSelectionList(vtk_ind)
-        selectionNode.GetProperties().Set(vtk.vtkSelectionNode.CONTAINING_CELLS(), 1)
-
-        selection = vtk.vtkSelection()
-        selection.AddNode(selectionNode)
-
-        # extract
-        extract_sel = vtk.vtkExtractSelection()
-        extract_sel.SetInputData(0, self)
-        extract_sel.SetInputData(1, selection)
-        extract_sel.Update()
-        return UnstructuredGrid(extract_sel.GetOutput())
+        point_mask = np.zeros(self.n_points, dtype=bool)
+        point_mask[ind] = True
+        ids, offsets = pyvista.cell_point_ids(self)
+        cell_mask = np.zeros(self.n_cells, dtype=bool)
+        nonempty = offsets[1:] > offsets[:-1]
+        if ids.size:
+            cell_mask[nonempty] = np.logical_or.reduceat(point_mask[ids],
+                                                         offsets[:-1][nonempty])
+        return self.extract_cells(cell_mask)
 
     def merge(self, grid=None, merge_points=True, inplace=False,
               main_has_priority=True):
@@ -2465,6 +2918,7 @@ class StructuredGrid(vtkStructuredGrid, PointGrid):
         only with the legacy writer.
 
         """
+        self.apply_pending_transform()
         filename = os.path.abspath(os.path.expanduser(filename))
         # Use legacy writer if vtk is in filename
         if '.vtk' in filename:
@@ -2527,7 +2981,7 @@ class StructuredGrid(vtkStructuredGrid, PointGrid):
 
         Notes
         -----
-        Requires pyansys to be installed.
+        See :func:`pyvista.cell_quality` for other metrics.
 
         """
-        return UnstructuredGrid(self).quality
+        return pyvista.cell_quality(self, 'scaled_jacobian')
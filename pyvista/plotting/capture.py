@@ -0,0 +1,155 @@
+"""An internal module for reading pixels from a render window
+"""
+import numpy as np
+import vtk
+from vtk.util import numpy_support as VN
+
+
+BUFFER_TYPES = {
+    'rgb': lambda ifilter: ifilter.SetInputBufferTypeToRGB(),
+    'rgba': lambda ifilter: ifilter.SetInputBufferTypeToRGBA(),
+    'depth': lambda ifilter: ifilter.SetInputBufferTypeToZBuffer(),
+}
+
+
+class ImageCapture(object):
+    """Persistent reader of the color and depth buffers of a render window.
+
+    A single ``vtkWindowToImageFilter`` is kept per buffer type and its
+    output is exposed as a NumPy view, so repeated captures create no
+    intermediate datasets and at most one copy into the caller's array.
+
+    Parameters
+    ----------
+    ren_win : vtk.vtkRenderWindow
+        Render window to read from.
+
+    Examples
+    --------
+    Read color and depth into preallocated arrays
+
+    >>> import numpy as np
+    >>> import pyvista
+    >>> plotter = pyvista.Plotter(off_screen=True)  # doctest:+SKIP
+    >>> _ = plotter.add_mesh(pyvista.Sphere())  # doctest:+SKIP
+    >>> _ = plotter.show(auto_close=False)  # doctest:+SKIP
+    >>> capture = plotter.image_capture  # doctest:+SKIP
+    >>> width, height = plotter.window_size  # doctest:+SKIP
+    >>> rgb = np.empty((height, width, 3), np.uint8)  # doctest:+SKIP
+    >>> depth = np.empty((height, width), np.float32)  # doctest:+SKIP
+    >>> _ = capture.rgb(out=rgb)  # doctest:+SKIP
+    >>> _ = capture.depth(out=depth)  # doctest:+SKIP
+
+    """
+
+    def __init__(self, ren_win):
+        self.ren_win = ren_win
+        self._filters = {}
+
+    def _get_filter(self, buffer):
+        if buffer not in BUFFER_TYPES:
+            raise ValueError('Buffer type ({}) must be one of {}'
+                             .format(buffer, list(BUFFER_TYPES.keys())))
+        if buffer not in self._filters:
+            ifilter = vtk.vtkWindowToImageFilter()
+            ifilter.SetInput(self.ren_win)
+            ifilter.ReadFrontBufferOff()
+            BUFFER_TYPES[buffer](ifilter)
+            self._filters[buffer] = ifilter
+        return self._filters[buffer]
+
+    def view(self, buffer='rgb', flip=True, step=1):
+        """Capture a buffer and return a view of the filter output.
+
+        The view is only valid until the next capture of the same
+        buffer type; copy it or use :func:`rgb`, :func:`rgba` or
+        :func:`depth` with ``out`` to keep the pixels.
+
+        Parameters
+        ----------
+        buffer : str, optional
+            ``'rgb'``, ``'rgba'`` or ``'depth'``.
+
+        flip : bool, optional
+            Flip the rows so the first row is the top of the window.
+            Disable to get VTK's bottom-up row order.
+
+        step : int, optional
+            Downsample by taking every ``step`` pixel in each direction.
+
+        Returns
+        -------
+        image : np.ndarray
+            ``(height, width, n)`` view for color or ``(height, width)``
+            view for depth.
+
+        """
+        ifilter = self._get_filter(buffer)
+        ifilter.Modified()
+        ifilter.Update()
+        image = ifilter.GetOutput()
+        width, height, _ = image.GetDimensions()
+        pixels = VN.vtk_to_numpy(image.GetPointData().GetScalars())
+        if buffer == 'depth':
+            pixels = pixels.reshape(height, width)
+        else:
+            pixels = pixels.reshape(height, width, -1)
+        if flip:
+            pixels = pixels[::-1]
+        step = int(step)
+        if step > 1:
+            pixels = pixels[::step, ::step]
+        elif step < 1:
+            raise ValueError('step must be a positive integer')
+        return pixels
+
+    def _read(self, buffer, out, flip, step):
+        pixels = self.view(buffer, flip=flip, step=step)
+        if out is None:
+            return pixels.copy()
+        if out.shape != pixels.shape:
+            raise ValueError('Output array shape {} does not match the '
+                             'captured image shape {}'
+                             .format(out.shape, pixels.shape))
+        np.copyto(out, pixels, casting='same_kind')
+        return out
+
+    def rgb(self, out=None, flip=True, step=1):
+        """Read the RGB color buffer.
+
+        Parameters
+        ----------
+        out : np.ndarray, optional
+            ``(height, width, 3)`` array to write into.  A new
+            ``np.uint8`` array is returned when not given.
+
+        flip : bool, optional
+            Flip the rows so the first row is the top of the window.
+
+        step : int, optional
+            Downsample by taking every ``step`` pixel in each direction.
+
+        """
+        return self._read('rgb', out, flip, step)
+
+    def rgba(self, out=None, flip=True, step=1):
+        """Read the RGBA color buffer.  See :func:`rgb`."""
+        return self._read('rgba', out, flip, step)
+
+    def depth(self, out=None, flip=True, step=1):
+        """Read the Z-buffer.
+
+        Parameters
+        ----------
+        out : np.ndarray, optional
+            ``(height, width)`` floating point array to write into.  A
+            new ``np.float32`` array is returned when not given.
+
+        flip : bool, optional
+            Flip the rows so the first row is the top of the window.
+
+        step : int, optional
+            Downsample by taking every ``step`` pixel in each direction.
+
+        """
+        return self._read('depth', out, flip, step)
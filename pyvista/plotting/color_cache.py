@@ -0,0 +1,74 @@
+"""An internal module for caching scalars mapped to RGBA colors
+"""
+import collections
+
+import vtk
+
+from .theme import rcParams
+
+COLOR_ARRAY_NAME = '__rgba'
+
+
+class ColorCache(object):
+    """Least recently used cache of ``vtkUnsignedCharArray`` RGBA colors.
+
+    Entries are keyed on the array name, its field and a key of the
+    lookup table (colormap, color range, ...) and are invalidated when
+    the source array is modified.
+
+    Parameters
+    ----------
+    max_items : int, optional
+        Maximum number of color arrays held.  Defaults to
+        ``rcParams['color_cache_size']``.
+
+    """
+
+    def __init__(self, max_items=None):
+        if max_items is None:
+            max_items = rcParams['color_cache_size']
+        self.max_items = max_items
+        self._items = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    @property
+    def nbytes(self):
+        """Total size of the cached color arrays in bytes"""
+        return sum(colors.GetActualMemorySize()*1024
+                   for _, colors in self._items.values())
+
+    def clear(self):
+        """Drop all cached colors"""
+        self._items.clear()
+
+    def get(self, key, array, lut):
+        """Return the RGBA colors of ``array`` mapped through ``lut``.
+
+        The colors are computed on a miss or when ``array`` was
+        modified since they were cached.  ``lut`` must already have its
+        range set.
+        """
+        mtime = array.GetMTime()
+        if key in self._items:
+            cached_mtime, colors = self._items.pop(key)
+            if cached_mtime == mtime:
+                self._items[key] = (cached_mtime, colors)
+                return colors
+        colors = lut.MapScalars(array, vtk.VTK_COLOR_MODE_MAP_SCALARS, -1)
+        colors.SetName(COLOR_ARRAY_NAME)
+        self._items[key] = (mtime, colors)
+        while len(self._items) > max(self.max_items, 1):
+            self._items.popitem(last=False)
+        return colors
+
+
+def get_color_cache(mesh):
+    """Return the color cache stored on ``mesh``, creating it if needed"""
+    if not hasattr(mesh, '_color_cache'):
+        mesh._color_cache = ColorCache()
+    return mesh._color_cache
@@ -0,0 +1,151 @@
+"""An internal module for writing movie and GIF frames asynchronously
+"""
+import queue
+import time
+from threading import Thread
+
+import numpy as np
+
+
+class FrameWriter(object):
+    """Pipelines frames from a render window to an ``imageio`` writer.
+
+    Frames are copied into a pool of preallocated buffers and pushed
+    onto a bounded queue that is consumed by a single encoder thread.
+    Capturing the next frame therefore overlaps with encoding the
+    previous ones, and the producer only blocks once ``queue_size``
+    frames are waiting to be encoded.
+
+    Parameters
+    ----------
+    writer : imageio writer
+        Any object with ``append_data`` and ``close`` methods.
+
+    queue_size : int, optional
+        Maximum number of frames waiting to be encoded.
+
+    """
+
+    def __init__(self, writer, queue_size=8):
+        if queue_size < 1:
+            raise ValueError('queue_size must be at least 1')
+        self.writer = writer
+        self.queue_size = int(queue_size)
+        self._frames = queue.Queue(maxsize=self.queue_size)
+        self._free = None
+        self._shape = None
+        self._dtype = None
+        self._error = None
+        self._n_frames = 0
+        self._n_captured = 0
+        self._capture_time = 0.0
+        self._encode_time = 0.0
+        self._latency = 0.0
+        self._start_time = None
+        self._last_time = None
+        self._closed = False
+        self._thread = Thread(target=self._encode)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _encode(self):
+        """Encoder loop run on the background thread"""
+        while True:
+            item = self._frames.get()
+            if item is None:
+                self._frames.task_done()
+                return
+            buf, tqueued = item
+            try:
+                if self._error is None:
+                    tstart = time.time()
+                    self.writer.append_data(buf)
+                    tend = time.time()
+                    self._encode_time += tend - tstart
+                    self._latency += tend - tqueued
+                    self._n_frames += 1
+                    self._last_time = tend
+            except BaseException as e:
+                self._error = e
+            finally:
+                self._free.put(buf)
+                self._frames.task_done()
+
+    def _check_error(self):
+        if self._error is not None:
+            raise RuntimeError('Frame encoder failed: {}'.format(self._error))
+
+    def _allocate(self, shape, dtype):
+        """(Re)allocate the buffer pool for frames of a new shape"""
+        # wait until the encoder has released every buffer of the old size
+        self._frames.join()
+        self._shape = shape
+        self._dtype = dtype
+        self._free = queue.Queue()
+        for _ in range(self.queue_size + 1):
+            self._free.put(np.empty(shape, dtype=dtype))
+
+    def write(self, image):
+        """Copy an image into a free buffer and queue it for encoding.
+
+        ``image`` may be any view (e.g. a flipped view of a VTK array)
+        as it is copied before this method returns.
+        """
+        if self._closed:
+            raise RuntimeError('FrameWriter has been closed.')
+        self._check_error()
+        tstart = time.time()
+        if self._start_time is None:
+            self._start_time = tstart
+        if image.shape != self._shape or image.dtype != self._dtype:
+            self._allocate(image.shape, image.dtype)
+        buf = self._free.get()
+        np.copyto(buf, image)
+        self._capture_time += time.time() - tstart
+        self._n_captured += 1
+        self._frames.put((buf, time.time()))
+
+    def flush(self):
+        """Block until every queued frame has been encoded"""
+        self._frames.join()
+        self._check_error()
+
+    def close(self):
+        """Encode any remaining frames, stop the encoder and close the writer"""
+        if self._closed:
+            return
+        self._closed = True
+        self._frames.put(None)
+        self._thread.join()
+        self.writer.close()
+        self._check_error()
+
+    @property
+    def n_queued(self):
+        """Number of frames waiting to be encoded"""
+        return self._frames.qsize()
+
+    @property
+    def stats(self):
+        """Frame rate and latency statistics of the pipeline.
+
+        Returns
+        -------
+        stats : dict
+            ``n_frames`` encoded, the number of frames still ``queued``,
+            the overall encoded frames per second ``fps``, and the mean
+            ``capture_time``, ``encode_time`` and ``latency`` (time from
+            being queued until written) per frame in seconds.
+
+        """
+        n = self._n_frames
+        if self._start_time is None or n == 0:
+            fps = 0.0
+        else:
+            fps = n / max(self._last_time - self._start_time, 1E-12)
+        return {'n_frames': n,
+                'queued': self.n_queued,
+                'fps': fps,
+                'capture_time': self._capture_time / max(self._n_captured, 1),
+                'encode_time': self._encode_time / max(n, 1),
+                'latency': self._latency / max(n, 1)}
@@ -14,12 +14,17 @@ import vtk
 from vtk.util import numpy_support as VN
 
 import pyvista
-from pyvista.utilities import (convert_array, get_scalar, is_pyvista_obj,
-                               numpy_to_texture, raise_not_matching, wrap)
+from pyvista.utilities import (CELL_DATA_FIELD, POINT_DATA_FIELD,
+                               convert_array, get_scalar, is_pyvista_obj,
+                               numpy_to_texture, parse_field_choice,
+                               raise_not_matching, wrap)
 
+from .capture import ImageCapture
+from .color_cache import COLOR_ARRAY_NAME, get_color_cache
 from .colors import get_cmap_safe
 from .export_vtkjs import export_plotter_vtkjs
 from .mapper import make_mapper
+from .movie import FrameWriter
 from .theme import *
 from .tools import *
 
@@ -356,7 +361,7 @@ class BasePlotter(object):
                  render_lines_as_tubes=False, edge_color=None,
                  ambient=0.0, show_scalar_bar=None, nan_color=None,
                  nan_opacity=1.0, loc=None, backface_culling=False,
-                 rgb=False, categories=False, **kwargs):
+                 rgb=False, categories=False, cache_colors=False, **kwargs):
         """
         Adds a unstructured, structured, or surface mesh to the
         plotting object.
@@ -482,6 +487,12 @@ class BasePlotter(object):
             If set to ``True``, then the number of unique values in the scalar
             array will be used as the ``n_colors`` argument.
 
+        cache_colors : bool, optional
+            Map the scalars to RGBA colors once, cache them on the mesh
+            and render them as direct scalars.  Use
+            :func:`switch_scalars` to quickly switch between arrays.
+            Default False.
+
         Returns
         -------
         actor: vtk.vtkActor
@@ -490,6 +501,8 @@ class BasePlotter(object):
         # Convert the VTK data object to a pyvista wrapped object if neccessary
         if not is_pyvista_obj(mesh):
             mesh = wrap(mesh)
+        elif hasattr(mesh, 'apply_pending_transform'):
+            mesh.apply_pending_transform()
 
         ##### Parse arguments to be used for all meshes #####
 
@@ -586,7 +599,8 @@ class BasePlotter(object):
                                   edge_color=edge_color,
                                   show_scalar_bar=show_scalar_bar, nan_color=nan_color,
                                   nan_opacity=nan_opacity,
-                                  loc=loc, rgb=rgb, **kwargs)
+                                  loc=loc, rgb=rgb,
+                                  cache_colors=cache_colors, **kwargs)
                 actors.append(a)
                 if (reset_camera is None and not self.camera_set) or reset_camera:
                     cpos = self.get_default_cam_pos()
@@ -770,6 +784,13 @@ class BasePlotter(object):
                 else:
                     table.SetHueRange(0.66667, 0.0)
 
+            if cache_colors and not rgb:
+                if scalars.shape[0] == mesh.n_points:
+                    field = POINT_DATA_FIELD
+                else:
+                    field = CELL_DATA_FIELD
+                self._set_cached_colors(mesh, self.mapper, title, field, rng)
+
         else:
             self.mapper.SetScalarModeToUseFieldData()
 
@@ -1953,30 +1974,84 @@ class BasePlotter(object):
 
         self.add_actor(self.scalar_bar, reset_camera=False)
 
-    def update_scalars(self, scalars, mesh=None, render=True):
+    def _get_update_target(self, mesh):
+        """Return the mesh and mapper (if known) to update for ``mesh``.
+
+        ``mesh`` may be a dataset, an actor or the name of an actor.
+        """
+        if mesh is None:
+            return self.mesh, getattr(self, 'mapper', None)
+        if isinstance(mesh, str):
+            for renderer in self.renderers:
+                if mesh in renderer._actors:
+                    mesh = renderer._actors[mesh]
+                    break
+            else:
+                raise KeyError('Actor ({}) not found in this plotter.'.format(mesh))
+        if isinstance(mesh, vtk.vtkActor):
+            mapper = mesh.GetMapper()
+            # the input itself, not a wrapped copy, must be updated
+            return mapper.GetInputAsDataSet(), mapper
+        # the mapper of the first actor showing the dataset
+        for renderer in self.renderers:
+            for actor in renderer._actors.values():
+                mapper = actor.GetMapper() if hasattr(actor, 'GetMapper') else None
+                if mapper is None or not hasattr(mapper, 'GetInputAsDataSet'):
+                    continue
+                cached = getattr(mapper, '_cached_colors', None)
+                if mapper.GetInputAsDataSet() is mesh or \
+                   (cached is not None and cached[0] is mesh):
+                    return mesh, mapper
+        return mesh, None
+
+    def update_scalars(self, scalars, mesh=None, render=True, name=None,
+                       index=None, preference='point', update_range=False):
         """
         Updates scalars of the an object in the plotter.
 
+        The values are written into the existing VTK array and only that
+        array is marked as modified, so neither the geometry nor the
+        lookup table are touched.
+
         Parameters
         ----------
         scalars : np.ndarray
             Scalars to replace existing scalars.
 
-        mesh : vtk.PolyData or vtk.UnstructuredGrid, optional
-            Object that has already been added to the Plotter.  If
-            None, uses last added mesh.
+        mesh : vtk.PolyData, vtk.UnstructuredGrid, vtk.vtkActor, or str, optional
+            Object that has already been added to the Plotter, its actor,
+            or the name of its actor.  If None, uses last added mesh.
 
         render : bool, optional
             Forces an update to the render window.  Default True.
 
+        name : str, optional
+            Name of the array to update.  Defaults to the active scalars.
+
+        index : slice or np.ndarray, optional
+            Only update these values of the array, e.g.
+            ``slice(1000, 2000)``.  ``scalars`` must then match the
+            size of the indexed range.
+
+        preference : str, optional
+            Which field to update when the array is present in both the
+            point and cell data and this cannot be decided from the size
+            of ``scalars`` (i.e. with ``index``).  Either ``'point'`` or
+            ``'cell'``.
+
+        update_range : bool, optional
+            Recompute the scalar range of the mapper from the updated
+            array.  Default False.
+
         """
-        if mesh is None:
-            mesh = self.mesh
+        mesh, mapper = self._get_update_target(mesh)
 
         if isinstance(mesh, (collections.Iterable, pyvista.MultiBlock)):
             # Recursive if need to update scalars on many meshes
             for m in mesh:
-                self.update_scalars(scalars, mesh=m, render=False)
+                self.update_scalars(scalars, mesh=m, render=False, name=name,
+                                    index=index, preference=preference,
+                                    update_range=update_range)
             if render:
                 self.ren_win.Render()
             return
@@ -1989,51 +2064,185 @@ class BasePlotter(object):
             if render:
                 self.ren_win.Render()
             return
-
-        if scalars.shape[0] == mesh.GetNumberOfPoints():
-            data = mesh.GetPointData()
-        elif scalars.shape[0] == mesh.GetNumberOfCells():
-            data = mesh.GetCellData()
+        scalars = np.asarray(scalars)
+
+        # the named or active arrays of the point and cell data
+        candidates = []
+        for field, data in ((POINT_DATA_FIELD, mesh.GetPointData()),
+                            (CELL_DATA_FIELD, mesh.GetCellData())):
+            array = data.GetScalars() if name is None else data.GetArray(name)
+            if array is not None:
+                candidates.append((field, array))
+        if not candidates:
+            if name is None:
+                raise Exception('No active scalars')
+            raise KeyError('Array ({}) not present in the point or cell data.'
+                           .format(name))
+        if index is None:
+            candidates = [(field, array) for field, array in candidates
+                          if array.GetNumberOfTuples() == scalars.shape[0]]
+            if not candidates:
+                raise_not_matching(scalars, mesh)
+        if len(candidates) > 1:
+            preference = parse_field_choice(preference)
+            candidates = [(field, array) for field, array in candidates
+                          if field == preference] or candidates
+        vtk_scalars = candidates[0][1]
+
+        # write straight into the persistent VTK buffer
+        s = VN.vtk_to_numpy(vtk_scalars)
+        if index is None:
+            s[:] = scalars.reshape(s.shape)
         else:
-            raise_not_matching(scalars, mesh)
-
-        vtk_scalars = data.GetScalars()
-        if vtk_scalars is None:
-            raise Exception('No active scalars')
-        s = convert_array(vtk_scalars)
-        s[:] = scalars
-        data.Modified()
-        try:
-            # Why are the points updated here? Not all datasets have points
-            # and only the scalar array is modified by this function...
-            mesh.GetPoints().Modified()
-        except:
-            pass
+            s[index] = scalars
+        vtk_scalars.Modified()
+
+        if update_range:
+            if mapper is None:
+                raise RuntimeError('No mapper found to update the range of.')
+            rng = np.nanmin(s), np.nanmax(s)
+            if hasattr(mapper, 'scalar_range'):
+                mapper.scalar_range = rng
+            else:
+                mapper.SetScalarRange(*rng)
+
+        cached = getattr(mapper, '_cached_colors', None)
+        if cached is not None and mapper.GetArrayName() == COLOR_ARRAY_NAME:
+            # re-map the shown array, the cache notices it was modified
+            source, shown, field, cached_rng = cached
+            if update_range:
+                cached_rng = rng
+            self._set_cached_colors(source, mapper, shown, field, cached_rng)
 
         if render:
             self.ren_win.Render()
 
-    def update_coordinates(self, points, mesh=None, render=True):
+    def _set_cached_colors(self, mesh, mapper, name, field, rng):
+        """Color ``mesh`` by the cached RGBA colors of an array
+
+        The colors are added to a shallow copy of ``mesh`` that becomes
+        the input of ``mapper``, leaving the arrays of ``mesh`` untouched.
+        """
+        if getattr(mapper, '_cached_colors', None) is None:
+            display = type(mesh)()
+            display.ShallowCopy(mesh)
+            mapper.SetInputData(display)
+        else:
+            display = mapper.GetInputAsDataSet()
+        mapper._cached_colors = (mesh, name, field, rng)
+        if field == CELL_DATA_FIELD:
+            array = mesh.GetCellData().GetArray(name)
+            data, other = display.GetCellData(), display.GetPointData()
+            mapper.SetScalarModeToUseCellFieldData()
+        else:
+            array = mesh.GetPointData().GetArray(name)
+            data, other = display.GetPointData(), display.GetCellData()
+            mapper.SetScalarModeToUsePointFieldData()
+        table = mapper.GetLookupTable()
+        table.SetRange(rng[0], rng[1])
+        table.Build()
+        key = (name, field, tuple(rng), table.GetNanColor(),
+               VN.vtk_to_numpy(table.GetTable()).tobytes())
+        colors = get_color_cache(mesh).get(key, array, table)
+        # swap in the cached buffer, replacing the previous colors
+        other.RemoveArray(COLOR_ARRAY_NAME)
+        data.AddArray(colors)
+        mapper.SelectColorArray(COLOR_ARRAY_NAME)
+        mapper.SetColorModeToDirectScalars()
+        if hasattr(mapper, 'scalar_range'):
+            mapper.scalar_range = rng[0], rng[1]
+        else:
+            mapper.SetScalarRange(rng[0], rng[1])
+
+    def switch_scalars(self, scalars, mesh=None, rng=None, preference='cell',
+                       render=True):
+        """
+        Switch the array shown by a mesh added with ``cache_colors=True``.
+
+        The RGBA colors of each array are computed once and cached on
+        the mesh, so switching back to a cached array only swaps the
+        color buffer.  The cache is bounded by
+        ``rcParams['color_cache_size']`` arrays per mesh.
+
+        Parameters
+        ----------
+        scalars : str
+            Name of the point or cell array to show.
+
+        mesh : vtk.vtkActor or str, optional
+            Actor of the mesh or its name.  If None, uses last added mesh.
+
+        rng : 2 item list, optional
+            Color range.  Defaults to the range of the array.
+
+        preference : str, optional
+            Search for the array in the ``'point'`` or ``'cell'`` data
+            first.
+
+        render : bool, optional
+            Forces an update to the render window.  Default True.
+
+        """
+        mesh, mapper = self._get_update_target(mesh)
+        if mapper is None:
+            raise TypeError('Pass the actor or its name to switch scalars.')
+        if getattr(mapper, '_cached_colors', None) is not None:
+            # look up the arrays of the mesh rather than its displayed copy
+            mesh = mapper._cached_colors[0]
+        array, field = get_scalar(mesh, scalars, preference=preference,
+                                  info=True, err=True)
+        if field not in (POINT_DATA_FIELD, CELL_DATA_FIELD):
+            raise ValueError('Only point and cell arrays can be shown.')
+        if rng is None:
+            if field == CELL_DATA_FIELD:
+                vtk_array = mesh.GetCellData().GetArray(scalars)
+            else:
+                vtk_array = mesh.GetPointData().GetArray(scalars)
+            component = 0 if vtk_array.GetNumberOfComponents() == 1 else -1
+            rng = vtk_array.GetRange(component)
+        elif isinstance(rng, (float, int)):
+            rng = [-rng, rng]
+        self._set_cached_colors(mesh, mapper, scalars, field, rng)
+        if render:
+            self._render()
+
+    def update_coordinates(self, points, mesh=None, render=True, index=None):
         """
         Updates the points of the an object in the plotter.
 
+        When the number of points is unchanged, the points are written
+        into the existing VTK points array rather than replacing it.
+
         Parameters
         ----------
         points : np.ndarray
             Points to replace existing points.
 
-        mesh : vtk.PolyData or vtk.UnstructuredGrid, optional
-            Object that has already been added to the Plotter.  If
-            None, uses last added mesh.
+        mesh : vtk.PolyData, vtk.UnstructuredGrid, vtk.vtkActor, or str, optional
+            Object that has already been added to the Plotter, its actor,
+            or the name of its actor.  If None, uses last added mesh.
 
         render : bool, optional
             Forces an update to the render window.  Default True.
 
+        index : slice or np.ndarray, optional
+            Only update these points, e.g. ``slice(1000, 2000)``.
+
         """
-        if mesh is None:
-            mesh = self.mesh
+        mesh, _ = self._get_update_target(mesh)
+        points = np.asarray(points)
 
-        mesh.points = points
+        vtk_points = mesh.GetPoints()
+        if index is None and (vtk_points is None or
+                              points.shape[0] != mesh.GetNumberOfPoints()):
+            mesh.points = points
+        else:
+            pts = VN.vtk_to_numpy(vtk_points.GetData())
+            if index is None:
+                pts[:] = points
+            else:
+                pts[index] = points
+            vtk_points.Modified()
 
         if render:
             self._render()
@@ -2067,10 +2276,13 @@ class BasePlotter(object):
         # end movie
         if hasattr(self, 'mwriter'):
             try:
-                self.mwriter.close()
+                self._frame_writer.close()
             except BaseException:
                 pass
 
+        if hasattr(self, '_image_capture'):
+            del self._image_capture
+
     def add_text(self, text, position='upper_left', font_size=18, color=None,
                  font=None, shadow=False, name=None, loc=None):
         """
@@ -2168,10 +2380,14 @@ class BasePlotter(object):
         self.add_actor(self.textActor, reset_camera=False, name=name, loc=loc)
         return self.textActor
 
-    def open_movie(self, filename, framerate=24):
+    def open_movie(self, filename, framerate=24, queue_size=8):
         """
         Establishes a connection to the ffmpeg writer
 
+        Frames written with :func:`write_frame` are encoded on a
+        background thread so that rendering the next frame overlaps
+        with encoding the previous ones.
+
         Parameters
         ----------
         filename : str
@@ -2181,12 +2397,16 @@ class BasePlotter(object):
         framerate : int, optional
             Frames per second.
 
+        queue_size : int, optional
+            Maximum number of frames waiting to be encoded before
+            :func:`write_frame` blocks.
+
         """
         if isinstance(pyvista.FIGURE_PATH, str) and not os.path.isabs(filename):
             filename = os.path.join(pyvista.FIGURE_PATH, filename)
-        self.mwriter = imageio.get_writer(filename, fps=framerate)
+        self._open_writer(imageio.get_writer(filename, fps=framerate), queue_size)
 
-    def open_gif(self, filename):
+    def open_gif(self, filename, queue_size=8):
         """
         Open a gif file.
 
@@ -2195,19 +2415,49 @@ class BasePlotter(object):
         filename : str
             Filename of the gif to open.  Filename must end in gif.
 
+        queue_size : int, optional
+            Maximum number of frames waiting to be encoded before
+            :func:`write_frame` blocks.
+
         """
         if filename[-3:] != 'gif':
             raise Exception('Unsupported filetype.  Must end in .gif')
         if isinstance(pyvista.FIGURE_PATH, str) and not os.path.isabs(filename):
             filename = os.path.join(pyvista.FIGURE_PATH, filename)
         self._gif_filename = os.path.abspath(filename)
-        self.mwriter = imageio.get_writer(filename, mode='I')
+        self._open_writer(imageio.get_writer(filename, mode='I'), queue_size)
+
+    def _open_writer(self, writer, queue_size):
+        """Start an asynchronous frame pipeline feeding ``writer``"""
+        if hasattr(self, '_frame_writer'):
+            self._frame_writer.close()
+        self.mwriter = writer
+        self._frame_writer = FrameWriter(writer, queue_size=queue_size)
 
     def write_frame(self):
-        """ Writes a single frame to the movie file """
+        """ Writes a single frame to the movie file
+
+        The frame is copied into a preallocated buffer and queued for
+        encoding; this only blocks when the encoder falls behind.
+        """
         if not hasattr(self, 'mwriter'):
             raise AssertionError('This plotter has not opened a movie or GIF file.')
-        self.mwriter.append_data(self.image)
+        if not hasattr(self, 'ren_win'):
+            # closed plotter; fall back to the last rendered image
+            return self._frame_writer.write(self.image)
+        buffer = 'rgba' if self.image_transparent_background else 'rgb'
+        # the flipped view is copied straight into the pipeline buffer
+        self._frame_writer.write(self.image_capture.view(buffer))
+
+    @property
+    def frame_stats(self):
+        """Frame rate and latency statistics of the open movie or GIF.
+
+        See :attr:`pyvista.plotting.movie.FrameWriter.stats`.
+        """
+        if not hasattr(self, '_frame_writer'):
+            raise AssertionError('This plotter has not opened a movie or GIF file.')
+        return self._frame_writer.stats
 
     @property
     def window_size(self):
@@ -2220,40 +2470,32 @@ class BasePlotter(object):
         """ set the render window size """
         self.ren_win.SetSize(window_size[0], window_size[1])
 
-    def _run_image_filter(self, ifilter):
-        # Update filter and grab pixels
-        ifilter.Modified()
-        ifilter.Update()
-        image = pyvista.wrap(ifilter.GetOutput())
-        img_size = image.dimensions
-        img_array = pyvista.utilities.point_scalar(image, 'ImageScalars')
+    @property
+    def image_capture(self):
+        """Persistent capture of the color and depth buffers.
 
-        # Reshape and write
-        tgt_size = (img_size[1], img_size[0], -1)
-        return img_array.reshape(tgt_size)[::-1]
+        Unlike :attr:`image` and :attr:`image_depth`, this can read
+        into caller provided arrays, skip the vertical flip and
+        downsample while reading.  See
+        :class:`pyvista.plotting.capture.ImageCapture`.
+        """
+        if not hasattr(self, '_image_capture'):
+            self._image_capture = ImageCapture(self.ren_win)
+        return self._image_capture
 
     @property
     def image_depth(self):
         """ Returns an image array of current render window """
-        ifilter = vtk.vtkWindowToImageFilter()
-        ifilter.SetInput(self.ren_win)
-        ifilter.ReadFrontBufferOff()
-        ifilter.SetInputBufferTypeToZBuffer()
-        return self._run_image_filter(ifilter)
+        return self.image_capture.depth()[..., np.newaxis]
 
     @property
     def image(self):
         """ Returns an image array of current render window """
         if not hasattr(self, 'ren_win') and hasattr(self, 'last_image'):
             return self.last_image
-        ifilter = vtk.vtkWindowToImageFilter()
-        ifilter.SetInput(self.ren_win)
-        ifilter.ReadFrontBufferOff()
         if self.image_transparent_background:
-            ifilter.SetInputBufferTypeToRGBA()
-        else:
-            ifilter.SetInputBufferTypeToRGB()
-        return self._run_image_filter(ifilter)
+            return self.image_capture.rgba()
+        return self.image_capture.rgb()
 
     def enable_eye_dome_lighting(self):
         """Enable eye dome lighting (EDL) for active renderer"""
@@ -3013,6 +3255,9 @@ class BasePlotter(object):
                     time.sleep(step)
                 if write_frames:
                     self.write_frame()
+            if write_frames:
+                # make sure every frame of the orbit reached the file
+                self._frame_writer.flush()
 
 
         if bkg and isinstance(self, pyvista.BackgroundPlotter):
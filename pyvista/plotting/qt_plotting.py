@@ -1,7 +1,7 @@
 import logging
 import os
 import time
-from threading import Thread
+import weakref
 
 import numpy as np
 import scooby
@@ -317,14 +317,36 @@ class QtInteractor(QVTKRenderWindowInteractor, BasePlotter):
 
 
 class BackgroundPlotter(QtInteractor):
+    """
+    Plotter running in a Qt window in the background.
+
+    The window is only re-rendered after the plotted data, actors or
+    camera change and at most ``max_fps`` times per second.
+
+    Parameters
+    ----------
+    show : bool, optional
+        Show the window on creation.
+
+    app : QApplication, optional
+        Application to run in.  Creates one if none exists.
+
+    max_fps : float, optional
+        Maximum rate at which changes are rendered.  Default 30.
+
+    """
 
     ICON_TIME_STEP = 5.0
 
-    def __init__(self, show=True, app=None, shape=(1, 1), window_size=None, **kwargs):
+    def __init__(self, show=True, app=None, shape=(1, 1), window_size=None,
+                 max_fps=30.0, **kwargs):
         if not has_pyqt:
             raise AssertionError('Requires PyQt5')
         self.active = True
         self.saved_camera_positions = []
+        # observers of each plotted actor (or camera) by the id of the
+        # actor: {id(actor): {address of obj: (weakref to obj, tags)}}
+        self._observers = {}
 
         if window_size is None:
             window_size = rcParams['window_size']
@@ -413,7 +435,7 @@ class BackgroundPlotter(QtInteractor):
             self.app_window.show()
             self.show()
 
-        self._spawn_background_rendering()
+        self._setup_render_scheduler(max_fps)
 
         self.window_size = window_size
         self._last_update_time = time.time() - BackgroundPlotter.ICON_TIME_STEP / 2
@@ -441,28 +463,157 @@ class BackgroundPlotter(QtInteractor):
         self.saved_camera_menu.addAction('Camera Position %2d' % ncam,
                                          load_camera_position)
 
-    def _spawn_background_rendering(self, rate=5.0):
+    def _setup_render_scheduler(self, max_fps):
         """
-        Spawns a thread that updates the render window.
+        Sets up event driven rendering of the render window.
 
-        Sometimes directly modifiying object data doesn't trigger
-        Modified() and upstream objects won't be updated.  This
-        ensures the render window stays updated without consuming too
-        many resources.
+        ``ModifiedEvent`` observers on the plotted actors, mappers and
+        datasets (and every call to ``_render``) mark the plotter as
+        dirty.  Renders are coalesced and issued on the Qt thread, at
+        most ``max_fps`` times per second, and only while the plotter is
+        dirty.  Nothing runs while the scene is unchanged.
         """
-        self.render_trigger.connect(self.ren_win.Render)
-        twait = rate**-1
-
-        def render():
-            while self.active:
-                time.sleep(twait)
-                self._render()
-
-        self.render_thread = Thread(target=render)
-        self.render_thread.start()
+        self.max_fps = max_fps
+        self._dirty = False
+        self._rendering = False
+        self._last_render_time = 0.0
+
+        self._render_timer = QtCore.QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.timeout.connect(self._render_if_dirty)
+        # render_trigger may be emitted from any thread; the slot runs
+        # on the Qt thread through a queued connection
+        self.render_trigger.connect(self._schedule_render)
+
+        self.ren_win.AddObserver('StartEvent', self._on_render_start)
+        self.ren_win.AddObserver('EndEvent', self._on_render_end)
+        for renderer in self.renderers:
+            camera = renderer.GetActiveCamera()
+            self._observe(camera, id(camera))
+            for actor in renderer._actors.values():
+                self._observe_actor(actor)
+        self._render()
+
+    def _schedule_render(self):
+        """Schedule a render, coalescing requests within one frame"""
+        if not self.active or self._render_timer.isActive():
+            return
+        delay = 0.0
+        if self.max_fps:
+            delay = self._last_render_time + 1.0/self.max_fps - time.time()
+        self._render_timer.start(max(int(delay*1000), 0))
+
+    def _render_if_dirty(self):
+        if self._dirty and self.active and hasattr(self, 'ren_win'):
+            self.ren_win.Render()
+            self.update_app_icon()
+
+    def _on_render_start(self, obj=None, event=None):
+        self._rendering = True
+
+    def _on_render_end(self, obj=None, event=None):
+        self._rendering = False
+        self._dirty = False
+        self._last_render_time = time.time()
+
+    def _on_modified(self, obj=None, event=None):
+        # ignore changes made while rendering and already pending renders
+        if self._rendering or self._dirty or not self.active:
+            return
+        self._dirty = True
+        self.render_trigger.emit()
+
+    def _on_data_modified(self, obj=None, event=None, key=None):
+        # arrays may have been added to the point or cell data
+        for i in range(obj.GetNumberOfArrays()):
+            self._observe(obj.GetAbstractArray(i), key)
+        self._on_modified(obj, event)
+
+    def _observe(self, obj, key, data=False):
+        """Mark the plotter dirty whenever ``obj`` is modified.
+
+        The observer belongs to the actor (or camera) of id ``key`` and
+        holds neither ``obj`` nor the plotter.  It is removed with the
+        actor, or upon the next event when ``obj`` is no longer
+        reachable from Python by then.  With ``data``, ``obj`` is point
+        or cell data whose new arrays are observed as well.
+        """
+        if obj is None:
+            return
+        observers = self._observers.setdefault(key, {})
+        # wrappers of VTK objects come and go, their address does not
+        address = obj.GetAddressAsString('vtkObject')
+        if address in observers:
+            return
+        plotter = weakref.ref(self)
+        tags = []
+
+        def callback(caller, event):
+            this = plotter()
+            if event == 'DeleteEvent':
+                if this is not None and key in this._observers:
+                    this._observers[key].pop(address, None)
+            elif this is None or key not in this._observers:
+                # the observer outlived its actor
+                for tag in tags:
+                    caller.RemoveObserver(tag)
+            elif data:
+                this._on_data_modified(caller, event, key)
+            else:
+                this._on_modified(caller, event)
+
+        tags.append(obj.AddObserver('ModifiedEvent', callback))
+        tags.append(obj.AddObserver('DeleteEvent', callback))
+        observers[address] = (weakref.ref(obj), tags)
+
+    def _observe_actor(self, actor):
+        """Observe an actor, its mapper and the mapper's input dataset"""
+        key = id(actor)
+        self._observe(actor, key)
+        if not hasattr(actor, 'GetMapper') or actor.GetMapper() is None:
+            return
+        mapper = actor.GetMapper()
+        self._observe(mapper, key)
+        if not hasattr(mapper, 'GetInputAsDataSet'):
+            return
+        dataset = mapper.GetInputAsDataSet()
+        if dataset is None:
+            return
+        self._observe(dataset, key)
+        if hasattr(dataset, 'GetPoints') and dataset.GetPoints() is not None:
+            self._observe(dataset.GetPoints(), key)
+            self._observe(dataset.GetPoints().GetData(), key)
+        for data in (dataset.GetPointData(), dataset.GetCellData()):
+            self._observe(data, key, data=True)
+            self._on_data_modified(data, key=key)
+
+    def _remove_observers(self, keys=None):
+        """Remove the observers of the actors (or cameras) of ids ``keys``,
+        by default of all of them"""
+        if keys is None:
+            keys = list(self._observers.keys())
+        for key in keys:
+            for ref, tags in self._observers.pop(key, {}).values():
+                obj = ref()
+                if obj is not None:
+                    for tag in tags:
+                        obj.RemoveObserver(tag)
+
+    def _remove_unplotted_observers(self):
+        """Remove the observers of actors that are no longer plotted"""
+        plotted = set()
+        for renderer in self.renderers:
+            plotted.add(id(renderer.GetActiveCamera()))
+            plotted.update(id(actor) for actor in renderer._actors.values()
+                           if renderer.HasViewProp(actor))
+        self._remove_observers([key for key in self._observers
+                                if key not in plotted])
 
     def closeEvent(self, event):
         self.active = False
+        if hasattr(self, '_render_timer'):
+            self._render_timer.stop()
+        self._remove_observers()
         self.app.quit()
         self.close()
 
@@ -471,9 +622,23 @@ class BackgroundPlotter(QtInteractor):
                                                                reset_camera,
                                                                name,
                                                                loc)
+        if hasattr(self, '_render_timer'):
+            # an actor of the same name may have been replaced
+            self._remove_unplotted_observers()
+            self._observe_actor(actor)
+            self._render()
         self.update_app_icon()
         return actor, prop
 
+    def remove_actor(self, actor, reset_camera=False):
+        success = super(BackgroundPlotter, self).remove_actor(actor, reset_camera)
+        self._remove_unplotted_observers()
+        return success
+
+    def clear(self):
+        super(BackgroundPlotter, self).clear()
+        self._remove_unplotted_observers()
+
     def update_app_icon(self):
         """
         Update the app icon if the user is not trying to resize the window.
@@ -529,9 +694,9 @@ class BackgroundPlotter(QtInteractor):
         return self.renderer.enable_eye_dome_lighting()
 
     def _render(self):
+        # mark dirty before the (possibly queued) render request
+        self._dirty = True
         super(BackgroundPlotter, self)._render()
-        self.update_app_icon()
-        return
 
     @property
     def window_size(self):
@@ -50,7 +50,8 @@ rcParams = {
     'interactive' : False,
     'render_points_as_spheres' : False,
     'use_panel' : True,
-    'transparent_background' : False
+    'transparent_background' : False,
+    'color_cache_size' : 8,
 }
 
 DEFAULT_THEME = dict(rcParams)
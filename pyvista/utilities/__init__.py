@@ -1,8 +1,13 @@
+from .cells import *
+from .containment import *
+from .criteria import *
 from .errors import (Observer, Report, send_errors_to_logging,
                      set_error_output_file)
 from .features import *
 from .fileio import *
 from .geometric_objects import *
 from .parametric_objects import *
+from .quality import *
 from .sphinx_gallery import Scraper, _get_sg_image_scraper
+from .transformations import *
 from .utilities import *
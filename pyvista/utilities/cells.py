@@ -0,0 +1,385 @@
+"""
+Supporting functions for working with the cell connectivity of datasets
+
+The connectivity is exposed in the legacy padded layout where each cell
+is stored as ``[n, id_0, ..., id_n-1]``.
+"""
+import numpy as np
+import vtk
+from vtk.util.numpy_support import numpy_to_vtkIdTypeArray, vtk_to_numpy
+
+import pyvista
+
+
+def cell_array_locations(vtkcells):
+    """Return the location of each cell in the padded connectivity array
+    of a ``vtkCellArray``.
+
+    Parameters
+    ----------
+    vtkcells : vtk.vtkCellArray
+        Cell array, e.g. ``grid.GetCells()`` or ``poly.GetPolys()``.
+
+    Returns
+    -------
+    locations : np.ndarray
+        Index of the size entry of each cell in the padded connectivity.
+
+    """
+    n_cells = vtkcells.GetNumberOfCells()
+    if hasattr(vtkcells, 'GetOffsetsArray'):
+        # newer VTK stores the offsets of the unpadded connectivity
+        offsets = vtk_to_numpy(vtkcells.GetOffsetsArray())[:-1]
+        return offsets + np.arange(n_cells, dtype=offsets.dtype)
+    return padded_cell_locations(vtk_to_numpy(vtkcells.GetData()), n_cells)
+
+
+def padded_cell_locations(cells, n_cells):
+    """Return the location of each cell in a padded connectivity array.
+
+    Parameters
+    ----------
+    cells : np.ndarray
+        Padded connectivity, e.g. ``[3, 0, 1, 2, 3, 2, 1, 3]``.
+
+    n_cells : int
+        Number of cells in ``cells``.
+
+    """
+    if n_cells == 0:
+        return np.empty(0, pyvista.ID_TYPE)
+    # fast path for cells of the same size
+    size = cells[0] + 1
+    if cells.size == n_cells*size and np.all(cells[::size] == size - 1):
+        return np.arange(n_cells, dtype=pyvista.ID_TYPE)*size
+    # cells of different sizes are located by VTK in C++
+    cells = np.ascontiguousarray(cells, dtype=pyvista.ID_TYPE)
+    vtkcells = vtk.vtkCellArray()
+    vtkcells.SetCells(n_cells, numpy_to_vtkIdTypeArray(cells, deep=False))
+    if hasattr(vtkcells, 'GetOffsetsArray'):
+        return cell_array_locations(vtkcells)
+    grid = vtk.vtkUnstructuredGrid()
+    grid.SetCells(vtk.VTK_POLYGON, vtkcells)
+    return vtk_to_numpy(grid.GetCellLocationsArray()).copy()
+
+
+def cell_locations(grid):
+    """Return the location of each cell of an unstructured grid in its
+    padded connectivity array (``grid.cells``).
+    """
+    vtkcells = grid.GetCells()
+    if vtkcells is None:
+        return np.empty(0, pyvista.ID_TYPE)
+    if not hasattr(vtkcells, 'GetOffsetsArray'):
+        return vtk_to_numpy(grid.GetCellLocationsArray())
+    return cell_array_locations(vtkcells)
+
+
+def gather_cells(cells, locations, index):
+    """Gather the padded connectivity of a subset of cells.
+
+    Parameters
+    ----------
+    cells : np.ndarray
+        Padded connectivity.
+
+    locations : np.ndarray
+        Location of each cell in ``cells``.
+
+    index : np.ndarray
+        Indices of the cells to gather, in output order.
+
+    Returns
+    -------
+    new_cells : np.ndarray
+        Padded connectivity of the gathered cells.
+
+    new_locations : np.ndarray
+        Location of each gathered cell in ``new_cells``.
+
+    """
+    locs = locations[index]
+    sizes = cells[locs] + 1
+    new_locations = np.zeros(len(index), pyvista.ID_TYPE)
+    np.cumsum(sizes[:-1], out=new_locations[1:])
+    if sizes.size and sizes.min() == sizes.max():
+        # fast path for cells of the same size
+        positions = np.arange(sizes[0], dtype=pyvista.ID_TYPE)
+        return cells[locs[:, np.newaxis] + positions].ravel(), new_locations
+    total = int(sizes.sum())
+    # position of each output value within its cell, added to the source
+    within = np.arange(total, dtype=pyvista.ID_TYPE) - np.repeat(new_locations, sizes)
+    new_cells = cells[np.repeat(locs, sizes) + within]
+    return new_cells, new_locations
+
+
+def gather_cell_point_ids(ids, offsets, index):
+    """Gather the point ids of a subset of cells.
+
+    Parameters
+    ----------
+    ids : np.ndarray
+        Point ids of all cells from :func:`cell_point_ids`.
+
+    offsets : np.ndarray
+        Offsets of the cells from :func:`cell_point_ids`.
+
+    index : np.ndarray
+        Indices of the cells to gather, in output order.
+
+    Returns
+    -------
+    new_ids : np.ndarray
+        Point ids of the gathered cells.
+
+    new_offsets : np.ndarray
+        ``len(index) + 1`` offsets of each gathered cell in ``new_ids``.
+
+    """
+    starts = offsets[index]
+    sizes = offsets[np.asarray(index) + 1] - starts
+    new_offsets = np.zeros(len(starts) + 1, pyvista.ID_TYPE)
+    np.cumsum(sizes, out=new_offsets[1:])
+    if sizes.size and sizes.min() == sizes.max():
+        # fast path for cells of the same size
+        size = sizes[0]
+        if size and np.array_equal(starts, np.asarray(index)*size):
+            # the cells are rows of the point ids
+            rows = ids[:ids.size - ids.size % size].reshape(-1, size)
+            return np.take(rows, index, axis=0).ravel(), new_offsets
+        positions = np.arange(size, dtype=pyvista.ID_TYPE)
+        return ids[starts[:, np.newaxis] + positions].ravel(), new_offsets
+    within = (np.arange(new_offsets[-1], dtype=pyvista.ID_TYPE)
+              - np.repeat(new_offsets[:-1], sizes))
+    return ids[np.repeat(starts, sizes) + within], new_offsets
+
+
+def cell_array(ids, offsets):
+    """Create a ``vtkCellArray`` from the point ids of its cells.
+
+    Parameters
+    ----------
+    ids : np.ndarray
+        Point ids of all cells, concatenated in cell order.
+
+    offsets : np.ndarray
+        ``n_cells + 1`` offsets of each cell in ``ids``.
+
+    Returns
+    -------
+    vtkcells : vtk.vtkCellArray
+        Cell array holding a copy of ``ids`` and ``offsets``.
+
+    """
+    vtkcells = vtk.vtkCellArray()
+    if hasattr(vtkcells, 'GetOffsetsArray'):
+        # the cell array adopts the memory of the arrays but not the
+        # arrays themselves, so they must own their memory
+        vtkcells.SetData(_id_type_array(offsets), _id_type_array(ids))
+        return vtkcells
+    # older VTK stores the padded connectivity
+    n_cells = len(offsets) - 1
+    padded = np.insert(ids, offsets[:-1], np.diff(offsets))
+    vtkcells.SetCells(n_cells, _id_type_array(padded))
+    return vtkcells
+
+
+def _id_type_array(values):
+    """Copy ``values`` into a new ``vtkIdTypeArray``"""
+    vtkarr = vtk.vtkIdTypeArray()
+    vtkarr.SetNumberOfValues(len(values))
+    if len(values):
+        vtk_to_numpy(vtkarr)[:] = values
+    return vtkarr
+
+
+def cell_id_mask(cells, locations):
+    """Return a mask of the point id entries (not the sizes) of a padded
+    connectivity array.
+    """
+    mask = np.ones(cells.size, dtype=bool)
+    mask[locations] = False
+    return mask
+
+
+def _structured_cell_point_ids(dims):
+    """Point ids of the cells of a structured dataset of ``dims`` points,
+    as an ``(n_cells, n_corners)`` array.
+    """
+    nx, ny, nz = dims
+    cx, cy, cz = [max(d - 1, 1) for d in dims]
+    k, j, i = np.meshgrid(np.arange(cz), np.arange(cy), np.arange(cx),
+                          indexing='ij')
+    base = (i + nx*(j + ny*k)).ravel().astype(pyvista.ID_TYPE)
+    corners = [di + nx*dj + nx*ny*dk
+               for dk in range(1 + (nz > 1))
+               for dj in range(1 + (ny > 1))
+               for di in range(1 + (nx > 1))]
+    return base[:, np.newaxis] + np.array(corners, pyvista.ID_TYPE)
+
+
+def cell_point_ids(dataset):
+    """Return the point ids of every cell of a dataset.
+
+    Parameters
+    ----------
+    dataset : vtk.vtkDataSet
+        Any dataset.
+
+    Returns
+    -------
+    ids : np.ndarray
+        Point ids of all cells, concatenated in cell order.
+
+    offsets : np.ndarray
+        ``n_cells + 1`` offsets of each cell in ``ids``.
+
+    Notes
+    -----
+    With VTK 9 the arrays of an unstructured grid are views of its cell
+    array and should not be modified.
+
+    """
+    n_cells = dataset.GetNumberOfCells()
+    if isinstance(dataset, (vtk.vtkImageData, vtk.vtkRectilinearGrid,
+                            vtk.vtkStructuredGrid)):
+        ids = _structured_cell_point_ids(dataset.GetDimensions())
+        offsets = np.arange(n_cells + 1, dtype=pyvista.ID_TYPE)*ids.shape[1]
+        return ids.ravel(), offsets
+
+    if isinstance(dataset, vtk.vtkUnstructuredGrid):
+        vtkcells = dataset.GetCells()
+        if vtkcells is not None and hasattr(vtkcells, 'GetOffsetsArray'):
+            # newer VTK stores exactly these arrays
+            ids = vtk_to_numpy(vtkcells.GetConnectivityArray())
+            offsets = vtk_to_numpy(vtkcells.GetOffsetsArray())
+            return (ids.astype(pyvista.ID_TYPE, copy=False),
+                    offsets.astype(pyvista.ID_TYPE, copy=False))
+        cells = [vtk_to_numpy(vtkcells.GetData())] if vtkcells else []
+        locations = [cell_locations(dataset)]
+    elif isinstance(dataset, vtk.vtkPolyData):
+        # cell ids of poly data are ordered verts, lines, polys, strips
+        cells, locations = [], []
+        for vtkcells in (dataset.GetVerts(), dataset.GetLines(),
+                         dataset.GetPolys(), dataset.GetStrips()):
+            if vtkcells is not None and vtkcells.GetNumberOfCells():
+                cells.append(vtk_to_numpy(vtkcells.GetData()))
+                locations.append(cell_array_locations(vtkcells))
+    else:
+        # other datasets are converted, which keeps the order of the cells
+        alg = vtk.vtkAppendFilter()
+        alg.AddInputData(dataset)
+        alg.Update()
+        return cell_point_ids(alg.GetOutput())
+
+    if not cells:
+        return (np.empty(0, pyvista.ID_TYPE),
+                np.zeros(n_cells + 1, pyvista.ID_TYPE))
+    sizes = np.concatenate([c[loc] for c, loc in zip(cells, locations)])
+    ids = np.concatenate([c[cell_id_mask(c, loc)]
+                          for c, loc in zip(cells, locations)])
+    offsets = np.zeros(len(sizes) + 1, pyvista.ID_TYPE)
+    np.cumsum(sizes, out=offsets[1:])
+    return ids, offsets
+
+
+def reduce_point_values(values, ids, offsets):
+    """Return the minimum and maximum of point values over each cell.
+
+    Cells without points are given ``NaN``.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        One value per point.
+
+    ids : np.ndarray
+        Point ids of the cells from :func:`cell_point_ids`.
+
+    offsets : np.ndarray
+        Offsets of the cells from :func:`cell_point_ids`.
+
+    Returns
+    -------
+    cell_min : np.ndarray
+        Minimum value of the points of each cell.
+
+    cell_max : np.ndarray
+        Maximum value of the points of each cell.
+
+    """
+    n_cells = len(offsets) - 1
+    cell_min = np.full(n_cells, np.nan)
+    cell_max = np.full(n_cells, np.nan)
+    nonempty = offsets[1:] > offsets[:-1]
+    if ids.size:
+        starts = offsets[:-1][nonempty]
+        cell_values = values[ids]
+        cell_min[nonempty] = np.minimum.reduceat(cell_values, starts)
+        cell_max[nonempty] = np.maximum.reduceat(cell_values, starts)
+    return cell_min, cell_max
+
+
+# higher order cell types, the linear cell type sharing their corners and
+# the number of corners, which are the first points of the cell.  Types
+# missing from the installed VTK are skipped.
+_LINEAR_CELLS = (
+    ('QUADRATIC_EDGE', 'LINE', 2),
+    ('CUBIC_LINE', 'LINE', 2),
+    ('QUADRATIC_TRIANGLE', 'TRIANGLE', 3),
+    ('BIQUADRATIC_TRIANGLE', 'TRIANGLE', 3),
+    ('QUADRATIC_QUAD', 'QUAD', 4),
+    ('BIQUADRATIC_QUAD', 'QUAD', 4),
+    ('QUADRATIC_LINEAR_QUAD', 'QUAD', 4),
+    ('QUADRATIC_POLYGON', 'POLYGON', -1),
+    ('QUADRATIC_TETRA', 'TETRA', 4),
+    ('QUADRATIC_PYRAMID', 'PYRAMID', 5),
+    ('TRIQUADRATIC_PYRAMID', 'PYRAMID', 5),
+    ('QUADRATIC_WEDGE', 'WEDGE', 6),
+    ('QUADRATIC_LINEAR_WEDGE', 'WEDGE', 6),
+    ('BIQUADRATIC_QUADRATIC_WEDGE', 'WEDGE', 6),
+    ('QUADRATIC_HEXAHEDRON', 'HEXAHEDRON', 8),
+    ('TRIQUADRATIC_HEXAHEDRON', 'HEXAHEDRON', 8),
+    ('BIQUADRATIC_QUADRATIC_HEXAHEDRON', 'HEXAHEDRON', 8),
+    ('LAGRANGE_CURVE', 'LINE', 2),
+    ('LAGRANGE_TRIANGLE', 'TRIANGLE', 3),
+    ('LAGRANGE_QUADRILATERAL', 'QUAD', 4),
+    ('LAGRANGE_TETRAHEDRON', 'TETRA', 4),
+    ('LAGRANGE_PYRAMID', 'PYRAMID', 5),
+    ('LAGRANGE_WEDGE', 'WEDGE', 6),
+    ('LAGRANGE_HEXAHEDRON', 'HEXAHEDRON', 8),
+    ('BEZIER_CURVE', 'LINE', 2),
+    ('BEZIER_TRIANGLE', 'TRIANGLE', 3),
+    ('BEZIER_QUADRILATERAL', 'QUAD', 4),
+    ('BEZIER_TETRAHEDRON', 'TETRA', 4),
+    ('BEZIER_PYRAMID', 'PYRAMID', 5),
+    ('BEZIER_WEDGE', 'WEDGE', 6),
+    ('BEZIER_HEXAHEDRON', 'HEXAHEDRON', 8),
+)
+
+
+def linear_cell_tables():
+    """Return lookup tables indexed by cell type converting higher order
+    cells to linear cells.
+
+    Returns
+    -------
+    linear_types : np.ndarray
+        Linear cell type of each cell type.  Linear types map to
+        themselves.
+
+    n_corners : np.ndarray
+        Number of corner points of each higher order cell type, which are
+        the first points of the cell.  ``0`` for linear types, whose
+        points are all kept, and ``-1`` for quadratic polygons, which
+        have half of their points as corners.
+
+    """
+    linear_types = np.arange(256, dtype=np.uint8)
+    n_corners = np.zeros(256, pyvista.ID_TYPE)
+    for name, linear_name, corners in _LINEAR_CELLS:
+        cell_type = getattr(vtk, 'VTK_' + name, None)
+        if cell_type is not None:
+            linear_types[cell_type] = getattr(vtk, 'VTK_' + linear_name)
+            n_corners[cell_type] = corners
+    return linear_types, n_corners
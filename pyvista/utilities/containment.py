@@ -0,0 +1,105 @@
+"""
+Inside/outside classification of points against closed surfaces
+"""
+import numpy as np
+import vtk
+
+
+class SurfaceContainment(object):
+    """Reusable classifier of points as inside or outside a closed surface.
+
+    The surface is validated and its cell locator is built once, by
+    ``vtkSelectEnclosedPoints.Initialize``, so that many point arrays
+    can be classified without repeating the closed surface check,
+    rebuilding the locator or copying the datasets the points come from.
+
+    Parameters
+    ----------
+    surface : pyvista.PolyData
+        Closed, manifold surface used to test for containment.
+
+    tolerance : float, optional
+        The tolerance on the intersection, expressed as a fraction of the
+        diagonal of the bounding box of the surface.
+
+    check_surface : bool, optional
+        Check that the surface is closed and manifold.  Raises a
+        ``ValueError`` if it is not.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import pyvista
+    >>> inside = pyvista.SurfaceContainment(pyvista.Sphere(radius=1.0))
+    >>> inside([[0, 0, 0], [2, 0, 0]])
+    array([ True, False])
+
+    """
+
+    def __init__(self, surface, tolerance=0.001, check_surface=True):
+        if not isinstance(surface, vtk.vtkPolyData):
+            raise TypeError('surface must be a pyvista.PolyData')
+        if check_surface and surface.GetNumberOfCells() and \
+           not vtk.vtkSelectEnclosedPoints.IsSurfaceClosed(surface):
+            raise ValueError('Surface is not closed and manifold.  Disable '
+                             '``check_surface`` to classify points anyway.')
+        self.surface = surface
+        self.tolerance = tolerance
+        self._alg = vtk.vtkSelectEnclosedPoints()
+        self._alg.SetTolerance(tolerance)
+        if surface.GetNumberOfCells():
+            # builds the cell locator used by every classification
+            self._alg.Initialize(surface)
+
+    def _classify_chunk(self, points, out):
+        """Classify a contiguous chunk of points into ``out``"""
+        is_inside = self._alg.IsInsideSurface
+        out[:] = [is_inside(x, y, z) for x, y, z in points.tolist()]
+
+    def contains(self, points, chunk_size=1000000, inside_out=False):
+        """Return a boolean mask of the points inside the surface.
+
+        Parameters
+        ----------
+        points : np.ndarray
+            ``(N, 3)`` array of points.
+
+        chunk_size : int, optional
+            Number of points classified at once.  Bounds the temporary
+            memory used by the classification.
+
+        inside_out : bool, optional
+            Return the points outside of the surface instead.
+
+        Returns
+        -------
+        mask : np.ndarray
+            ``(N, )`` boolean array.
+
+        """
+        points = np.asarray(points)
+        if points.ndim != 2 or points.shape[1] != 3:
+            raise ValueError('points must be an (N, 3) array')
+        if points.dtype not in (np.float32, np.float64):
+            points = points.astype(np.float64)
+        chunk_size = int(chunk_size)
+        if chunk_size < 1:
+            raise ValueError('chunk_size must be a positive integer')
+        mask = np.zeros(len(points), dtype=bool)
+        if self.surface.GetNumberOfCells():
+            # the rays are cast in random directions, which are reseeded
+            # so that the same points are always classified the same way
+            vtk.vtkMath.RandomSeed(0)
+            for start in range(0, len(points), chunk_size):
+                self._classify_chunk(points[start:start + chunk_size],
+                                     mask[start:start + chunk_size])
+        if inside_out:
+            np.logical_not(mask, out=mask)
+        return mask
+
+    def __call__(self, points, chunk_size=1000000, inside_out=False):
+        """Return a boolean mask of the points inside the surface.
+        See :func:`SurfaceContainment.contains`.
+        """
+        return self.contains(points, chunk_size=chunk_size,
+                             inside_out=inside_out)
@@ -0,0 +1,184 @@
+"""
+Composable range criteria used to threshold the cells of datasets
+
+Criteria are evaluated in a single vectorized pass over the arrays of a
+dataset and combined with ``&``, ``|`` and ``~``.
+"""
+import numpy as np
+
+from .cells import cell_point_ids, reduce_point_values
+from .utilities import (CELL_DATA_FIELD, POINT_DATA_FIELD, get_scalar)
+
+
+class _CellPoints(object):
+    """Lazily computed point ids of the cells of a dataset, shared by all
+    the point criteria of an evaluation.
+    """
+
+    def __init__(self, dataset):
+        self.dataset = dataset
+        self._ids = None
+
+    def reduce(self, values):
+        if self._ids is None:
+            self._ids = cell_point_ids(self.dataset)
+        return reduce_point_values(values, *self._ids)
+
+
+class Criterion(object):
+    """Base class of the criteria selecting the cells of a dataset.
+
+    Criteria are combined with ``&`` (both), ``|`` (either) and ``~``
+    (not).
+    """
+
+    def __and__(self, other):
+        return _Intersection(self, other)
+
+    def __or__(self, other):
+        return _Union(self, other)
+
+    def __invert__(self):
+        return _Complement(self)
+
+    def _evaluate(self, dataset, cell_points, continuous):
+        raise NotImplementedError
+
+    def cell_mask(self, dataset, continuous=False):
+        """Return a boolean mask of the cells of ``dataset`` meeting this
+        criterion.
+
+        Parameters
+        ----------
+        dataset : pyvista.Common
+            Dataset to evaluate the criterion on.
+
+        continuous : bool, optional
+            When True, the continuous interval [minimum cell scalar,
+            maxmimum cell scalar] of point scalars is intersected with the
+            range rather than requiring every point of a cell to be
+            within it.
+
+        """
+        return self._evaluate(dataset, _CellPoints(dataset), continuous)
+
+
+class ScalarRange(Criterion):
+    """Select cells whose scalars are within a range.
+
+    Parameters
+    ----------
+    scalars : str
+        Name of the point or cell array.
+
+    lower : float, optional
+        Lower bound of the range.  Unbounded when not given.
+
+    upper : float, optional
+        Upper bound of the range.  Unbounded when not given.
+
+    invert : bool, optional
+        Select the cells whose scalars are at or outside of the bounds
+        instead.
+
+    preference : str, optional
+        When both point and cell arrays named ``scalars`` exist, use
+        this one.  Must be either ``'point'`` or ``'cell'``.
+
+    component : int, optional
+        Component of multi-component arrays to test.
+
+    Notes
+    -----
+    Bounds are inclusive.  Cells of point arrays are selected when all
+    of their points are within the range and NaN values are never
+    selected, as with ``vtkThreshold``.
+
+    Examples
+    --------
+    Keep the cells with pressure in either of two ranges and of material 3
+
+    >>> import pyvista
+    >>> criteria = ((pyvista.ScalarRange('pressure', 0, 10) |
+    ...              pyvista.ScalarRange('pressure', 50, 60)) &
+    ...             pyvista.ScalarRange('material', 3, 3))
+    >>> subset = mesh.threshold_criteria(criteria)  # doctest:+SKIP
+
+    """
+
+    def __init__(self, scalars, lower=None, upper=None, invert=False,
+                 preference='cell', component=0):
+        if lower is not None and upper is not None and lower > upper:
+            raise ValueError('Lower bound ({}) is greater than the upper '
+                             'bound ({}).'.format(lower, upper))
+        self.scalars = scalars
+        self.lower = -np.inf if lower is None else lower
+        self.upper = np.inf if upper is None else upper
+        self.invert = invert
+        self.preference = preference
+        self.component = component
+
+    def __repr__(self):
+        return '{}({!r}, {}, {}, invert={})'.format(type(self).__name__,
+                                                    self.scalars, self.lower,
+                                                    self.upper, self.invert)
+
+    def _values(self, dataset):
+        arr, field = get_scalar(dataset, self.scalars,
+                                preference=self.preference, info=True)
+        if arr is None:
+            raise KeyError('Array ({}) not present in dataset.'
+                           .format(self.scalars))
+        if field not in (POINT_DATA_FIELD, CELL_DATA_FIELD):
+            raise ValueError('Array ({}) must be point or cell data.'
+                             .format(self.scalars))
+        if arr.ndim > 1:
+            arr = arr[:, self.component]
+        return np.asarray(arr), field
+
+    def _evaluate(self, dataset, cell_points, continuous):
+        arr, field = self._values(dataset)
+        lower, upper = self.lower, self.upper
+        with np.errstate(invalid='ignore'):
+            if field == CELL_DATA_FIELD:
+                if self.invert:
+                    return (arr <= lower) | (arr >= upper)
+                return (arr >= lower) & (arr <= upper)
+            cell_min, cell_max = cell_points.reduce(arr)
+            if continuous:
+                # the [min, max] interval of each cell intersects the range
+                if self.invert:
+                    return (cell_min <= lower) | (cell_max >= upper)
+                return (cell_min <= upper) & (cell_max >= lower)
+            if self.invert:
+                return (cell_max <= lower) | (cell_min >= upper)
+            return (cell_min >= lower) & (cell_max <= upper)
+
+
+class _Intersection(Criterion):
+
+    def __init__(self, a, b):
+        self.a, self.b = a, b
+
+    def _evaluate(self, dataset, cell_points, continuous):
+        return (self.a._evaluate(dataset, cell_points, continuous) &
+                self.b._evaluate(dataset, cell_points, continuous))
+
+
+class _Union(Criterion):
+
+    def __init__(self, a, b):
+        self.a, self.b = a, b
+
+    def _evaluate(self, dataset, cell_points, continuous):
+        return (self.a._evaluate(dataset, cell_points, continuous) |
+                self.b._evaluate(dataset, cell_points, continuous))
+
+
+class _Complement(Criterion):
+
+    def __init__(self, a):
+        self.a = a
+
+    def _evaluate(self, dataset, cell_points, continuous):
+        return ~self.a._evaluate(dataset, cell_points, continuous)
@@ -4,24 +4,57 @@ import numpy as np
 import pyvista
 
 
-def voxelize(mesh, density):
-    """voxelize mesh to UnstructuredGrid"""
-    x_min, x_max, y_min, y_max, z_min, z_max = mesh.bounds
-    x = np.arange(x_min, x_max, density)
-    y = np.arange(y_min, y_max, density)
-    z = np.arange(z_min, z_max, density)
-    x, y, z = np.meshgrid(x, y, z)
-
-    # Create unstructured grid from the structured grid
-    grid = pyvista.StructuredGrid(x, y, z)
-    ugrid = pyvista.UnstructuredGrid(grid)
+def voxelize(mesh, density, check_surface=True):
+    """Voxelize a closed surface to an UnstructuredGrid.
+
+    The points of a :class:`pyvista.UniformGrid` spanning the bounds of
+    ``mesh`` are classified with :class:`pyvista.SurfaceContainment` and
+    the voxels touching at least one point inside the surface are
+    extracted.
+
+    Parameters
+    ----------
+    mesh : pyvista.PolyData
+        Closed surface to voxelize.
+
+    density : float
+        Edge length of the voxels.
+
+    check_surface : bool, optional
+        Check that the surface is closed and manifold.
+
+    Returns
+    -------
+    grid : pyvista.UnstructuredGrid
+        Voxels within the surface.
+
+    """
+    if not isinstance(mesh, pyvista.PolyData):
+        mesh = mesh.extract_geometry()
+    bounds = np.array(mesh.bounds)
+    dims = np.ceil((bounds[1::2] - bounds[::2]) / density).astype(int)
+    dims = np.maximum(dims, 2)
+
+    grid = pyvista.UniformGrid()
+    grid.dimensions = dims
+    grid.spacing = (density, density, density)
+    grid.origin = bounds[::2]
 
     # get part of the mesh within the mesh
-    selection = ugrid.select_enclosed_points(mesh, tolerance=0.0)
-    mask = selection.point_arrays['SelectedPoints'].view(np.bool)
+    containment = pyvista.SurfaceContainment(mesh, tolerance=0.0,
+                                             check_surface=check_surface)
+    mask = containment(grid.points).reshape(dims[::-1])
+
+    # a voxel is kept when any of its corners is inside
+    nz, ny, nx = dims[::-1] - 1
+    cell_mask = np.zeros((nz, ny, nx), dtype=bool)
+    for k in range(2):
+        for j in range(2):
+            for i in range(2):
+                cell_mask |= mask[k:k + nz, j:j + ny, i:i + nx]
 
-    # extract cells from point indices
-    return ugrid.extract_selection_points(mask)
+    # extract cells directly from the uniform grid
+    return grid.extract_cells(cell_mask.ravel())
 
 
 def create_grid(dataset, dimensions=(101, 101, 101)):
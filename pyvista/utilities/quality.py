@@ -0,0 +1,306 @@
+"""
+Vectorized quality metrics of the cells of a dataset
+
+The metrics are computed for all cells of a type at once from their
+corner points, so higher order cells are measured through their linear
+equivalent.  Cells of unsupported types are given ``NaN``.
+
+Metrics
+-------
+``'scaled_jacobian'``
+    Minimum over the corners of the Jacobian determinant divided by the
+    lengths of the edges at that corner, scaled to 1 for an ideal cell.
+    Follows Verdict, the library behind ``vtkMeshQuality``, so that
+    tetrahedra are scaled by their longest corner edges, pyramids by
+    the tetrahedra at their base corners and hexahedra also by their
+    principal axes.  Negative values are inverted cells, except for
+    pyramids which are then given 0.
+
+``'jacobian'``
+    Minimum over the corners of the Jacobian determinant.
+
+``'aspect_ratio'``
+    Ratio of the longest to the shortest edge, 1 for an ideal cell.
+
+``'skew'``
+    Equiangle skewness: the largest normalized deviation of the angles
+    of the faces from those of an equilateral face.  Ranges from 0 for
+    an ideal cell to 1 for a degenerate one.
+
+``'volume'``
+    Signed volume of 3D cells and area of 2D cells.
+
+"""
+import collections
+
+import numpy as np
+import vtk
+
+import pyvista
+
+from .cells import cell_locations, linear_cell_tables
+
+QUALITY_METRICS = ('scaled_jacobian', 'jacobian', 'aspect_ratio', 'skew',
+                   'volume')
+
+# number of cells measured at once, which bounds the temporary memory
+QUALITY_CHUNK_SIZE = 65536
+
+_Shape = collections.namedtuple('_Shape', ['dim', 'corners', 'factor', 'faces'])
+
+# corners are given as (point, neighbor, neighbor[, neighbor]) ordered so
+# that the Jacobian of a valid cell is positive, faces are oriented
+# outwards
+_TRIANGLE = _Shape(2, ((0, 1, 2), (1, 2, 0), (2, 0, 1)), 2/np.sqrt(3),
+                   ((0, 1, 2), ))
+_QUAD = _Shape(2, ((0, 1, 3), (1, 2, 0), (2, 3, 1), (3, 0, 2)), 1.0,
+               ((0, 1, 2, 3), ))
+_TETRA = _Shape(3, ((0, 1, 2, 3), (1, 2, 0, 3), (2, 0, 1, 3), (3, 0, 2, 1)),
+                np.sqrt(2),
+                ((0, 1, 3), (1, 2, 3), (2, 0, 3), (0, 2, 1)))
+# pyramids are measured by the four tetrahedra formed by each base corner,
+# its neighbors and the apex
+_PYRAMID = _Shape(3, tuple(tuple(tet[i] for i in corner)
+                           for tet in ((0, 1, 3, 4), (1, 2, 0, 4),
+                                       (2, 3, 1, 4), (3, 0, 2, 4))
+                           for corner in _TETRA.corners),
+                  2.0,
+                  ((0, 3, 2, 1), (0, 1, 4), (1, 2, 4), (2, 3, 4), (3, 0, 4)))
+_WEDGE = _Shape(3, ((0, 1, 2, 3), (1, 2, 0, 4), (2, 0, 1, 5),
+                    (3, 5, 4, 0), (4, 3, 5, 1), (5, 4, 3, 2)),
+                2/np.sqrt(3),
+                ((0, 2, 1), (3, 4, 5), (0, 1, 4, 3), (1, 2, 5, 4), (2, 0, 3, 5)))
+_HEXAHEDRON = _Shape(3, ((0, 1, 3, 4), (1, 2, 0, 5), (2, 3, 1, 6), (3, 0, 2, 7),
+                         (4, 7, 5, 0), (5, 4, 6, 1), (6, 5, 7, 2), (7, 6, 4, 3)),
+                     1.0,
+                     ((0, 4, 7, 3), (1, 2, 6, 5), (0, 1, 5, 4), (3, 7, 6, 2),
+                      (0, 3, 2, 1), (4, 5, 6, 7)))
+
+# shape of each linear cell type and the order of its points in the shape
+_CELL_SHAPES = {
+    vtk.VTK_TRIANGLE: (_TRIANGLE, (0, 1, 2)),
+    vtk.VTK_QUAD: (_QUAD, (0, 1, 2, 3)),
+    vtk.VTK_PIXEL: (_QUAD, (0, 1, 3, 2)),
+    vtk.VTK_TETRA: (_TETRA, (0, 1, 2, 3)),
+    vtk.VTK_PYRAMID: (_PYRAMID, (0, 1, 2, 3, 4)),
+    vtk.VTK_WEDGE: (_WEDGE, (0, 1, 2, 3, 4, 5)),
+    vtk.VTK_HEXAHEDRON: (_HEXAHEDRON, (0, 1, 2, 3, 4, 5, 6, 7)),
+    vtk.VTK_VOXEL: (_HEXAHEDRON, (0, 1, 3, 2, 4, 5, 7, 6)),
+}
+
+
+def _norm(vectors):
+    return np.sqrt(np.einsum('...i,...i->...', vectors, vectors))
+
+
+def _divide(num, den, fill=0.0):
+    """``num/den`` with ``fill`` where ``den`` is zero"""
+    out = np.full(np.broadcast(num, den).shape, fill)
+    np.divide(num, den, out=out, where=den != 0)
+    return out
+
+
+def _corner_jacobians(shape, pts):
+    """Jacobian determinant and product of the edge lengths at each corner
+    of the cells ``pts`` of shape ``(n_cells, n_points, 3)``
+    """
+    corners = np.array(shape.corners)
+    origin = pts[:, corners[:, 0]]
+    edges = [pts[:, corners[:, i]] - origin for i in range(1, corners.shape[1])]
+    lengths = np.prod([_norm(e) for e in edges], axis=0)
+    if shape.dim == 3:
+        det = np.einsum('ijk,ijk->ij', edges[0], np.cross(edges[1], edges[2]))
+    else:
+        # signed relative to the normal of the cell
+        crosses = np.cross(edges[0], edges[1])
+        normal = crosses.sum(axis=1)
+        normal = normal/np.maximum(_norm(normal), np.finfo(float).tiny)[:, np.newaxis]
+        det = np.einsum('ijk,ik->ij', crosses, normal)
+    return det, lengths
+
+
+def _edges(shape):
+    """Unique edges of a shape from its faces"""
+    edges = set()
+    for face in shape.faces:
+        for a, b in zip(face, face[1:] + face[:1]):
+            edges.add((min(a, b), max(a, b)))
+    return np.array(sorted(edges))
+
+
+def _face_angles(shape):
+    """Points, previous and next points and ideal angle of every angle of
+    the faces of a shape
+    """
+    angles = []
+    for face in shape.faces:
+        n = len(face)
+        ideal = np.pi*(n - 2)/n
+        for j in range(n):
+            angles.append((face[j], face[j - 1], face[(j + 1) % n], ideal))
+    angles = np.array(angles)
+    return angles[:, :3].astype(int), angles[:, 3]
+
+
+def _scaled_jacobian(shape, pts):
+    """Scaled Jacobian of the cells ``pts`` as computed by Verdict"""
+    det, lengths = _corner_jacobians(shape, pts)
+    if shape is _TETRA or shape is _PYRAMID:
+        # the Jacobian of a tetrahedron is the same at all its corners and
+        # is scaled by the largest product of edge lengths at a corner
+        det = det.reshape(len(pts), -1, 4)[:, :, 0]
+        lengths = lengths.reshape(len(pts), -1, 4).max(axis=2)
+    scaled = _divide(det, lengths)
+    if shape is _HEXAHEDRON:
+        # principal axes through the center of the hexahedron
+        axes = [pts[:, list(plus)].sum(axis=1) - pts[:, list(minus)].sum(axis=1)
+                for plus, minus in (((1, 2, 5, 6), (0, 3, 4, 7)),
+                                    ((2, 3, 6, 7), (0, 1, 4, 5)),
+                                    ((4, 5, 6, 7), (0, 1, 2, 3)))]
+        center = _divide(np.einsum('ij,ij->i', axes[0], np.cross(axes[1], axes[2])),
+                         np.prod([_norm(a) for a in axes], axis=0))
+        scaled = np.column_stack((scaled, center))
+    quality = scaled.min(axis=1)*shape.factor
+    if shape is _PYRAMID:
+        # values above that of the ideal pyramid are folded back below 1
+        # and inverted pyramids are given 0
+        quality = np.where(quality > 1, 2 - quality, np.maximum(quality, 0))
+    return quality
+
+
+def _measure(shape, pts, metric):
+    """Compute ``metric`` for the cells ``pts`` of the same shape"""
+    if metric == 'scaled_jacobian':
+        return _scaled_jacobian(shape, pts)
+
+    if metric == 'jacobian':
+        det, _ = _corner_jacobians(shape, pts)
+        return det.min(axis=1)
+
+    if metric == 'aspect_ratio':
+        edges = _edges(shape)
+        lengths = _norm(pts[:, edges[:, 1]] - pts[:, edges[:, 0]])
+        return _divide(lengths.max(axis=1), lengths.min(axis=1), np.inf)
+
+    if metric == 'skew':
+        ids, ideal = _face_angles(shape)
+        a = pts[:, ids[:, 1]] - pts[:, ids[:, 0]]
+        b = pts[:, ids[:, 2]] - pts[:, ids[:, 0]]
+        cos = _divide(np.einsum('ijk,ijk->ij', a, b), _norm(a)*_norm(b), 1.0)
+        angle = np.arccos(np.clip(cos, -1, 1))
+        skew = np.maximum((angle - ideal)/(np.pi - ideal), (ideal - angle)/ideal)
+        return skew.max(axis=1)
+
+    if metric == 'volume':
+        center = pts.mean(axis=1)
+        if shape.dim == 2:
+            face = np.array(shape.faces[0])
+            a = pts[:, face] - center[:, np.newaxis]
+            b = pts[:, np.roll(face, -1)] - center[:, np.newaxis]
+            crosses = np.cross(a, b)
+            normal = crosses.sum(axis=1)
+            normal = normal/np.maximum(_norm(normal), np.finfo(float).tiny)[:, np.newaxis]
+            return np.einsum('ijk,ik->i', crosses, normal)/2
+        # sum of the tetrahedra between the center of the cell, the
+        # center of each face and each edge of the face
+        volume = np.zeros(len(pts))
+        for face in shape.faces:
+            face = np.array(face)
+            face_center = pts[:, face].mean(axis=1) - center
+            a = pts[:, face] - center[:, np.newaxis]
+            b = pts[:, np.roll(face, -1)] - center[:, np.newaxis]
+            volume += np.einsum('ijk,ik->i', np.cross(a, b), face_center)
+        return volume/6
+
+    raise ValueError('Unknown quality metric "%s".  Choose from %s'
+                     % (metric, ', '.join(QUALITY_METRICS)))
+
+
+def cell_quality(dataset, metric='scaled_jacobian', chunk_size=QUALITY_CHUNK_SIZE):
+    """Compute a quality metric of every cell of a dataset.
+
+    Triangles, quads, pixels, tetrahedra, pyramids, wedges, hexahedra
+    and voxels are supported, along with their quadratic, Lagrange and
+    Bezier counterparts, which are measured through their corners.
+
+    Parameters
+    ----------
+    dataset : pyvista.Common
+        Any dataset.  Datasets other than unstructured grids are
+        converted to an unstructured grid first.
+
+    metric : str, optional
+        One of ``'scaled_jacobian'``, ``'jacobian'``,
+        ``'aspect_ratio'``, ``'skew'`` or ``'volume'``.
+
+    chunk_size : int, optional
+        Number of cells measured at once.
+
+    Returns
+    -------
+    quality : np.ndarray
+        Metric of each cell, ``NaN`` for cells of unsupported types.
+
+    Examples
+    --------
+    >>> import pyvista
+    >>> from pyvista import examples
+    >>> hexbeam = examples.load_hexbeam()
+    >>> quality = pyvista.cell_quality(hexbeam, 'scaled_jacobian')
+    >>> bool(quality.min() > 0)
+    True
+
+    """
+    if metric not in QUALITY_METRICS:
+        raise ValueError('Unknown quality metric "%s".  Choose from %s'
+                         % (metric, ', '.join(QUALITY_METRICS)))
+    if not isinstance(dataset, vtk.vtkUnstructuredGrid):
+        dataset = pyvista.wrap(dataset).cast_to_unstructured_grid()
+    quality = np.full(dataset.GetNumberOfCells(), np.nan)
+    if not quality.size:
+        return quality
+
+    points = dataset.points.astype(np.float64, copy=False)
+    cells = dataset.cells
+    locations = cell_locations(dataset)
+    celltypes = dataset.celltypes
+    sizes = cells[locations]
+    linear_types, n_corners = linear_cell_tables()
+    chunk_size = max(int(chunk_size), 1)
+    for cell_type in np.unique(celltypes):
+        linear_type = linear_types[cell_type]
+        if linear_type not in _CELL_SHAPES:
+            continue
+        shape, order = _CELL_SHAPES[linear_type]
+        index = ((celltypes == cell_type) & (sizes >= len(order))).nonzero()[0]
+        # corners are the first points of higher order cells
+        positions = np.array(order, pyvista.ID_TYPE) + 1
+        for start in range(0, len(index), chunk_size):
+            chunk = index[start:start + chunk_size]
+            ids = cells[locations[chunk, np.newaxis] + positions]
+            quality[chunk] = _measure(shape, points[ids], metric)
+    return quality
+
+
+def quality_summary(quality):
+    """Summarize cell quality values, ignoring ``NaN``.
+
+    Parameters
+    ----------
+    quality : np.ndarray
+        Values from :func:`cell_quality`.
+
+    Returns
+    -------
+    summary : dict
+        ``'min'``, ``'max'``, ``'mean'`` and ``'std'`` of the values and
+        ``'n_cells'``, the number of cells measured.
+
+    """
+    quality = np.asarray(quality, dtype=np.float64)
+    valid = quality[~np.isnan(quality)]
+    if not valid.size:
+        return {'min': np.nan, 'max': np.nan, 'mean': np.nan, 'std': np.nan,
+                'n_cells': 0}
+    return {'min': valid.min(), 'max': valid.max(), 'mean': valid.mean(),
+            'std': valid.std(), 'n_cells': valid.size}
@@ -0,0 +1,171 @@
+"""
+Vectorized application of 4x4 transformation matrices to points and
+vectors
+"""
+import numpy as np
+import vtk
+
+from .utilities import trans_from_matrix
+
+# number of rows transformed at once, small enough for the temporary
+# buffer to stay in cache
+TRANSFORM_CHUNK_SIZE = 65536
+
+
+def transformation_matrix(trans):
+    """Return a 4x4 ``np.ndarray`` from a transformation.
+
+    Parameters
+    ----------
+    trans : vtk.vtkMatrix4x4, vtk.vtkTransform, or np.ndarray
+        Accepts a vtk transformation object or a 4x4 transformation matrix.
+
+    """
+    if isinstance(trans, vtk.vtkMatrix4x4):
+        return trans_from_matrix(trans)
+    elif isinstance(trans, vtk.vtkTransform):
+        return trans_from_matrix(trans.GetMatrix())
+    elif isinstance(trans, np.ndarray):
+        if trans.shape != (4, 4):
+            raise Exception('Transformation array must be 4x4')
+        return trans
+    raise TypeError('Input transform must be either:\n'
+                    + '\tvtk.vtkMatrix4x4\n'
+                    + '\tvtk.vtkTransform\n'
+                    + '\t4x4 np.ndarray\n')
+
+
+def axis_rotation_matrix(angle, axis='z', deg=True):
+    """Return the 4x4 matrix rotating by ``angle`` about an axis.
+
+    Parameters
+    ----------
+    angle : float
+        Angle of the rotation.
+
+    axis : str, optional
+        ``'x'``, ``'y'`` or ``'z'``.
+
+    deg : bool, optional
+        ``angle`` is in degrees rather than radians.
+
+    """
+    axis = axis.lower()
+    if axis not in ('x', 'y', 'z'):
+        raise Exception('invalid axis.  Must be either "x", "y", or "z"')
+    if deg:
+        angle = angle * np.pi / 180
+    cos, sin = np.cos(angle), np.sin(angle)
+    i, j = {'x': (1, 2), 'y': (2, 0), 'z': (0, 1)}[axis]
+    t = np.eye(4)
+    t[i, i] = cos
+    t[i, j] = -sin
+    t[j, i] = sin
+    t[j, j] = cos
+    return t
+
+
+def is_affine(t):
+    """Return True when the matrix has no perspective component"""
+    return np.array_equal(t[3], [0, 0, 0, 1])
+
+
+def _transform_rows(array, matrix, offset=None, w=None,
+                    chunk_size=TRANSFORM_CHUNK_SIZE):
+    """Compute ``array @ matrix.T (+ offset) (/ w)`` in place, in chunks"""
+    n = array.shape[0]
+    chunk_size = max(min(int(chunk_size), n), 1)
+    buf = np.empty((chunk_size, 3), dtype=array.dtype)
+    if w is not None:
+        wbuf = np.empty((chunk_size, ), dtype=array.dtype)
+    matrix_t = np.ascontiguousarray(matrix.T, dtype=array.dtype)
+    for start in range(0, n, chunk_size):
+        chunk = array[start:start + chunk_size]
+        out = buf[:len(chunk)]
+        np.matmul(chunk, matrix_t, out=out)
+        if offset is not None:
+            out += offset
+        if w is not None:
+            wout = wbuf[:len(chunk)]
+            np.dot(chunk, w[:3].astype(array.dtype), out=wout)
+            wout += w[3]
+            out /= wout[:, np.newaxis]
+        chunk[:] = out
+
+
+def apply_transformation_to_points(transformation, points, inplace=False,
+                                   chunk_size=TRANSFORM_CHUNK_SIZE):
+    """Apply a 4x4 transformation to an ``(N, 3)`` array of points.
+
+    The points are transformed with one matrix product per chunk of
+    ``chunk_size`` rows in the precision of ``points``.
+
+    Parameters
+    ----------
+    transformation : np.ndarray
+        4x4 transformation matrix.
+
+    points : np.ndarray
+        ``(N, 3)`` ``np.float32`` or ``np.float64`` array.
+
+    inplace : bool, optional
+        Overwrite ``points`` rather than returning a transformed copy.
+
+    chunk_size : int, optional
+        Number of points transformed at once.
+
+    """
+    if transformation.shape != (4, 4):
+        raise ValueError('Transformation array must be 4x4')
+    if points.ndim != 2 or points.shape[1] != 3:
+        raise ValueError('Points must be an (N, 3) array')
+    if not inplace:
+        points = points.astype(np.result_type(points.dtype, np.float32))
+    elif points.dtype not in (np.float32, np.float64):
+        raise TypeError('Points must be float32 or float64 to be '
+                        'transformed in place')
+    if points.size:
+        w = None if is_affine(transformation) else transformation[3]
+        _transform_rows(points, transformation[:3, :3],
+                        transformation[:3, 3].astype(points.dtype), w,
+                        chunk_size)
+    if not inplace:
+        return points
+
+
+def apply_transformation_to_vectors(transformation, vectors, normals=False,
+                                    chunk_size=TRANSFORM_CHUNK_SIZE):
+    """Transform an ``(N, 3)`` array of vectors or normals in place.
+
+    Vectors are transformed by the linear part of the transformation.
+    Normals are transformed by its inverse transpose and renormalized so
+    that they remain perpendicular to the transformed surface.
+
+    Parameters
+    ----------
+    transformation : np.ndarray
+        4x4 transformation matrix.
+
+    vectors : np.ndarray
+        ``(N, 3)`` ``np.float32`` or ``np.float64`` array.
+
+    normals : bool, optional
+        Transform as normals rather than vectors.
+
+    chunk_size : int, optional
+        Number of vectors transformed at once.
+
+    """
+    if vectors.dtype not in (np.float32, np.float64):
+        raise TypeError('Vectors must be float32 or float64 to be '
+                        'transformed in place')
+    if not vectors.size:
+        return
+    matrix = transformation[:3, :3]
+    if normals:
+        matrix = np.linalg.inv(matrix).T
+    _transform_rows(vectors, matrix, chunk_size=chunk_size)
+    if normals:
+        lengths = np.linalg.norm(vectors, axis=1)
+        lengths[lengths == 0] = 1
+        vectors /= lengths[:, np.newaxis]
@@ -1,3 +1,4 @@
+import gc
 import sys
 
 import numpy as np
@@ -124,6 +125,121 @@ def test_transform():
     assert np.allclose(grid_a.points, grid_c.points)
 
 
+def test_transform_precision_and_vectors():
+    trans = vtk.vtkTransform()
+    trans.RotateX(30)
+    trans.Translate(1, 1, 2)
+    trans.Update()
+    mesh = pyvista.Sphere()
+    trans_filter = vtk.vtkTransformFilter()
+    trans_filter.SetTransform(trans)
+    trans_filter.SetInputData(mesh)
+    trans_filter.Update()
+    expected = pyvista.PolyData(trans_filter.GetOutput())
+
+    dtype = mesh.points.dtype
+    mesh.transform(trans, transform_vectors=True)
+    assert mesh.points.dtype == dtype
+    assert np.allclose(mesh.points, expected.points, atol=1E-6)
+    assert np.allclose(mesh['Normals'], expected['Normals'], atol=1E-6)
+
+    points = np.random.random((100, 3))
+    t = pyvista.trans_from_matrix(trans.GetMatrix())
+    out = pyvista.apply_transformation_to_points(t, points, chunk_size=7)
+    assert np.allclose(out, points.dot(t[:3, :3].T) + t[:3, 3])
+
+
+def test_transform_lazy():
+    mesh = pyvista.Sphere()
+    expected = mesh.copy()
+    expected.rotate_x(30)
+    expected.translate([1, 2, 3])
+    mesh.transform(pyvista.axis_rotation_matrix(30, axis='x'), lazy=True)
+    mesh.transform(np.array([[1, 0, 0, 1],
+                             [0, 1, 0, 2],
+                             [0, 0, 1, 3],
+                             [0, 0, 0, 1.]]), lazy=True)
+    assert mesh._pending_transform is not None
+    assert np.allclose(mesh.bounds, expected.bounds)
+    assert mesh._pending_transform is None
+    assert np.allclose(mesh.points, expected.points, atol=1E-6)
+
+
+def test_transform_lazy_filters(tmpdir):
+    scale = np.diag([2., 2, 2, 1])
+    mesh = pyvista.Sphere()
+    mesh.transform(scale, lazy=True)
+    bounds = mesh.cell_centers().GetBounds()
+    assert np.isclose(bounds[1], 2*pyvista.Sphere().cell_centers().GetBounds()[1])
+
+    # PolyData methods and saving
+    mesh = pyvista.Sphere()
+    mesh.transform(scale, lazy=True)
+    assert np.isclose(mesh.decimate(0.5).bounds[1], 1, atol=0.01)
+    mesh = pyvista.Sphere()
+    mesh.transform(scale, lazy=True)
+    filename = str(tmpdir.join('tmp.vtk'))
+    mesh.save(filename)
+    assert np.isclose(pyvista.read(filename).bounds[1], mesh.bounds[1])
+
+    # overwriting drops the lazy transformation of the target
+    mesh = pyvista.Sphere()
+    mesh.transform(scale, lazy=True)
+    source = pyvista.Sphere()
+    source.transform(scale, lazy=True)
+    mesh.overwrite(source)
+    assert np.allclose(mesh.bounds, source.bounds)
+    assert np.isclose(mesh.bounds[1], 2*pyvista.Sphere().bounds[1])
+
+    # filters running VTK algorithms, derived properties and setters
+    mesh = pyvista.Sphere()
+    mesh.transform(scale, lazy=True)
+    assert np.isclose(mesh.elevation().bounds[1], 2*pyvista.Sphere().bounds[1])
+    mesh = pyvista.Sphere()
+    mesh.transform(scale, lazy=True)
+    assert np.isclose(mesh.area, 4*pyvista.Sphere().area)
+    mesh = pyvista.Sphere()
+    mesh.transform(scale, lazy=True)
+    assert np.isclose(mesh.outline().bounds[1], 2*pyvista.Sphere().bounds[1])
+
+    # replacing the geometry discards the lazy transformation
+    translation = np.eye(4)
+    translation[:3, 3] = 10
+    mesh = pyvista.Sphere()
+    mesh.transform(translation, lazy=True)
+    mesh.points = np.zeros((mesh.n_points, 3))
+    assert np.allclose(mesh.points[0], 0)
+    mesh = pyvista.Sphere()
+    mesh.transform(scale, lazy=True)
+    mesh.ShallowCopy(pyvista.Sphere())
+    assert np.allclose(mesh.bounds, pyvista.Sphere().bounds)
+    mesh = pyvista.Sphere()
+    mesh.transform(scale, lazy=True)
+    mesh.DeepCopy(pyvista.Cube())
+    assert np.allclose(mesh.bounds, pyvista.Cube().bounds)
+    grid = examples.load_uniform()
+    grid.transform(scale, lazy=True)
+    grid.points = examples.load_uniform().points
+    assert np.allclose(grid.bounds, examples.load_uniform().bounds)
+
+    # vectors are only transformed on request
+    mesh = pyvista.Sphere()
+    normals = mesh['Normals'].copy()
+    mesh.transform(pyvista.axis_rotation_matrix(90, axis='z'))
+    assert np.allclose(mesh['Normals'], normals)
+
+
+def test_transform_grids():
+    trans = np.diag([2.0, 3.0, 4.0, 1.0])
+    trans[:3, 3] = [1, 2, 3]
+    for grid in [examples.load_uniform(), examples.load_rectilinear()]:
+        points = grid.points
+        grid.transform(trans)
+        assert np.allclose(grid.points, points*[2, 3, 4] + [1, 2, 3])
+        with pytest.raises(ValueError):
+            grid.rotate_z(30)
+
+
 def test_transform_errors():
     grid = GRID.copy()
     with pytest.raises(TypeError):
@@ -528,3 +644,99 @@ def test_scalars_dict_update():
     assert 'foo' in mesh.scalar_names
     assert 'rand' in mesh.scalar_names
     assert len(mesh.point_arrays) == n + 2
+
+
+def test_copy_on_write():
+    grid = GRID.copy()
+    grid.point_arrays['data'] = np.arange(grid.n_points, dtype=float)
+    copy = grid.copy(copy_on_write=True)
+    # the buffers are shared until written to
+    assert np.shares_memory(copy.points, grid.points)
+    assert np.shares_memory(copy.point_arrays['data'], grid.point_arrays['data'])
+
+    copy.points[:, 0] += 1
+    assert not np.shares_memory(copy.points, grid.points)
+    assert np.allclose(copy.points[:, 0], grid.points[:, 0] + 1)
+
+    data = grid.point_arrays['data']
+    data[0] = -1
+    assert copy.point_arrays['data'][0] == 0
+    assert grid.point_arrays['data'][0] == -1
+    assert copy.active_scalar_name == grid.active_scalar_name
+
+    # in-place transformations
+    other = grid.copy(copy_on_write=True)
+    other.translate((1, 0, 0))
+    assert np.allclose(other.points[:, 0], grid.points[:, 0] + 1)
+
+    # overwrite adopts the arrays of the mesh and copies them on write
+    mesh = pyvista.Sphere()
+    target = pyvista.PolyData()
+    target.overwrite(mesh)
+    assert np.shares_memory(target.points, mesh.points)
+    target.points *= 2
+    assert np.allclose(target.points, mesh.points*2)
+
+
+def test_overwrite_inplace_filter_independent():
+    mesh = pyvista.Sphere()
+    mesh.point_arrays['height'] = mesh.points[:, 2]
+    expected = mesh.warp_by_scalar('height')
+    mesh.warp_by_scalar('height', inplace=True)
+    # the filter output is gone once the filter returns
+    gc.collect()
+    assert np.allclose(mesh.points, expected.points)
+    assert np.allclose(mesh.point_arrays['height'], expected.point_arrays['height'])
+
+    # and the adopted arrays stay writable and owned by the mesh
+    output = mesh.warp_by_scalar('height')
+    target = pyvista.PolyData()
+    target.overwrite(output)
+    points = output.points.copy()
+    del output
+    gc.collect()
+    assert np.allclose(target.points, points)
+    target.points[0] = 0
+    target.point_arrays['height'][:] = 1
+    assert np.allclose(target.points[0], 0)
+    assert np.allclose(target.point_arrays['height'], 1)
+    assert np.allclose(mesh.points, expected.points)
+
+
+def test_batch_modify():
+    mesh = pyvista.Sphere()
+    mesh.point_arrays['data'] = np.zeros(mesh.n_points)
+    points = mesh.points
+    data = mesh.point_arrays['data']
+    events = []
+    for vtkobj in (mesh.GetPoints().GetData(), mesh.GetPointData().GetArray('data'),
+                   mesh.GetPointData()):
+        vtkobj.AddObserver('ModifiedEvent',
+                           lambda obj, event, name=vtkobj.GetClassName(): events.append(name))
+
+    points[0] = 0
+    points[1] = 0
+    assert len(events) == 2
+
+    del events[:]
+    with mesh.batch_modify():
+        for i in range(10):
+            points[i] = i
+            data[i] = i
+        points *= 1
+        with mesh.batch_modify():
+            data[:5] = 1
+        mesh.point_arrays['other'] = np.ones(mesh.n_points)
+        n_inside = len(events)
+    # adding an array notifies through VTK itself
+    assert n_inside <= 2
+    assert len(events) - n_inside == 3
+    assert np.all(data[:5] == 1)
+
+    # batches on a single array
+    del events[:]
+    with data.batch_modify():
+        for i in range(10):
+            data[i:i+1] = 2
+            data[i:i+1] *= 2
+    assert len(events) == 1
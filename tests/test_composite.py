@@ -327,3 +327,95 @@ def test_multi_block_length():
     multi.append(ex.load_airplane())
     multi.append(None)
     assert multi.length
+
+
+def test_multi_block_name_index():
+    multi = pyvista.MultiBlock()
+    for i in range(5):
+        multi[i, 'block{}'.format(i)] = pyvista.Sphere(center=(i, 0, 0))
+    assert multi.keys() == ['block{}'.format(i) for i in range(5)]
+    assert multi.get_index_by_name('block3') == 3
+    multi['extra'] = pyvista.Cube()
+    assert multi.get_index_by_name('extra') == 5
+    # renaming through VTK directly is picked up
+    multi.GetMetaData(1).Set(vtk.vtkCompositeDataSet.NAME(), 'renamed')
+    multi.Modified()
+    assert multi.get_index_by_name('renamed') == 1
+    with pytest.raises(KeyError):
+        multi.get_index_by_name('block1')
+    multi.set_block_name(4, 'block0')
+    assert multi.get_index_by_name('block0') == 0
+    del multi['block0']
+    assert multi.get_index_by_name('block0') == 3
+    popped = multi.pop('renamed')
+    assert popped.n_points
+    assert multi.keys() == ['block2', 'block3', 'block0', 'extra']
+    assert multi.get_index_by_name('extra') == 3
+    assert len(multi.refs) >= multi.n_blocks
+    # refs remains a list of the referenced datasets
+    assert isinstance(multi.refs, list)
+    block = multi[0]
+    n_refs = len(multi.refs)
+    multi[0]
+    assert len(multi.refs) == n_refs
+    assert any(ref is block for ref in multi.refs)
+
+
+def test_multi_block_bounds_and_range():
+    multi = pyvista.MultiBlock()
+    assert multi.bounds == [np.inf, -np.inf, np.inf, -np.inf, np.inf, -np.inf]
+    sphere = pyvista.Sphere()
+    sphere.point_arrays['data'] = sphere.points[:, 2]
+    cube = pyvista.Cube(center=(5, 0, 0))
+    cube.point_arrays['data'] = np.full(cube.n_points, np.nan)
+    nested = pyvista.MultiBlock([cube])
+    multi.append(sphere)
+    multi.append(nested)
+    multi.append(None)
+    bounds = np.array(multi.bounds)
+    expected = np.array([sphere.bounds, cube.bounds])
+    expected = np.vstack((expected[:, ::2].min(0), expected[:, 1::2].max(0))).T.ravel()
+    assert np.allclose(bounds, expected)
+    assert np.allclose(multi.get_data_range('data'),
+                       (sphere.points[:, 2].min(), sphere.points[:, 2].max()))
+    # modifying a leaf updates the aggregate
+    sphere.points *= 2
+    assert np.isclose(multi.bounds[5], sphere.bounds[5])
+    assert multi.get_data_range('missing') == (np.inf, -np.inf)
+
+
+def test_multi_block_leaves():
+    sphere, cube, cone = pyvista.Sphere(), pyvista.Cube(), pyvista.Cone()
+    sphere.point_arrays['data'] = np.arange(sphere.n_points, dtype=float)
+    cube.cell_arrays['data'] = -np.arange(cube.n_cells, dtype=float)
+    nested = pyvista.MultiBlock()
+    nested[0, 'nested cube'] = cube
+    nested.append(None)
+    multi = pyvista.MultiBlock()
+    multi[0, 'sphere'] = sphere
+    multi[1, 'nested'] = nested
+    multi[2, 'empty'] = pyvista.MultiBlock()
+    multi[3, 'cone'] = cone
+    leaves = list(multi.leaves())
+    assert [leaf[0] for leaf in leaves] == [1, 3, 6]
+    assert [leaf[1] for leaf in leaves] == [(0, ), (1, 0), (3, )]
+    assert [leaf[2] for leaf in leaves] == ['sphere', 'nested cube', 'cone']
+    assert leaves[1][3] is cube
+    assert len(list(multi.leaves(skip_empty=False))) == 4
+    assert all(is_wrapped for is_wrapped in
+               (pyvista.is_pyvista_obj(leaf[3])
+                for leaf in multi.leaves(wrap_blocks=True)))
+
+    # iteration is stateless
+    pairs = [(a, b) for a in multi for b in multi]
+    assert len(pairs) == multi.n_blocks**2
+
+    assert multi.n_points == sphere.n_points + cube.n_points + cone.n_points
+    assert multi.n_cells == sphere.n_cells + cube.n_cells + cone.n_cells
+    ranges = multi.get_data_ranges()
+    assert ranges['data'] == (-(cube.n_cells - 1), sphere.n_points - 1)
+    assert multi.get_data_ranges(['data', 'missing'])['missing'] == (np.inf, -np.inf)
+    assert multi.get_data_range('data') == ranges['data']
+
+    merged = multi.combine()
+    assert merged.n_cells == multi.n_cells
@@ -1,8 +1,12 @@
+import gc
+
 import numpy as np
 import pytest
+import vtk
 
 import pyvista
 from pyvista import examples
+from pyvista.core.filters import _cell_locator, _point_locator
 
 DATASETS = [
     examples.load_uniform(), # UniformGrid
@@ -122,6 +126,38 @@ def test_threshold():
         dataset.threshold([10, 100, 300])
 
 
+def test_threshold_criteria():
+    dataset = examples.load_uniform()
+    cell_data = dataset['Spatial Cell Data']
+    criteria = (pyvista.ScalarRange('Spatial Cell Data', 0, 100) |
+                pyvista.ScalarRange('Spatial Cell Data', 600, 700))
+    mask = criteria.cell_mask(dataset)
+    expected = ((cell_data >= 0) & (cell_data <= 100)) | \
+               ((cell_data >= 600) & (cell_data <= 700))
+    assert np.array_equal(mask, expected)
+    result = dataset.threshold_criteria(criteria)
+    assert isinstance(result, pyvista.UnstructuredGrid)
+    assert result.n_cells == expected.sum()
+    assert 'vtkOriginalCellIds' not in result.scalar_names
+
+    # point criteria keep cells with all points within the range
+    point_data = dataset['Spatial Point Data']
+    combined = criteria & ~pyvista.ScalarRange('Spatial Point Data', upper=50,
+                                               preference='point')
+    result = dataset.threshold_criteria(combined)
+    assert result.n_cells < expected.sum()
+    assert result['Spatial Point Data'].min() >= point_data.min()
+
+    # an inverted range is a single pass without duplicate cells
+    inverted = dataset.threshold([100, 500], invert=True,
+                                 scalars='Spatial Cell Data')
+    assert inverted.n_cells == np.sum((cell_data <= 100) | (cell_data >= 500))
+    with pytest.raises(KeyError):
+        pyvista.ScalarRange('not an array').cell_mask(dataset)
+    with pytest.raises(ValueError):
+        pyvista.ScalarRange('Spatial Cell Data', 10, 1)
+
+
 def test_threshold_percent():
     percents = [25, 50, [18.0, 85.0], [19.0, 80.0], 0.70]
     inverts = [False, True, False, True, False]
@@ -310,6 +346,33 @@ def test_split_and_connectivity():
     for i, body in enumerate(bodies):
         assert np.allclose(body.volume, volumes[i], rtol=0.1)
 
+    # only the large body
+    large = threshed.split_bodies(min_cells=100, label=True)
+    assert large.n_blocks == 1
+    assert np.allclose(large[0].volume, volumes[0], rtol=0.1)
+    assert 'RegionId' in large[0].cell_arrays
+
+    # bodies are only built on access
+    lazy = threshed.split_bodies(lazy=True)
+    assert lazy.n_blocks == 2
+    assert lazy.GetBlock(1) is None
+    assert np.allclose(lazy[1].volume, volumes[1], rtol=0.1)
+    assert lazy.GetBlock(1) is not None
+    assert 'RegionId' not in lazy[1].cell_arrays
+
+    # describing the bodies does not build them
+    lazy = threshed.split_bodies(lazy=True)
+    repr(lazy)
+    lazy._repr_html_()
+    assert len(lazy._lazy_blocks) == 2
+    assert np.allclose(lazy.bounds, bodies.bounds)
+    assert lazy.n_points == bodies.n_points
+    assert lazy.n_cells == bodies.n_cells
+    assert len(lazy._lazy_blocks) == 2
+    lazy[0]
+    assert np.allclose(lazy.bounds, bodies.bounds)
+    assert lazy.n_points == bodies.n_points
+
 
 def test_warp_by_scalar():
     data = examples.load_uniform()
@@ -389,6 +452,42 @@ def test_streamlines():
     assert src.n_points == 25
 
 
+def test_probe():
+    mesh = examples.load_uniform()
+    points = np.array([[1.5, 2.5, 3.5], [100.0, 0.0, 0.0]])
+    values, valid = mesh.probe(points, scalars='Spatial Point Data')
+    assert np.array_equal(valid, [True, False])
+    expected = pyvista.PolyData(points).sample(mesh)['Spatial Point Data']
+    assert np.allclose(values, expected)
+    # the cell locator is reused
+    locator = _cell_locator(mesh)
+    mesh.probe(points, chunk_size=1)
+    assert _cell_locator(mesh) is locator
+    with pytest.raises(KeyError):
+        mesh.probe(points, scalars='not an array')
+
+
+def test_sample_over_lines():
+    mesh = examples.load_uniform()
+    lines = np.array([[[0, 0, 0], [9, 9, 9]],
+                      [[0, 9, 0], [9, 0, 9]]])
+    distance, values, valid = mesh.sample_over_lines(lines, resolution=10)
+    assert distance.shape == values.shape == valid.shape == (2, 11)
+    assert np.all(valid)
+    line = pyvista.Line([0, 0, 0], [9, 9, 9], resolution=10).sample(mesh)
+    assert np.allclose(distance[0], line['Distance'])
+    assert np.allclose(values[0], line['Spatial Point Data'])
+
+    # polylines of different lengths leaving the dataset
+    polylines = [[[0, 0, 0], [5, 0, 0], [5, 5, 0]], [[1, 1, 1], [20, 1, 1]]]
+    distance, values, valid = mesh.sample_over_lines(polylines, resolution=4,
+                                                     scalars='Spatial Cell Data')
+    assert np.allclose(distance, [[0, 2.5, 5, 7.5, 10], [0, 4.75, 9.5, 14.25, 19]])
+    assert np.array_equal(valid[1], [True, True, False, False, False])
+    with pytest.raises(RuntimeError):
+        mesh.sample_over_lines(lines, resolution=0)
+
+
 def test_plot_over_line():
     """this requires matplotlib"""
     mesh = examples.load_channels()
@@ -438,6 +537,31 @@ def test_interpolate():
     assert interpolated.n_arrays
 
 
+def test_interpolate_direct():
+    cloud = pyvista.PolyData(np.random.random((2000, 3))*10)
+    cloud['values'] = cloud.points[:, 0]
+    target = pyvista.Plane(center=(5, 5, 5), i_size=8, j_size=8)
+    for kernel in ['gaussian', 'shepard', 'voronoi', 'linear']:
+        result = target.interpolate(cloud, kernel=kernel, n_points=8)
+        assert result.n_points == target.n_points
+        assert np.all(result['vtkValidPointMask'])
+        assert np.allclose(result['values'], target.points[:, 0], atol=1.5)
+    # the point locator of the source is reused
+    locator = _point_locator(cloud)
+    result = target.interpolate(cloud, radius=1E-6, null_value=-1.0)
+    assert _point_locator(cloud) is locator
+    assert not np.any(result['vtkValidPointMask'])
+    assert np.all(result['values'] == -1.0)
+    with pytest.raises(ValueError):
+        target.interpolate(cloud, kernel='not a kernel')
+    # kernel objects are configured by the caller
+    kernel = vtk.vtkGaussianKernel()
+    kernel.SetRadius(2.0)
+    assert target.interpolate(cloud, kernel=kernel).n_points == target.n_points
+    with pytest.raises(ValueError):
+        target.interpolate(cloud, kernel=kernel, radius=2.0)
+
+
 def test_select_enclosed_points():
     mesh = examples.load_uniform()
     surf = pyvista.Sphere(center=mesh.center, radius=mesh.length/2.)
@@ -445,9 +569,150 @@ def test_select_enclosed_points():
     assert isinstance(result, type(mesh))
     assert 'SelectedPoints' in result.scalar_names
     assert result.n_arrays == mesh.n_arrays + 1
+    assert 'SelectedPoints' not in mesh.scalar_names
+    inverse = mesh.select_enclosed_points(surf, inside_out=True)
+    assert np.array_equal(inverse['SelectedPoints'], 1 - result['SelectedPoints'])
+    # open surfaces mark every point outside
+    result = mesh.select_enclosed_points(pyvista.Plane())
+    assert not np.any(result['SelectedPoints'])
 
 
 def test_decimate_boundary():
     mesh = examples.load_uniform()
     boundary = mesh.decimate_boundary()
     assert boundary.n_points
+
+
+def test_filter_cache():
+    cache = pyvista.get_filter_cache()
+    assert not cache.enabled
+    pyvista.set_filter_cache(True, max_items=4)
+    try:
+        dataset = examples.load_uniform()
+        first = dataset.contour([100, 200])
+        second = dataset.contour(isosurfaces=[100, 200])
+        assert cache.stats()['hits'] == 1
+        assert cache.stats()['misses'] == 1
+        assert cache.nbytes > 0
+        assert second is not first
+        assert np.allclose(first.points, second.points)
+
+        # different parameters and modified inputs are recomputed
+        dataset.contour([100, 300])
+        dataset.point_arrays['Spatial Point Data'] *= 2
+        dataset.contour([100, 200])
+        assert cache.stats()['hits'] == 1
+
+        # modified outputs are discarded
+        clipped = dataset.clip()
+        clipped.points[:] += 1
+        assert not np.allclose(dataset.clip().points, clipped.points)
+
+        # composite inputs are keyed on their blocks
+        composite = pyvista.MultiBlock([pyvista.Sphere()])
+        composite.clip()
+        composite[0].points[:] += 1
+        hits = cache.hits
+        composite.clip()
+        assert cache.hits == hits
+        assert len(cache) <= 4
+
+        # inplace filters are never cached
+        dataset.texture_map_to_plane(inplace=True)
+    finally:
+        pyvista.set_filter_cache(False)
+    assert len(cache) == 0
+
+
+def test_pipeline():
+    dataset = examples.load_uniform()
+    expected = dataset.clip(normal='x').threshold([100, 500]).extract_geometry()
+    pipe = dataset.pipeline().clip(normal='x').threshold([100, 500])
+    iso = pipe.extract_geometry()
+    clip, thresh, geom = iso.stages
+    assert clip.n_executions == 0
+    output = iso.update()
+    assert isinstance(output, pyvista.PolyData)
+    assert output.n_cells == expected.n_cells
+    iso.update()
+    assert [s.n_executions for s in iso.stages] == [1, 1, 1]
+
+    # only the stages downstream of a change are executed again
+    thresh.set_parameters([100, 300])
+    assert iso.update().n_cells < output.n_cells
+    assert [s.n_executions for s in iso.stages] == [1, 2, 2]
+    # the previous output is unaffected
+    assert output.n_cells == expected.n_cells
+
+    # modifying the source reruns everything
+    dataset.point_arrays['Spatial Point Data'] *= 0.5
+    dataset.Modified()
+    iso.update()
+    assert [s.n_executions for s in iso.stages] == [2, 3, 3]
+
+    # branches share their first stages
+    slc = pipe.slice(normal='z').update()
+    assert isinstance(slc, pyvista.PolyData)
+    assert clip.n_executions == 2
+
+    # released intermediate outputs
+    released = dataset.pipeline(release_data=True).clip().contour([100, 200])
+    assert released.update().n_points
+    assert released.stages[0].GetOutputDataObject(0).GetNumberOfPoints() == 0
+
+    composite = pyvista.MultiBlock([examples.load_uniform(), pyvista.Sphere()])
+    assert isinstance(composite.pipeline().clip().update(), pyvista.MultiBlock)
+
+    # errors are raised on update, without VTK reporting the failed
+    # execution in the shared error output
+    bad = dataset.pipeline().threshold(scalars='not an array')
+    warnings = vtk.vtkObject.GetGlobalWarningDisplay()
+    vtk.vtkObject.GlobalWarningDisplayOff()
+    try:
+        with pytest.raises(AssertionError):
+            bad.update()
+    finally:
+        vtk.vtkObject.SetGlobalWarningDisplay(warnings)
+    with pytest.raises(AttributeError):
+        dataset.pipeline().not_a_filter()
+    with pytest.raises(ValueError):
+        dataset.pipeline().texture_map_to_plane(inplace=True)
+    textured = dataset.pipeline().texture_map_to_plane(name='tex').update()
+    assert textured.GetPointData().GetTCoords() is not None
+
+
+def test_compute_cell_quality():
+    hexbeam = examples.load_hexbeam()
+    qual = hexbeam.compute_cell_quality(['scaled_jacobian', 'volume'])
+    assert qual.active_scalar_name == 'scaled_jacobian'
+    assert np.allclose(qual.cell_arrays['scaled_jacobian'], 1)
+    assert np.allclose(qual.cell_arrays['volume'].sum(), hexbeam.volume)
+    assert 'volume' not in hexbeam.cell_arrays
+
+    # other datasets are cast to an unstructured grid once for all metrics
+    uniform = examples.load_uniform()
+    qual = uniform.compute_cell_quality(['scaled_jacobian', 'volume', 'skew'])
+    assert isinstance(qual, pyvista.UniformGrid)
+    assert np.allclose(qual.cell_arrays['volume'], np.prod(uniform.spacing))
+    assert np.allclose(qual.cell_arrays['skew'], 0)
+
+
+def test_cell_locator_does_not_keep_dataset_alive():
+    deleted = []
+    mesh = pyvista.Sphere()
+    mesh.AddObserver('DeleteEvent', lambda obj, event: deleted.append(True))
+    mesh.probe(np.zeros((1, 3)), scalars='Normals')
+    del mesh
+    gc.collect()
+    assert deleted
+
+
+def test_point_locator_does_not_keep_source_alive():
+    deleted = []
+    cloud = pyvista.PolyData(np.random.random((100, 3)))
+    cloud['values'] = np.arange(100.0)
+    cloud.AddObserver('DeleteEvent', lambda obj, event: deleted.append(True))
+    pyvista.Plane().interpolate(cloud)
+    del cloud
+    gc.collect()
+    assert deleted
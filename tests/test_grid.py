@@ -141,6 +141,120 @@ def test_linear_copy():
     assert np.all(lgrid.celltypes < 20)
 
 
+def test_linear_copy_quadratic():
+    # a quadratic tetra and a quadratic quad sharing mid-side points
+    points = np.random.random((14, 3))
+    cells = {vtk.VTK_QUADRATIC_TETRA: np.arange(10)[np.newaxis],
+             vtk.VTK_QUADRATIC_QUAD: np.array([[0, 1, 10, 11, 4, 12, 13, 7]])}
+    grid = pyvista.UnstructuredGrid.from_cells_dict(points, cells)
+    grid.point_arrays['pid'] = np.arange(grid.n_points)
+    grid.cell_arrays['cid'] = np.arange(grid.n_cells)
+
+    lgrid = grid.linear_copy()
+    assert lgrid.n_points == grid.n_points
+    tetra = grid.celltypes == vtk.VTK_QUADRATIC_TETRA
+    assert np.all(lgrid.celltypes[tetra] == vtk.VTK_TETRA)
+    assert np.all(lgrid.celltypes[~tetra] == vtk.VTK_QUAD)
+    assert np.array_equal(lgrid.cells_dict[vtk.VTK_TETRA], [[0, 1, 2, 3]])
+    assert np.array_equal(lgrid.cells_dict[vtk.VTK_QUAD], [[0, 1, 10, 11]])
+    assert np.array_equal(lgrid.cell_arrays['cid'], [0, 1])
+    # the input is untouched
+    assert grid.cells_dict[vtk.VTK_QUADRATIC_TETRA].shape == (1, 10)
+
+    lgrid = grid.linear_copy(compact_points=True)
+    assert lgrid.n_points == 6
+    assert np.array_equal(lgrid.point_arrays['pid'], [0, 1, 2, 3, 10, 11])
+    assert np.allclose(lgrid.points, points[[0, 1, 2, 3, 10, 11]])
+    assert np.array_equal(lgrid.cells_dict[vtk.VTK_QUAD], [[0, 1, 4, 5]])
+
+
+def test_quality():
+    assert np.allclose(beam.quality, 1)
+    # the meshgrid of sgrid is indexed 'xy', which inverts its cells
+    assert np.allclose(sgrid.quality, -1)
+
+
+def test_cell_quality():
+    # a unit cube split in a tetra, a pyramid and a wedge
+    points = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0],
+                       [0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 1, 1]], float)
+    cells = {vtk.VTK_HEXAHEDRON: [[0, 1, 2, 3, 4, 5, 6, 7]],
+             vtk.VTK_TETRA: [[0, 1, 3, 4]],
+             vtk.VTK_WEDGE: [[0, 1, 3, 4, 5, 7]],
+             vtk.VTK_PYRAMID: [[0, 1, 2, 3, 6]],
+             vtk.VTK_QUAD: [[0, 1, 2, 3]],
+             vtk.VTK_VERTEX: [[0]]}
+    grid = pyvista.UnstructuredGrid.from_cells_dict(points, cells)
+    # index of each cell type, whatever the order of the cells
+    order = [vtk.VTK_HEXAHEDRON, vtk.VTK_TETRA, vtk.VTK_WEDGE,
+             vtk.VTK_PYRAMID, vtk.VTK_QUAD]
+    ind = [list(grid.celltypes).index(cell_type) for cell_type in order]
+    vertex = list(grid.celltypes).index(vtk.VTK_VERTEX)
+    volume = pyvista.cell_quality(grid, 'volume')
+    assert np.allclose(volume[ind], [1.0, 1.0/6, 1.0/2, 1.0/3, 1.0])
+    assert np.isnan(volume[vertex])
+    assert np.allclose(pyvista.cell_quality(grid, 'aspect_ratio')[ind],
+                       [1.0, np.sqrt(2), np.sqrt(2), np.sqrt(3), 1.0])
+    assert np.allclose(pyvista.cell_quality(grid, 'skew')[[ind[0], ind[4]]], 0)
+
+    # matches vtkMeshQuality
+    alg = vtk.vtkMeshQuality()
+    alg.SetInputData(grid)
+    alg.SetTetQualityMeasureToScaledJacobian()
+    alg.SetHexQualityMeasureToScaledJacobian()
+    alg.SetQuadQualityMeasureToScaledJacobian()
+    alg.Update()
+    expected = pyvista.wrap(alg.GetOutput()).cell_arrays['Quality']
+    scaled_jacobian = pyvista.cell_quality(grid, chunk_size=1)
+    checked = [ind[0], ind[1], ind[4]]
+    assert np.allclose(scaled_jacobian[checked], expected[checked])
+
+    # inverted cells are negative
+    grid = pyvista.UnstructuredGrid.from_cells_dict(points, {vtk.VTK_TETRA: [[0, 3, 1, 4]]})
+    assert pyvista.cell_quality(grid)[0] < 0
+    assert pyvista.cell_quality(grid, 'volume')[0] < 0
+
+    summary = pyvista.quality_summary(volume)
+    assert summary['n_cells'] == 5
+    assert summary['max'] == 1
+    with pytest.raises(ValueError):
+        pyvista.cell_quality(grid, 'not a metric')
+
+
+@pytest.mark.parametrize('cell_type,corners', [
+    (vtk.VTK_TRIANGLE, [[0, 0, 0], [1, 0, 0], [0.5, np.sqrt(3)/2, 0]]),
+    (vtk.VTK_QUAD, [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]]),
+    (vtk.VTK_TETRA, [[0, 0, 0], [1, 0, 0], [0.5, np.sqrt(3)/2, 0],
+                     [0.5, np.sqrt(3)/6, np.sqrt(2.0/3)]]),
+    (vtk.VTK_PYRAMID, [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0],
+                       [0.5, 0.5, 1]]),
+    (vtk.VTK_WEDGE, [[0, 0, 0], [1, 0, 0], [0.5, np.sqrt(3)/2, 0],
+                     [0, 0, 1], [1, 0, 1], [0.5, np.sqrt(3)/2, 1]]),
+    (vtk.VTK_HEXAHEDRON, [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0],
+                          [0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 1, 1]]),
+])
+def test_cell_quality_matches_vtk(cell_type, corners):
+    # randomly perturbed cells, including strongly distorted and inverted ones
+    rng = np.random.RandomState(0)
+    corners = np.array(corners, float)
+    scale = np.repeat([0.0, 0.1, 0.3, 1.0], 50)
+    points = corners + rng.uniform(-1, 1, (scale.size,) + corners.shape)*scale[:, np.newaxis, np.newaxis]
+    cells = np.arange(points.shape[0]*points.shape[1]).reshape(points.shape[:2])
+    grid = pyvista.UnstructuredGrid.from_cells_dict(points.reshape(-1, 3),
+                                                    {cell_type: cells})
+    alg = vtk.vtkMeshQuality()
+    alg.SetInputData(grid)
+    alg.SetTriangleQualityMeasureToScaledJacobian()
+    alg.SetQuadQualityMeasureToScaledJacobian()
+    alg.SetTetQualityMeasureToScaledJacobian()
+    alg.SetPyramidQualityMeasureToScaledJacobian()
+    alg.SetWedgeQualityMeasureToScaledJacobian()
+    alg.SetHexQualityMeasureToScaledJacobian()
+    alg.Update()
+    expected = pyvista.wrap(alg.GetOutput()).cell_arrays['Quality']
+    assert np.allclose(pyvista.cell_quality(grid), expected)
+
+
 def test_extract_cells():
     ind = [1, 2, 3]
     part_beam = beam.extract_cells(ind)
@@ -154,6 +268,129 @@ def test_extract_cells():
     assert part_beam.n_points < beam.n_points
 
 
+def test_extract_cells_index_maps():
+    grid = beam.copy()
+    grid.points = grid.points.astype(np.float64) + 1e-9
+    grid.point_arrays['pid'] = np.arange(grid.n_points)
+    grid.cell_arrays['cid'] = np.arange(grid.n_cells, dtype=np.int16)
+    grid.set_active_scalar('cid', preference='cell')
+    # cells are extracted once and in order, like vtkExtractCells
+    ind = [5, 1, 3, 3]
+    part, point_ids, cell_ids = grid.extract_cells(ind, return_index_maps=True)
+    assert part.n_cells == 3
+    ind = [1, 3, 5]
+    assert part.points.dtype == np.float64
+    assert np.array_equal(part.points, grid.points[point_ids])
+    assert np.array_equal(cell_ids, ind)
+    assert np.array_equal(part.point_arrays['pid'], point_ids)
+    assert part.cell_arrays['cid'].dtype == np.int16
+    assert np.array_equal(part.cell_arrays['cid'], ind)
+    assert part.active_scalar_name == 'cid'
+    # the connectivity refers to the same points as the original cells
+    for i, cell_id in enumerate(ind):
+        original = grid.points[grid.extract_cells([cell_id]).point_arrays['pid']]
+        assert np.array_equal(part.extract_cells([i]).points, original)
+
+    # arrays that numpy cannot view are gathered by VTK
+    names = vtk.vtkStringArray()
+    names.SetName('names')
+    bits = vtk.vtkBitArray()
+    bits.SetName('bits')
+    for i in range(grid.n_cells):
+        names.InsertNextValue('cell %d' % i)
+        bits.InsertNextValue(i % 2)
+    grid.GetCellData().AddArray(names)
+    grid.GetCellData().AddArray(bits)
+    part = grid.extract_cells(ind)
+    gathered = part.GetCellData().GetAbstractArray('names')
+    assert [gathered.GetValue(i) for i in range(3)] == ['cell 1', 'cell 3', 'cell 5']
+    gathered = part.GetCellData().GetAbstractArray('bits')
+    assert [gathered.GetValue(i) for i in range(3)] == [1, 1, 1]
+
+    empty = grid.extract_cells([])
+    assert empty.n_cells == 0
+    assert empty.n_points == 0
+    assert 'cid' in empty.cell_arrays
+
+
+def test_extract_cells_mixed():
+    cells = np.array([3, 0, 1, 2, 4, 1, 2, 3, 4, 4, 2, 3, 4, 5])
+    offset = np.array([0, 4, 9])
+    celltypes = np.array([vtk.VTK_TRIANGLE, vtk.VTK_QUAD, vtk.VTK_TETRA],
+                         np.uint8)
+    points = np.random.random((6, 3))
+    grid = pyvista.UnstructuredGrid(offset, cells, celltypes, points)
+    part = grid.extract_cells([2, 0, 2])
+    assert np.array_equal(part.celltypes, celltypes[[0, 2]])
+    assert np.allclose(part.points, points[[0, 1, 2, 3, 4, 5]])
+    assert np.array_equal(part.cells, [3, 0, 1, 2, 4, 2, 3, 4, 5])
+
+    part = grid.extract_selection_points([5])
+    assert part.n_cells == 1
+    assert part.celltypes[0] == vtk.VTK_TETRA
+
+
+def test_extract_cells_polyhedron():
+    # a tetra and a polyhedral unit cube
+    points = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [0, 0, 1],
+                       [1, 0, 1], [1, 1, 1], [0, 1, 1], [2, 0, 0]], float)
+    faces = [[0, 3, 2, 1], [4, 5, 6, 7], [0, 1, 5, 4],
+             [1, 2, 6, 5], [2, 3, 7, 6], [3, 0, 4, 7]]
+    grid = pyvista.UnstructuredGrid.from_cells_dict(points, {vtk.VTK_TETRA: [[1, 2, 5, 8]]})
+    stream = vtk.vtkIdList()
+    for value in [len(faces)] + [v for face in faces for v in [len(face)] + face]:
+        stream.InsertNextId(value)
+    grid.InsertNextCell(vtk.VTK_POLYHEDRON, stream)
+    grid.point_arrays['pid'] = np.arange(grid.n_points)
+    grid.cell_arrays['cid'] = np.arange(grid.n_cells)
+
+    part, point_ids, cell_ids = grid.extract_cells([1, 1], return_index_maps=True)
+    assert part.n_cells == 1
+    assert part.celltypes[0] == vtk.VTK_POLYHEDRON
+    assert np.isclose(part.volume, 1)
+    assert np.array_equal(point_ids, np.arange(8))
+    assert np.array_equal(part.point_arrays['pid'], point_ids)
+    assert np.array_equal(cell_ids, [1])
+    assert np.array_equal(part.cell_arrays['cid'], [1])
+
+    part = grid.extract_selection_points([6])
+    assert part.n_cells == 1
+    assert np.isclose(part.volume, 1)
+    assert np.isclose(grid.extract_cells([0, 1]).volume, grid.volume)
+
+
+def test_cells_dict():
+    cells_dict = beam.cells_dict
+    assert list(cells_dict) == [vtk.VTK_HEXAHEDRON]
+    hexes = cells_dict[vtk.VTK_HEXAHEDRON]
+    assert hexes.shape == (beam.n_cells, 8)
+    assert np.array_equal(hexes.ravel(), beam.cells.reshape(-1, 9)[:, 1:].ravel())
+    with pytest.raises(ValueError):
+        hexes[0, 0] = 1
+
+    points = np.random.random((6, 3))
+    cells = {vtk.VTK_TETRA: np.array([[0, 1, 2, 3], [1, 2, 3, 4]]),
+             vtk.VTK_TRIANGLE: np.array([[3, 4, 5]])}
+    grid = pyvista.UnstructuredGrid.from_cells_dict(points, cells)
+    assert grid.n_cells == 3
+    # cells are numbered by cell type
+    assert np.array_equal(grid.celltypes, [vtk.VTK_TRIANGLE, vtk.VTK_TETRA,
+                                           vtk.VTK_TETRA])
+    assert np.array_equal(pyvista.cell_locations(grid), [0, 4, 9])
+    for cell_type, ids in cells.items():
+        assert np.array_equal(grid.cells_dict[cell_type], ids)
+
+    # the cached connectivity follows changes of the cells
+    cells[vtk.VTK_TETRA] = cells[vtk.VTK_TETRA][:, ::-1]
+    grid.ShallowCopy(pyvista.UnstructuredGrid.from_cells_dict(points, cells))
+    assert np.array_equal(grid.cells_dict[vtk.VTK_TETRA][0], [3, 2, 1, 0])
+
+    with pytest.raises(ValueError):
+        pyvista.UnstructuredGrid.from_cells_dict(points, {vtk.VTK_TETRA: [0, 1, 2, 3]})
+    with pytest.raises(ValueError):
+        pyvista.UnstructuredGrid.from_cells_dict(points, {vtk.VTK_TETRA: [[0, 1, 2, 6]]})
+
+
 def test_merge():
     grid = beam.copy()
     grid.points[:, 0] += 1
@@ -392,6 +629,48 @@ def test_grid_points():
     assert np.allclose(np.unique(grid.points, axis=0), np.unique(points, axis=0))
 
 
+def test_grid_points_structured():
+    grid = pyvista.UniformGrid((4, 5, 6), (0.5, 1.0, 2.0), (1.0, 2.0, 3.0))
+    for points in [grid.points, grid.cast_to_structured_grid().points]:
+        uniform = pyvista.UniformGrid()
+        uniform.points = points
+        assert uniform.dimensions == [4, 5, 6]
+        assert np.allclose(uniform.spacing, [0.5, 1.0, 2.0])
+        assert np.allclose(uniform.origin, [1.0, 2.0, 3.0])
+        rectilinear = pyvista.RectilinearGrid()
+        rectilinear.points = points
+        assert rectilinear.dimensions == [4, 5, 6]
+        assert np.allclose(rectilinear.bounds, grid.bounds)
+
+    # not uniformly spaced
+    x = np.array([0.0, 1.0, 3.0])
+    points = np.c_[x, np.zeros(3), np.zeros(3)]
+    with pytest.raises(ValueError):
+        pyvista.UniformGrid().points = points
+    # not on a lattice
+    with pytest.raises(ValueError):
+        pyvista.RectilinearGrid().points = np.random.random((10, 3))
+    # every point is checked, not only a sample
+    grid = pyvista.UniformGrid((40, 30, 20))
+    points = grid.points.copy()
+    points[12345, 0] += 0.5
+    with pytest.raises(ValueError):
+        pyvista.RectilinearGrid().points = points
+    x = np.meshgrid(np.arange(4.0), np.arange(3.0), np.arange(2.0))[0]
+    x[2, 1, 1] += 0.5
+    grid = pyvista.RectilinearGrid(x, *np.meshgrid(np.arange(4.0), np.arange(3.0),
+                                                   np.arange(2.0))[1:])
+    assert grid.dimensions[0] == 5
+
+    # axis vectors are read from meshgrid arrays
+    x = np.cumsum(np.random.random(8))
+    y = np.arange(5.0)
+    z = np.arange(3.0)
+    grid = pyvista.RectilinearGrid(*np.meshgrid(x, y, z))
+    assert grid.dimensions == [8, 5, 3]
+    assert np.allclose(grid.bounds[:2], [x[0], x[-1]])
+
+
 def test_grid_extract_selection_points():
     grid = pyvista.UnstructuredGrid(sgrid)
     sub_grid = grid.extract_selection_points([0])
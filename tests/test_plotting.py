@@ -6,6 +6,7 @@ from weakref import proxy
 import imageio
 import numpy as np
 import pytest
+import vtk
 
 import pyvista
 from pyvista import examples
@@ -227,6 +228,11 @@ def test_make_movie():
         scalars = np.random.random(movie_sphere.n_faces)
         plotter.update_scalars(scalars)
 
+    # wait for the encoder to write the queued frames
+    plotter._frame_writer.flush()
+    assert plotter.frame_stats['n_frames'] == 10
+    assert plotter.frame_stats['queued'] == 0
+
     # checking if plotter closes
     ref = proxy(plotter)
     plotter.close()
@@ -240,6 +246,133 @@ def test_make_movie():
         raise Exception('Plotter did not close')
 
 
+def test_frame_writer():
+    from pyvista.plotting.movie import FrameWriter
+
+    class ListWriter(object):
+        def __init__(self):
+            self.frames = []
+            self.closed = False
+
+        def append_data(self, frame):
+            self.frames.append(frame.copy())
+
+        def close(self):
+            self.closed = True
+
+    writer = ListWriter()
+    frame_writer = FrameWriter(writer, queue_size=2)
+    image = np.arange(4*5*3, dtype=np.uint8).reshape(4, 5, 3)
+    for i in range(10):
+        frame_writer.write((image + i)[::-1])
+    frame_writer.flush()
+    assert frame_writer.stats['n_frames'] == 10
+    assert frame_writer.stats['queued'] == 0
+
+    # frames of a new size reallocate the buffers
+    frame_writer.write(np.zeros((2, 3, 4), np.uint8))
+    frame_writer.close()
+    assert writer.closed
+    assert len(writer.frames) == 11
+    assert np.array_equal(writer.frames[3], (image + 3)[::-1])
+    assert writer.frames[-1].shape == (2, 3, 4)
+
+    with pytest.raises(RuntimeError):
+        frame_writer.write(image)
+
+
+@pytest.mark.skipif(NO_PLOTTING, reason="Requires system to support plotting")
+def test_update_scalars_in_place():
+    mesh = sphere.copy()
+    plotter = pyvista.Plotter(off_screen=OFF_SCREEN)
+    plotter.add_mesh(mesh, scalars=np.arange(mesh.n_points), name='sphere')
+    points_mtime = mesh.GetPoints().GetMTime()
+    plotter.update_scalars(-np.ones(10), mesh='sphere', index=slice(0, 10),
+                           update_range=True, render=False)
+    assert np.all(mesh.active_scalar[:10] == -1)
+    assert mesh.active_scalar[10] == 10
+    assert plotter.mapper.GetScalarRange()[0] == -1
+    assert mesh.GetPoints().GetMTime() == points_mtime
+
+    points = mesh.points.copy()
+    plotter.update_coordinates(np.zeros((5, 3)), index=[0, 2, 4, 6, 8],
+                               render=False)
+    assert np.all(mesh.points[[0, 2, 4, 6, 8]] == 0)
+    assert np.allclose(mesh.points[1], points[1])
+
+    with pytest.raises(KeyError):
+        plotter.update_scalars(np.ones(mesh.n_points), mesh='not a name')
+
+    # named arrays are found in the cell data as well
+    mesh.cell_arrays['c'] = np.zeros(mesh.n_cells)
+    plotter.update_scalars(np.ones(mesh.n_cells), mesh='sphere', name='c',
+                           render=False)
+    assert np.all(mesh.cell_arrays['c'] == 1)
+    with pytest.raises(KeyError):
+        plotter.update_scalars(np.ones(mesh.n_cells), mesh='sphere',
+                               name='not an array', render=False)
+
+    # the mapper of a plotted dataset is found to update its range
+    plotter.update_scalars(np.full(mesh.n_points, 5.0), mesh=mesh,
+                           update_range=True, render=False)
+    assert plotter.mapper.GetScalarRange() == (5.0, 5.0)
+    plotter.close()
+
+
+def test_color_cache():
+    from pyvista.plotting.color_cache import ColorCache
+
+    lut = vtk.vtkLookupTable()
+    lut.SetRange(0, 1)
+    lut.Build()
+    cache = ColorCache(max_items=2)
+    arrays = [pyvista.convert_array(np.random.random(10)) for _ in range(3)]
+    colors = cache.get('a', arrays[0], lut)
+    assert colors.GetNumberOfComponents() == 4
+    assert cache.get('a', arrays[0], lut) is colors
+    cache.get('b', arrays[1], lut)
+    cache.get('c', arrays[2], lut)
+    assert len(cache) == 2
+    assert 'a' not in cache
+    assert cache.nbytes > 0
+
+    # modified arrays are mapped again
+    arrays[2].Modified()
+    colors = cache.get('c', arrays[2], lut)
+    assert cache.get('c', arrays[2], lut) is colors
+    cache.clear()
+    assert len(cache) == 0
+
+
+@pytest.mark.skipif(NO_PLOTTING, reason="Requires system to support plotting")
+def test_switch_scalars():
+    mesh = sphere.copy()
+    mesh.point_arrays['a'] = np.arange(mesh.n_points)
+    mesh.cell_arrays['b'] = np.random.random(mesh.n_cells)
+    plotter = pyvista.Plotter(off_screen=OFF_SCREEN)
+    actor = plotter.add_mesh(mesh, scalars='a', cache_colors=True)
+    # the colors are shown from a copy, not added to the mesh
+    assert '__rgba' not in mesh.point_arrays
+    display = actor.GetMapper().GetInputAsDataSet()
+    assert display is not mesh
+    plotter.switch_scalars('b', mesh=actor, render=False)
+    colors = display.GetCellData().GetArray('__rgba')
+    assert colors is not None
+    assert display.GetPointData().GetArray('__rgba') is None
+    plotter.switch_scalars('a', mesh=actor, render=False)
+    plotter.switch_scalars('b', mesh=actor, render=False)
+    assert display.GetCellData().GetArray('__rgba') is colors
+    assert '__rgba' not in mesh.cell_arrays
+    with pytest.raises(KeyError):
+        plotter.switch_scalars('not an array', mesh=actor)
+
+    # updating the shown array maps its colors again
+    plotter.update_scalars(np.zeros(mesh.n_cells), mesh=actor, name='b',
+                           preference='cell', render=False)
+    assert display.GetCellData().GetArray('__rgba') is not colors
+    plotter.close()
+
+
 @pytest.mark.skipif(NO_PLOTTING, reason="Requires system to support plotting")
 def test_add_legend():
     plotter = pyvista.Plotter(off_screen=OFF_SCREEN)
@@ -379,6 +512,25 @@ def test_screenshot():
         raise Exception('Plotter did not close')
 
 
+@pytest.mark.skipif(NO_PLOTTING, reason="Requires system to support plotting")
+def test_image_capture():
+    plotter = pyvista.Plotter(off_screen=True)
+    plotter.add_mesh(pyvista.Sphere())
+    plotter.show(auto_close=False, window_size=[300, 200])
+    capture = plotter.image_capture
+    rgb = np.empty((200, 300, 3), np.uint8)
+    depth = np.empty((200, 300), np.float32)
+    assert capture.rgb(out=rgb) is rgb
+    assert capture.depth(out=depth) is depth
+    assert np.array_equal(rgb, plotter.image)
+    assert np.array_equal(depth, plotter.image_depth[:, :, 0])
+    assert np.array_equal(capture.rgb(flip=False), rgb[::-1])
+    assert capture.rgba(step=2).shape == (100, 150, 4)
+    with pytest.raises(ValueError):
+        capture.rgb(out=np.empty((10, 10, 3), np.uint8))
+    plotter.close()
+
+
 def test_invalid_color():
     with pytest.raises(Exception):
         femorph.plotting.parse_color('not a color')
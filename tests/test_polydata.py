@@ -136,6 +136,10 @@ def test_geodesic():
     sphere = SPHERE.copy()
     geodesic = sphere.geodesic(0, sphere.n_points - 1)
     assert isinstance(geodesic, pyvista.PolyData)
+    with pytest.raises(ValueError, match='end_vertex'):
+        sphere.geodesic(0)
+    with pytest.raises(IndexError):
+        sphere.geodesic(sphere.n_points, 0)
 
 
 def test_geodesic_distance():
@@ -144,6 +148,58 @@ def test_geodesic_distance():
     assert isinstance(distance, float)
 
 
+def test_geodesic_batch():
+    pytest.importorskip('scipy')
+    sphere = SPHERE.copy()
+    pairs = [[0, sphere.n_points - 1], [0, 10], [5, 20]]
+    distances = sphere.geodesic_distances(pairs)
+    for (start, end), distance in zip(pairs, distances):
+        path = sphere.geodesic(start, end)
+        length = path.compute_cell_sizes()['Length'].sum()
+        assert np.isclose(distance, length)
+
+    paths = sphere.geodesic(pairs)
+    assert paths.n_cells == len(pairs)
+    with pytest.raises(ValueError, match=r'\(n, 2\)'):
+        sphere.geodesic([0, 1, 2])
+    with pytest.raises(ValueError, match=r'\(n, 2\)'):
+        sphere.geodesic_distances([0, 1])
+    assert np.allclose(paths.compute_cell_sizes()['Length'], distances)
+
+    # the graph is cached until the points change
+    assert sphere.edge_graph is sphere.edge_graph
+    graph = sphere.edge_graph
+    sphere.points *= 2
+    assert sphere.edge_graph is not graph
+
+    # unreachable pairs keep an empty line
+    two_lines = pyvista.PolyData(np.array([[0, 0, 0], [1, 0, 0],
+                                           [0, 1, 0], [1, 1, 0]], float))
+    two_lines.lines = np.array([2, 0, 1, 2, 2, 3])
+    far = 3
+    paths = two_lines.geodesic(np.array([[0, far], [0, 1], [far, 0]]))
+    assert paths.n_cells == 3
+    sizes = paths.compute_cell_sizes()['Length']
+    assert sizes[0] == 0 and sizes[2] == 0 and sizes[1] > 0
+    paths = two_lines.geodesic(np.array([[0, far]]))
+    assert paths.n_cells == 1
+    assert paths.n_points == 0
+    assert pyvista.PolyData().edge_graph.shape == (0, 0)
+
+
+def test_geodesic_distance_field():
+    pytest.importorskip('scipy')
+    sphere = SPHERE.copy()
+    field = sphere.geodesic_distance_field([0, 10])
+    assert field.shape == (sphere.n_points,)
+    assert field[0] == 0 and field[10] == 0
+    distance = sphere.geodesic_distance(0, 30)
+    assert field[30] <= distance
+    assert np.isclose(field[30], min(distance, sphere.geodesic_distance(10, 30)))
+    with pytest.raises(IndexError):
+        sphere.geodesic_distance_field(sphere.n_points)
+
+
 def test_ray_trace():
     sphere = SPHERE.copy()
     points, ind = sphere.ray_trace([0, 0, 0], [1, 1, 1])
@@ -402,6 +458,35 @@ def test_volume():
     assert np.isclose(dense_sphere.volume, ideal_volume, rtol=1E-3)
 
 
+def test_derived_cache():
+    sphere = pyvista.Sphere()
+    volume = sphere.volume
+    normals = sphere.point_normals
+    assert 'volume' in sphere.derived_cache
+    assert 'point_normals' in sphere.derived_cache
+    assert sphere.derived_cache.nbytes >= normals.nbytes
+    # cached arrays cannot be altered through the returned copies
+    normals[:] = 0
+    assert np.allclose(np.linalg.norm(sphere.point_normals, axis=1), 1)
+    assert sphere.curvature('gaussian').shape == (sphere.n_points, )
+
+    # arrays do not invalidate the geometry
+    sphere.point_arrays['data'] = np.arange(sphere.n_points)
+    assert 'volume' in sphere.derived_cache
+    sphere.volume
+    assert 'volume' in sphere.derived_cache
+
+    # modifying the points does
+    sphere.points *= 2
+    assert np.isclose(sphere.volume, volume*8)
+    assert sphere.derived_cache.keys() == ['volume']
+    sphere.transform(np.diag([0.5, 0.5, 0.5, 1]), lazy=True)
+    assert np.isclose(sphere.volume, volume)
+
+    sphere.derived_cache.clear()
+    assert len(sphere.derived_cache) == 0
+
+
 @pytest.mark.skipif(not system_supports_plotting(), reason="Requires system to support plotting")
 def test_plot_boundaries():
     # make sure to plot an object that has boundaries
@@ -434,9 +519,31 @@ def test_remove_points_all():
 
 
 def test_remove_points_fail():
+    with pytest.raises(AssertionError):
+        SPHERE.remove_points(np.zeros(10, np.bool))
+    with pytest.raises(ValueError):
+        SPHERE.remove_points([0], mode='none')
+
+
+def test_remove_points_mixed():
     arrow = pyvista.Arrow([0, 0, 0], [1, 0, 0])
-    with pytest.raises(Exception):
-        arrow.remove_points(range(10))
+    arrow.cell_arrays['cid'] = np.arange(arrow.n_cells)
+    arrow.point_arrays['pid'] = np.arange(arrow.n_points)
+    mesh, ridx, cell_ids = arrow.remove_points(range(10), return_cell_map=True)
+    assert mesh.n_points == arrow.n_points - 10
+    assert np.array_equal(mesh.point_arrays['pid'], ridx)
+    assert np.array_equal(mesh.cell_arrays['cid'], cell_ids)
+    assert np.allclose(mesh.points, arrow.points[ridx])
+    # the cells refer to the same points as before
+    assert np.allclose(mesh.extract_cells([0]).points,
+                       arrow.extract_cells([cell_ids[0]]).points)
+
+    line = pyvista.Line(resolution=4)
+    line.lines = np.array([2, 0, 1, 2, 1, 2, 2, 2, 3, 2, 3, 4])
+    mesh, ridx = line.remove_points([2])
+    assert mesh.n_cells == 2
+    assert np.array_equal(mesh.lines, [2, 0, 1, 2, 2, 3])
+    assert np.array_equal(ridx, [0, 1, 3, 4])
 
 
 def test_vertice_cells_on_read(tmpdir):
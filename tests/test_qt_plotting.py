@@ -152,3 +152,40 @@ def test_background_plotting_orbit(qtbot):
     # perfrom the orbit:
     plotter.orbit_on_path(bkg=False, step=0.0)
     plotter.close()
+
+
+@pytest.mark.skipif(NO_PLOTTING, reason="Requires system to support plotting")
+@pytest.mark.skipif(not has_pyqt5, reason="requires pyqt5")
+def test_background_plotting_render_scheduler(qtbot):
+    plotter = pyvista.BackgroundPlotter(show=False, max_fps=20)
+    sphere = pyvista.Sphere()
+    plotter.add_mesh(sphere)
+    qtbot.waitUntil(lambda: not plotter._dirty, timeout=1000)
+
+    # modifying the plotted data marks the plotter dirty until rendered
+    sphere.points[:] = sphere.points*2
+    assert plotter._dirty
+    qtbot.waitUntil(lambda: not plotter._dirty, timeout=1000)
+    plotter.close()
+
+
+@pytest.mark.skipif(NO_PLOTTING, reason="Requires system to support plotting")
+@pytest.mark.skipif(not has_pyqt5, reason="requires pyqt5")
+def test_background_plotting_remove_actor_observers(qtbot):
+    plotter = pyvista.BackgroundPlotter(show=False)
+    sphere = pyvista.Sphere()
+    actor = plotter.add_mesh(sphere)
+    assert id(actor) in plotter._observers
+    qtbot.waitUntil(lambda: not plotter._dirty, timeout=1000)
+
+    # removed meshes neither schedule renders nor are kept alive
+    plotter.remove_actor(actor)
+    assert id(actor) not in plotter._observers
+    qtbot.waitUntil(lambda: not plotter._dirty, timeout=1000)
+    sphere.Modified()
+    assert not plotter._dirty
+
+    actor = plotter.add_mesh(sphere)
+    plotter.clear()
+    assert id(actor) not in plotter._observers
+    plotter.close()
@@ -3,6 +3,7 @@ import os
 
 import numpy as np
 import pytest
+import vtk
 
 import pyvista
 from pyvista import examples as ex
@@ -99,5 +100,100 @@ def test_get_sg_image_scraper():
 
 
 def test_voxelize():
-    # mesh = examples.load_airplane()
-    pass
+    mesh = pyvista.Sphere(theta_resolution=30, phi_resolution=30)
+    grid = pyvista.voxelize(mesh, density=0.1)
+    assert isinstance(grid, pyvista.UnstructuredGrid)
+    assert grid.n_cells
+    assert np.all(grid.celltypes == vtk.VTK_VOXEL)
+    assert np.all(np.abs(grid.bounds) < 0.6)
+
+
+def test_surface_containment():
+    inside = pyvista.SurfaceContainment(pyvista.Sphere(radius=1.0))
+    points = np.random.random((100, 3)) * 2 - 1
+    expected = np.linalg.norm(points, axis=1) < 0.95
+    mask = inside(points, chunk_size=7)
+    assert mask.dtype == np.bool_
+    assert np.all(mask[expected])
+    outside = inside.contains(points, inside_out=True)
+    assert np.array_equal(outside, ~inside(points))
+    assert not inside([[2.0, 0, 0]])[0]
+    with pytest.raises(ValueError):
+        inside(np.zeros((3, 2)))
+
+    # same classification as the VTK filter
+    alg = vtk.vtkSelectEnclosedPoints()
+    alg.SetInputData(pyvista.PolyData(points))
+    alg.SetSurfaceData(inside.surface)
+    alg.Update()
+    selected = pyvista.wrap(alg.GetOutput()).point_arrays['SelectedPoints']
+    # points close to the faceted sphere may be classified either way
+    far = np.abs(np.linalg.norm(points, axis=1) - 1) > 0.02
+    assert np.array_equal(inside(points)[far], selected[far] == 1)
+    with pytest.raises(ValueError):
+        pyvista.SurfaceContainment(pyvista.Plane())
+
+
+def test_cell_locations():
+    cells = np.array([3, 0, 1, 2, 4, 1, 2, 3, 4, 2, 5, 6])
+    locations = pyvista.padded_cell_locations(cells, 3)
+    assert np.array_equal(locations, [0, 4, 9])
+    assert np.array_equal(pyvista.padded_cell_locations(cells[:8], 2), [0, 4])
+
+    # many cells of mixed sizes
+    sizes = np.random.randint(1, 6, 10000)
+    expected = np.zeros(sizes.size, np.int64)
+    np.cumsum(sizes[:-1] + 1, out=expected[1:])
+    mixed = np.zeros(sizes.sum() + sizes.size, np.int64)
+    mixed[expected] = sizes
+    assert np.array_equal(pyvista.padded_cell_locations(mixed, sizes.size), expected)
+
+    new_cells, new_locations = pyvista.gather_cells(cells, locations, [2, 0])
+    assert np.array_equal(new_cells, [2, 5, 6, 3, 0, 1, 2])
+    assert np.array_equal(new_locations, [0, 3])
+    mask = pyvista.cell_id_mask(new_cells, new_locations)
+    assert np.array_equal(new_cells[mask], [5, 6, 0, 1, 2])
+
+    grid = ex.load_hexbeam()
+    locations = pyvista.cell_locations(grid)
+    assert np.all(grid.cells[locations] == 8)
+    sphere = pyvista.Sphere()
+    locations = pyvista.cell_array_locations(sphere.GetPolys())
+    assert np.all(sphere.faces[locations] == 3)
+
+
+def test_cell_point_ids():
+    grid = ex.load_uniform()
+    ids, offsets = pyvista.cell_point_ids(grid)
+    assert len(offsets) == grid.n_cells + 1
+    assert np.array_equal(np.diff(offsets), np.full(grid.n_cells, 8))
+    cell = grid.GetCell(5)
+    expected = [cell.GetPointId(i) for i in range(cell.GetNumberOfPoints())]
+    assert sorted(ids[offsets[5]:offsets[6]]) == sorted(expected)
+
+    sphere = pyvista.Sphere()
+    ids, offsets = pyvista.cell_point_ids(sphere)
+    assert np.array_equal(ids, sphere.faces.reshape(-1, 4)[:, 1:].ravel())
+    cell_min, cell_max = pyvista.reduce_point_values(sphere.points[:, 2], ids, offsets)
+    assert np.all(cell_min <= cell_max)
+
+
+def test_gather_cell_point_ids():
+    ids = np.array([0, 1, 2, 1, 2, 3, 4, 5, 6])
+    offsets = np.array([0, 3, 7, 9])
+    new_ids, new_offsets = pyvista.gather_cell_point_ids(ids, offsets, [2, 0])
+    assert np.array_equal(new_ids, [5, 6, 0, 1, 2])
+    assert np.array_equal(new_offsets, [0, 2, 5])
+
+    # cells of the same size
+    grid = ex.load_hexbeam()
+    ids, offsets = pyvista.cell_point_ids(grid)
+    new_ids, new_offsets = pyvista.gather_cell_point_ids(ids, offsets, [4, 1])
+    assert np.array_equal(new_ids, np.hstack([ids[32:40], ids[8:16]]))
+    assert np.array_equal(new_offsets, [0, 8, 16])
+
+    vtkcells = pyvista.cell_array(new_ids, new_offsets)
+    assert vtkcells.GetNumberOfCells() == 2
+    locations = pyvista.cell_array_locations(vtkcells)
+    assert np.array_equal(locations, [0, 9])
+    assert vtkcells.GetData().GetValue(9) == 8